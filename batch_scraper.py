@@ -11,7 +11,7 @@ import argparse
 import time
 from pathlib import Path
 
-from saijdata.scraper import scraper_completo
+from saijdata.scraper import crear_sesion, scraper_completo
 
 
 LEYES = [
@@ -80,6 +80,7 @@ def main() -> int:
     destino.mkdir(parents=True, exist_ok=True)
 
     errores: list[str] = []
+    session = crear_sesion()
     for idx, numero in enumerate(LEYES, start=1):
         if args.dry_run:
             print(f"[{idx}/{len(LEYES)}] DRY-RUN: ley {numero} -> {destino}")
@@ -87,7 +88,7 @@ def main() -> int:
 
         try:
             print(f"[{idx}/{len(LEYES)}] Descargando ley {numero}...")
-            scraper_completo(int(numero), directorio_destino=str(destino))
+            scraper_completo(int(numero), directorio_destino=str(destino), session=session)
         except Exception as exc:
             errores.append(f"{numero}: {exc}")
 
@@ -15,6 +15,20 @@ from typing import Dict, List, Optional, Set, Any, Tuple
 from dataclasses import dataclass
 
 
+# Sufijos latinos de los números de artículo ("14 bis", "245 ter", ...)
+_SUFIJOS = r"(?:bis|ter|quater|quinquies|sexies|septies|octies|nonies|decies)"
+_NUM_SUFIJO = rf"\d+(?:\s*{_SUFIJOS})?"
+
+_RE_INCORPORA = re.compile(
+    rf"incorp[óo]rase\s+como\s+art[íi]culo\s+({_NUM_SUFIJO})", re.IGNORECASE
+)
+_RE_ARTICULO_HEADER = re.compile(rf"art[íi]culo\s+({_NUM_SUFIJO})", re.IGNORECASE)
+_RE_ARTICULO_TEXTO = re.compile(rf"ART[ÍI]CULO\s+({_NUM_SUFIJO})\s*[°º]?-", re.IGNORECASE)
+_RE_TITULO_ARTICULO = re.compile(
+    rf"ART[ÍI]CULO\s+{_NUM_SUFIJO}\s*[°º]?-\s*(.+?)(?:\n|$)", re.IGNORECASE
+)
+
+
 @dataclass
 class MatchResult:
     """Resultado del procesamiento de un dictamen contra una ley."""
@@ -38,20 +52,12 @@ def extract_article_number_from_header(encabezado: str) -> Optional[str]:
         return None
     
     # Para incorporaciones, buscar "como artículo X" o "artículo X" después de incorpórase
-    incorporacion_match = re.search(
-        r"incorp[óo]rase\s+como\s+art[íi]culo\s+(\d+(?:\s*(?:bis|ter|quater|quinquies|sexies|septies|octies|nonies|decies))?)",
-        encabezado,
-        re.IGNORECASE
-    )
+    incorporacion_match = _RE_INCORPORA.search(encabezado)
     if incorporacion_match:
         return incorporacion_match.group(1).strip()
     
     # Fallback: buscar cualquier "artículo X" con sufijos
-    match = re.search(
-        r"art[íi]culo\s+(\d+(?:\s*(?:bis|ter|quater|quinquies|sexies|septies|octies|nonies|decies))?)",
-        encabezado,
-        re.IGNORECASE
-    )
+    match = _RE_ARTICULO_HEADER.search(encabezado)
     if match:
         return match.group(1).strip()
     
@@ -79,11 +85,7 @@ def get_destino_articulo(cambio: Dict[str, Any]) -> Optional[str]:
     
     # Prioridad 2: extraer desde texto_nuevo (más confiable)
     if cambio.get("texto_nuevo"):
-        match = re.search(
-            r"ART[ÍI]CULO\s+(\d+(?:\s*(?:bis|ter|quater|quinquies|sexies|septies|octies|nonies|decies))?)\s*[°º]?-",
-            cambio["texto_nuevo"],
-            re.IGNORECASE
-        )
+        match = _RE_ARTICULO_TEXTO.search(cambio["texto_nuevo"])
         if match:
             return match.group(1).strip()
     
@@ -92,17 +94,78 @@ def get_destino_articulo(cambio: Dict[str, Any]) -> Optional[str]:
     return from_header if from_header else None
 
 
-def find_articles_in_chapter(ley_data: Dict[str, Any], capitulo_numero: str) -> List[str]:
+def _index_capitulos(ley_data: Dict[str, Any]) -> Dict[str, List[Tuple[Optional[str], int]]]:
+    """
+    Indexa los artículos de cada capítulo por número de capítulo en mayúsculas.
+    
+    Cada entrada es (número, posición en el capítulo); el número es None para los
+    artículos sin número ("", "S/N" o "null"). Como un número de capítulo se repite
+    entre títulos, cada clave reúne los artículos de todos ellos en orden.
+    
+    Args:
+        ley_data: Estructura JSON de la ley
+    
+    Returns:
+        Diccionario {número de capítulo: [(número, posición)]}
+    """
+    indice: Dict[str, List[Tuple[Optional[str], int]]] = {}
+    for titulo in ley_data.get("ley", {}).get("titulos", []):
+        for capitulo in titulo.get("capitulos") or []:
+            if capitulo.get("articulos"):
+                entradas = indice.setdefault(str(capitulo.get("numero", "")).upper(), [])
+                for i, articulo in enumerate(capitulo["articulos"]):
+                    numero = str(articulo.get("numero", "")).strip()
+                    if numero == "" or numero.upper() == "S/N" or numero == "null":
+                        entradas.append((None, i + 1))
+                    else:
+                        entradas.append((numero, i + 1))
+    return indice
+
+
+def _numeros_articulos(ley_data: Dict[str, Any]) -> Set[str]:
+    """
+    Números (como str) de todos los artículos de la ley, directos y de capítulos.
+    
+    Args:
+        ley_data: Estructura JSON de la ley
+    
+    Returns:
+        Conjunto de números de artículos
+    """
+    numeros: Set[str] = set()
+    for titulo in ley_data.get("ley", {}).get("titulos", []):
+        if titulo.get("articulos"):
+            numeros.update(str(art.get("numero")) for art in titulo["articulos"])
+        for capitulo in titulo.get("capitulos") or []:
+            if capitulo.get("articulos"):
+                numeros.update(str(art.get("numero")) for art in capitulo["articulos"])
+    return numeros
+
+
+def find_articles_in_chapter(
+    ley_data: Dict[str, Any],
+    capitulo_numero: str,
+    capitulos_index: Optional[Dict[str, List[Tuple[Optional[str], int]]]] = None
+) -> List[str]:
     """
     Encuentra todos los artículos en un capítulo específico.
     
     Args:
         ley_data: Estructura JSON de la ley
         capitulo_numero: Número del capítulo (ej: "VIII")
+        capitulos_index: Índice de capítulos (ver _index_capitulos); si se pasa,
+            la búsqueda es una consulta directa en lugar de recorrer la ley
     
     Returns:
         Lista de números de artículos en el capítulo
     """
+    if capitulos_index is not None:
+        # Los artículos sin número usan el identificador "CAP_<capítulo>_ART_<posición>"
+        return [
+            numero if numero is not None else f"CAP_{capitulo_numero}_ART_{posicion}"
+            for numero, posicion in capitulos_index.get(str(capitulo_numero).upper(), [])
+        ]
+    
     articles = []
     titulos = ley_data.get("ley", {}).get("titulos", [])
     
@@ -142,12 +205,16 @@ def process_dictamen_data(
     modified_articles: Set[str] = set()
     derogated_articles: Set[str] = set()
     derogated_chapters: Dict[str, Set[str]] = {}
+    # Índice de capítulos: se arma una sola vez, con la primera derogación de capítulo
+    capitulos_index = None
     
     for cambio in dictamen_data:
         # Detectar derogaciones de capítulos completos
         if cambio.get("destino_capitulo"):
             capitulo_numero = cambio["destino_capitulo"]
-            articles_in_chapter = find_articles_in_chapter(ley_data, capitulo_numero)
+            if capitulos_index is None:
+                capitulos_index = _index_capitulos(ley_data)
+            articles_in_chapter = find_articles_in_chapter(ley_data, capitulo_numero, capitulos_index)
             derogated_chapters[capitulo_numero] = set(articles_in_chapter)
             # Marcar todos los artículos del capítulo como modificados
             for art_num in articles_in_chapter:
@@ -223,6 +290,8 @@ def get_incorporated_articles(
         Lista de artículos incorporados con sus datos
     """
     incorporated_articles = []
+    # Números de artículos de la ley: se arma una sola vez, con la primera incorporación
+    numeros_ley = None
     
     for cambio in dictamen_data:
         if cambio.get("accion") in ["incorpórase", "incorporase"]:
@@ -231,34 +300,15 @@ def get_incorporated_articles(
                 continue
             
             # Verificar si el artículo ya existe en la ley original
-            exists_in_law = False
-            titulos = ley_data.get("ley", {}).get("titulos", [])
-            for titulo in titulos:
-                if titulo.get("articulos"):
-                    if any(str(art.get("numero")) == destino_articulo for art in titulo["articulos"]):
-                        exists_in_law = True
-                        break
-                if titulo.get("capitulos"):
-                    for capitulo in titulo["capitulos"]:
-                        if capitulo.get("articulos"):
-                            if any(str(art.get("numero")) == destino_articulo for art in capitulo["articulos"]):
-                                exists_in_law = True
-                                break
-                    if exists_in_law:
-                        break
-                if exists_in_law:
-                    break
+            if numeros_ley is None:
+                numeros_ley = _numeros_articulos(ley_data)
             
             # Solo agregar si no existe en la ley original
-            if not exists_in_law:
+            if destino_articulo not in numeros_ley:
                 # Extraer título del texto_nuevo si está disponible
                 titulo = ""
                 if cambio.get("texto_nuevo"):
-                    titulo_match = re.search(
-                        r"ART[ÍI]CULO\s+\d+(?:\s*(?:bis|ter|quater|quinquies|sexies|septies|octies|nonies|decies))?\s*[°º]?-\s*(.+?)(?:\n|$)",
-                        cambio["texto_nuevo"],
-                        re.IGNORECASE
-                    )
+                    titulo_match = _RE_TITULO_ARTICULO.search(cambio["texto_nuevo"])
                     if titulo_match and titulo_match.group(1):
                         titulo = titulo_match.group(1).strip()
                         # Limpiar el título (puede tener más texto después)
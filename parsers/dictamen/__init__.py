@@ -6,6 +6,8 @@ from typing import Dict, Any, List
 from .parser import (
     parse_dictamen_pdf,
     parse_dictamen_pdf_legacy,
+    parse_dictamen_pdfs,
+    articulos_to_titulos_ops,
     DictamenArticulo,
     ObjetivoAccion,
     Operation,  # Mantener para compatibilidad
@@ -14,6 +16,8 @@ from .parser import (
 __all__ = [
     "parse_dictamen_pdf",
     "parse_dictamen_pdf_legacy",
+    "parse_dictamen_pdfs",
+    "articulos_to_titulos_ops",
     "DictamenArticulo",
     "ObjetivoAccion",
     "Operation",
@@ -27,13 +31,15 @@ def dictamen_articulo_to_legacy_dict(articulo: DictamenArticulo) -> Dict[str, An
     Convierte un DictamenArticulo al formato legacy (diccionario con campos antiguos).
     Útil para compatibilidad con código existente.
     """
+    # Partir el texto completo una sola vez
+    lines = articulo.texto_completo.split("\n") if articulo.texto_completo else []
+    
     # Extraer encabezado (primera línea del texto completo)
-    encabezado = articulo.texto_completo.split("\n")[0] if articulo.texto_completo else ""
+    encabezado = lines[0] if lines else ""
     
     # Extraer texto_nuevo (todo después del encabezado)
     texto_nuevo = None
-    if articulo.texto_completo:
-        lines = articulo.texto_completo.split("\n")
+    if lines:
         if len(lines) > 1:
             # Buscar donde empieza el texto nuevo (después de "por el siguiente:" o similar)
             texto_nuevo_lines = []
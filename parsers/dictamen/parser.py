@@ -34,18 +34,36 @@ Requisitos:
 from __future__ import annotations
 
 import argparse
-import json
+import hashlib
+import multiprocessing as mp
+import os
 import re
-from dataclasses import dataclass, asdict
-from typing import List, Optional, Dict, Any, Tuple
+import sys
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from enum import IntEnum
+from itertools import chain
+from typing import List, Optional, Dict, DefaultDict, Any, Tuple, Iterable, Iterator
+
+# Permite importar utils/ al ejecutar este archivo como script
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from utils.json_io import write_json
 
 
 # ----------------------------
 # Config / patrones
 # ----------------------------
 
+# Sufijos latinos de numeración de artículos ("11 bis", "245 ter"), compartidos por
+# todos los patrones de número de artículo. Ordenados por frecuencia: bis y ter
+# cubren casi todos los casos y se prueban primero. Ningún sufijo es prefijo de
+# otro, así que el orden no cambia qué se captura.
+_SUFIJO_ART = r"(?:bis|ter|quater|quinquies|sexies|septies|octies|nonies|decies)"
+
 HEADER_RE = re.compile(
-    r"^\s*ART[ÍI]CULO\s+([0-9]+(?:\s*(?:bis|ter|quater|quinquies|sexies|septies|octies|nonies|decies))?)\s*[°º]?\s*[-–—]\s*(.*)\s*$",
+    r"^\s*ART[ÍI]CULO\s+([0-9]+(?:\s*" + _SUFIJO_ART + r")?)\s*[°º]?\s*[-–—]\s*(.*)\s*$",
     re.IGNORECASE,
 )
 
@@ -58,6 +76,20 @@ TITULO_RE = re.compile(r"^\s*T[ÍI]TULO\s+([IVXLCDM]+|[0-9]+)\b", re.IGNORECASE)
 # También buscar en medio de línea por si acaso
 TITULO_RE_ANYWHERE = re.compile(r"\bT[ÍI]TULO\s+([IVXLCDM]+|[0-9]+)\b", re.IGNORECASE)
 
+# Clasificador de líneas para el bucle de parse_dictamen: una sola coincidencia
+# reemplaza la cascada TITULO_RE / TITULO_RE_ANYWHERE / STRUCT_RE / HEADER_RE.
+# El orden de las alternativas respeta la prioridad original: un título en
+# cualquier posición de la línea gana sobre el resto; luego encabezado
+# estructural y, por último, encabezado de artículo ("art" = grupo 1 de HEADER_RE).
+_LINE_CLASSIFIER = re.compile(
+    r"^(?:"
+    r".*?(?P<titulo>\bT[ÍI]TULO\s+(?P<titulo_num>[IVXLCDM]+|[0-9]+)\b)"
+    r"|\s*(?P<struct>T[ÍI]TULO|CAP[ÍI]TULO|SECCI[ÓO]N|ANEXO)\b"
+    r"|\s*(?P<header>ART[ÍI]CULO\s+(?P<art>[0-9]+(?:\s*" + _SUFIJO_ART + r")?)\s*[°º]?\s*[-–—])"
+    r")",
+    re.IGNORECASE,
+)
+
 # Verbos operativos típicos del dictamen (operaciones legislativas)
 OP_VERBS = [
     "sustitúyese", "sustituyese",
@@ -69,36 +101,87 @@ OP_VERBS = [
     "reemplázase", "reemplazase",
 ]
 
+# Forma normalizada de cada verbo operativo (sustitúyese -> sustituye, etc.)
+ACCION_MAP = {
+    "sustitúyese": "sustituye",
+    "sustituyese": "sustituye",
+    "incorpórase": "incorpora",
+    "incorporase": "incorpora",
+    "derógase": "deroga",
+    "derogase": "deroga",
+    "modifícase": "modifica",
+    "modificase": "modifica",
+    "suprímese": "suprime",
+    "suprimese": "suprime",
+    "reemplázase": "reemplaza",
+    "reemplazase": "reemplaza",
+    "créase": "crea",
+    "crease": "crea",
+}
+
 OP_VERB_RE = re.compile(r"\b(" + "|".join(map(re.escape, OP_VERBS)) + r")\b", re.IGNORECASE)
 
+# Variante sin IGNORECASE para texto ya pasado a minúsculas (los verbos ya lo están)
+OP_VERB_RE_LC = re.compile(r"\b(" + "|".join(map(re.escape, OP_VERBS)) + r")\b")
+
+# Versiones canónicas (internadas) de los verbos: cada artículo comparte el mismo objeto
+_OP_VERBS_INTERNED = {v: sys.intern(v) for v in OP_VERBS}
+
 # Gatillos que indican el inicio del "texto nuevo"
 TRIGGER_RE = re.compile(
     r"(por\s+el\s+siguiente\s*:|el\s+siguiente\s+texto\s*:|por\s+el\s+siguiente\s+texto\s*:|por\s+el\s+siguiente\s*:)",
     re.IGNORECASE,
 )
-
-# Regex específico para incorporaciones (prioridad alta)
-INCORPORATION_TARGET_RE = re.compile(
-    r"incorp[óo]rase\s+como\s+art[íi]culo\s+([0-9]+(?:\s*(?:bis|ter|quater|quinquies|sexies|septies|octies|nonies|decies))?)\s*[°º]?",
-    re.IGNORECASE
+# Variante para texto en minúsculas
+TRIGGER_RE_LC = re.compile(
+    r"(por\s+el\s+siguiente\s*:|el\s+siguiente\s+texto\s*:|por\s+el\s+siguiente\s+texto\s*:|por\s+el\s+siguiente\s*:)",
 )
 
-# Extracción simple de destino (fallback)
-TARGET_ART_RE = re.compile(
-    r"art[íi]culo\s+([0-9]+(?:\s*(?:bis|ter|quater|quinquies|sexies|septies|octies|nonies|decies))?)\s*[°º]?",
-    re.IGNORECASE
-)
+# Palabra fija presente en todas las alternativas de TRIGGER_RE: si una línea no la
+# contiene (caso más frecuente) no hace falta correr la regex.
+_TRIGGER_KEYWORD = "siguiente"
+
 
-# Regex específico para buscar "el artículo X" después del verbo operativo
-# Esto evita capturar el número del artículo del dictamen (ej: "ARTÍCULO 21-")
-TARGET_ART_AFTER_VERB_RE = re.compile(
-    r"(?:sustit[úu]yese|der[óo]gase|modif[íi]case|supr[íi]mese|reempl[áa]zase)\s+el\s+art[íi]culo\s+([0-9]+(?:\s*(?:bis|ter|quater|quinquies|sexies|septies|octies|nonies|decies))?)\s*[°º]?",
-    re.IGNORECASE
+def _buscar_gatillo(line: str) -> Optional[re.Match]:
+    """TRIGGER_RE.search con descarte previo por substring (ver _TRIGGER_KEYWORD)."""
+    if _TRIGGER_KEYWORD not in line.lower():
+        return None
+    return TRIGGER_RE.search(line)
+
+
+# Condición de corte al capturar las líneas de continuación de un encabezado.
+# Se aplica sobre las líneas candidatas unidas con "\n", anclada al inicio de cada
+# línea y usando solo espacios horizontales para que ninguna alternativa cruce de
+# línea. El orden de las alternativas reproduce la prioridad por línea:
+#   trig:   la línea contiene el gatillo (TRIGGER_RE)
+#   art:    la línea es un nuevo encabezado de artículo (HEADER_RE)
+#   struct: la línea es un encabezado estructural (STRUCT_RE)
+HEADER_STOP_RE = re.compile(
+    r"^(?:(?P<trig>.*?(?:por[^\S\n]+el[^\S\n]+siguiente[^\S\n]*:|el[^\S\n]+siguiente[^\S\n]+texto[^\S\n]*:"
+    r"|por[^\S\n]+el[^\S\n]+siguiente[^\S\n]+texto[^\S\n]*:))"
+    r"|(?P<art>[^\S\n]*ART[ÍI]CULO[^\S\n]+[0-9]+(?:[^\S\n]*" + _SUFIJO_ART + r")?"
+    r"[^\S\n]*[°º]?[^\S\n]*[-–—])"
+    r"|(?P<struct>[^\S\n]*(?:T[ÍI]TULO|CAP[ÍI]TULO|SECCI[ÓO]N|ANEXO)\b))",
+    re.IGNORECASE | re.MULTILINE,
 )
-TARGET_INCISO_RE = re.compile(r"inciso\s+([a-z])\)\s+del\s+art[íi]culo\s+([0-9]+)\s*[°º]?", re.IGNORECASE)
 
-# Regex para detectar derogaciones de capítulos completos
-TARGET_CAPITULO_RE = re.compile(r"der[óo]gase\s+el\s+cap[íi]tulo\s+([IVXLCDM]+|[0-9]+)", re.IGNORECASE)
+# Destinos de la operación en una sola pasada, sobre el encabezado en minúsculas
+# (los valores se recortan del texto original por posición para conservar
+# mayúsculas). Cada alternativa tiene su grupo con nombre:
+#   cap:      "derógase el capítulo X" (derogación de capítulo completo)
+#   inc:      "inciso x) del artículo N" (con incpar = artículo padre)
+#   incorp:   "incorpórase como artículo N" (prioridad alta para incorporaciones)
+#   verb_art: "<verbo> el artículo N", evita capturar el número del artículo del
+#             dictamen (ej: "ARTÍCULO 21-")
+#   art:      cualquier "artículo N" (fallback)
+TARGETS_RE = re.compile(
+    r"der[óo]gase\s+el\s+cap[íi]tulo\s+(?P<cap>[ivxlcdm]+|[0-9]+)"
+    r"|inciso\s+(?P<inc>[a-z])\)\s+del\s+art[íi]culo\s+(?P<incpar>[0-9]+)"
+    r"|incorp[óo]rase\s+como\s+art[íi]culo\s+(?P<incorp>[0-9]+(?:\s*" + _SUFIJO_ART + r")?)"
+    r"|(?:sustit[úu]yese|der[óo]gase|modif[íi]case|supr[íi]mese|reempl[áa]zase)\s+el\s+art[íi]culo\s+"
+    r"(?P<verb_art>[0-9]+(?:\s*" + _SUFIJO_ART + r")?)"
+    r"|art[íi]culo\s+(?P<art>[0-9]+(?:\s*" + _SUFIJO_ART + r")?)"
+)
 
 LAW_NUM_RE = re.compile(r"Ley\s+.*?N[°º]\s*([0-9\.\-]+)", re.IGNORECASE)
 
@@ -125,34 +208,84 @@ LEY_NOMBRES_A_NUMEROS = {
     "ley sobre riesgos del trabajo": "24557",  # Ley base de riesgos del trabajo
 }
 
+# Los patrones de leyes no usan IGNORECASE: extraer_ley_mejorada los aplica sobre
+# el texto ya pasado a minúsculas (ver _to_lower).
+
 # Patrón especial para "Ley de Contrato de Trabajo N° 20.744"
 # Este patrón captura el número que viene después del nombre de la ley
 PATRON_LEY_CON_NOMBRE = re.compile(
-    r"ley\s+de\s+contrato\s+de\s+trabajo\s+n[°º]\s*([0-9\.\-]+)",
-    re.IGNORECASE
+    r"ley\s+de\s+contrato\s+de\s+trabajo\s+n[°º]\s*([0-9\.\-]+)"
 )
 
 # Patrones de texto que indican que se está hablando de la LCT
 PATRONES_LCT = [
-    re.compile(r"ley\s+de\s+contrato\s+de\s+trabajo", re.IGNORECASE),
-    re.compile(r"art[íi]culo\s+\d+.*de\s+la\s+ley", re.IGNORECASE),
-    re.compile(r"sustit[úu]yese.*art[íi]culo.*de\s+la\s+ley", re.IGNORECASE),
-    re.compile(r"modif[íi]case.*art[íi]culo.*de\s+la\s+ley", re.IGNORECASE),
-    re.compile(r"incorp[óo]rase.*art[íi]culo.*de\s+la\s+ley", re.IGNORECASE),
+    re.compile(r"ley\s+de\s+contrato\s+de\s+trabajo"),
+    re.compile(r"art[íi]culo\s+\d+.*de\s+la\s+ley"),
+    re.compile(r"sustit[úu]yese.*art[íi]culo.*de\s+la\s+ley"),
+    re.compile(r"modif[íi]case.*art[íi]culo.*de\s+la\s+ley"),
+    re.compile(r"incorp[óo]rase.*art[íi]culo.*de\s+la\s+ley"),
 ]
 
 # Patrones para extraer números de ley
 PATRONES_LEY_MEJORADOS = [
-    re.compile(r"ley\s+n[°º]\s*([0-9\.\-]+)", re.IGNORECASE),
-    re.compile(r"ley\s+([0-9\.\-]+)", re.IGNORECASE),
-    re.compile(r"ley\s+([0-9]{1,2}\.[0-9]{3,5})", re.IGNORECASE),
-    re.compile(r"ley\s+([0-9]{2}\.[0-9]{3,5})", re.IGNORECASE),
-    re.compile(r"decreto\s+ley\s+([0-9\.]+)", re.IGNORECASE),
-    re.compile(r"decreto[\s-]ley\s+([0-9\.]+)", re.IGNORECASE),
+    re.compile(r"ley\s+n[°º]\s*([0-9\.\-]+)"),
+    re.compile(r"ley\s+([0-9\.\-]+)"),
+    re.compile(r"ley\s+([0-9]{1,2}\.[0-9]{3,5})"),
+    re.compile(r"ley\s+([0-9]{2}\.[0-9]{3,5})"),
+    re.compile(r"decreto\s+ley\s+([0-9\.]+)"),
+    re.compile(r"decreto[\s-]ley\s+([0-9\.]+)"),
 ]
 
 
-def extraer_ley_mejorada(texto: str, contexto_titulo: Optional[str] = None) -> Optional[str]:
+# Referencia genérica a "la ley" sin número (inferencia de LCT en el título I)
+_LCT_HINT_RE = re.compile(r"de\s+la\s+ley|esta\s+ley")
+
+
+# Frases que indican que la ley es una referencia interna y no el objetivo de la operación.
+# Se buscan sobre el contexto en minúsculas con una única alternación compilada.
+EXCLUDE_PHRASES = (
+    "anexas a la ley",
+    "términos de la ley",
+    "dispuesto en la ley",
+    "establecido en la ley",
+    "previsto en la ley",
+    "conforme a la ley",
+    "según la ley",
+    "en virtud de lo establecido en la ley",
+    "incluyen los entes previstos",
+)
+EXCLUDE_RE = re.compile("|".join(map(re.escape, EXCLUDE_PHRASES)))
+
+# Ídem para las leyes mencionadas antes del gatillo
+EXCLUDE_ANTES_GATILLO_PHRASES = (
+    "tablas anexas",
+    "índices de relación contenidos en",
+    "en los términos",
+    "conforme",
+    "según",
+)
+EXCLUDE_ANTES_GATILLO_RE = re.compile("|".join(map(re.escape, EXCLUDE_ANTES_GATILLO_PHRASES)))
+
+
+def _to_lower(texto: str) -> str:
+    """
+    Pasa el texto a minúsculas conservando la longitud.
+    
+    Las posiciones de las coincidencias sobre el texto en minúsculas se usan para
+    recortar el texto original, así que los pocos caracteres cuya minúscula ocupa
+    más de un carácter (ej: "İ") se dejan como están.
+    """
+    lower = texto.lower()
+    if len(lower) == len(texto):
+        return lower
+    return "".join(c if len(c.lower()) != 1 else c.lower() for c in texto)
+
+
+def extraer_ley_mejorada(
+    texto: str,
+    contexto_titulo: Optional[str] = None,
+    texto_lower: Optional[str] = None,
+) -> Optional[str]:
     """
     Extrae el número de ley mencionado en un texto usando lógica mejorada.
     Retorna el número de ley normalizado (sin puntos) o None.
@@ -160,6 +293,7 @@ def extraer_ley_mejorada(texto: str, contexto_titulo: Optional[str] = None) -> O
     Args:
         texto: Texto a analizar
         contexto_titulo: Número de título del dictamen (para inferir leyes por contexto)
+        texto_lower: El mismo texto ya pasado por _to_lower, si el llamador lo tiene
     
     Estrategia:
     1. Buscar leyes explícitas mencionadas con número
@@ -170,14 +304,30 @@ def extraer_ley_mejorada(texto: str, contexto_titulo: Optional[str] = None) -> O
     if not texto:
         return None
     
-    texto_lower = texto.lower()
+    if texto_lower is None:
+        texto_lower = _to_lower(texto)
     
-    # Separar leyes explícitas de inferidas
     leyes_explicitas = []  # Lista de tuplas (numero_ley, posicion, contexto)
-    leyes_inferidas = set()
+    # True si algún patrón de PATRONES_LEY_MEJORADOS coincidió (aunque el número no sea válido)
+    patron_ley_encontrado = False
+    
+    # Posiciones ya registradas por (numero, posicion // 10): dos menciones a menos
+    # de 10 caracteres caen en el mismo bucket o en uno adyacente.
+    posiciones_vistas: Dict[Tuple[str, int], List[int]] = {}
+    
+    def _registrar(numero: str, pos: int) -> None:
+        posiciones_vistas.setdefault((numero, pos // 10), []).append(pos)
+    
+    def _duplicada(numero: str, pos: int) -> bool:
+        bucket = pos // 10
+        for b in (bucket - 1, bucket, bucket + 1):
+            for otra in posiciones_vistas.get((numero, b), ()):
+                if abs(otra - pos) < 10:
+                    return True
+        return False
     
     # Buscar patrón especial "Ley de Contrato de Trabajo N° 20.744" primero
-    for match in PATRON_LEY_CON_NOMBRE.finditer(texto):
+    for match in PATRON_LEY_CON_NOMBRE.finditer(texto_lower):
         numero = match.group(1).replace(".", "").replace(" ", "").strip()
         if numero and numero.isdigit():
             start = max(0, match.start() - 50)
@@ -188,17 +338,19 @@ def extraer_ley_mejorada(texto: str, contexto_titulo: Optional[str] = None) -> O
                 'numero': numero,
                 'posicion': match.start(),
                 'contexto': contexto,
-                'match_completo': match.group(0),
+                'match_completo': texto[match.start():match.end()],
                 'prioridad': 1  # Alta prioridad para este patrón
             })
+            _registrar(numero, match.start())
     
     # Buscar patrones de números de ley con su posición y contexto
     for patron in PATRONES_LEY_MEJORADOS:
-        for match in patron.finditer(texto):
+        for match in patron.finditer(texto_lower):
+            patron_ley_encontrado = True
             numero = match.group(1).replace(".", "").replace(" ", "").strip()
             if numero and numero.isdigit():
                 # Evitar duplicados
-                if any(l['numero'] == numero and abs(l['posicion'] - match.start()) < 10 for l in leyes_explicitas):
+                if _duplicada(numero, match.start()):
                     continue
                 
                 # Extraer contexto alrededor de la mención (50 chars antes y después)
@@ -210,9 +362,10 @@ def extraer_ley_mejorada(texto: str, contexto_titulo: Optional[str] = None) -> O
                     'numero': numero,
                     'posicion': match.start(),
                     'contexto': contexto,
-                    'match_completo': match.group(0),
+                    'match_completo': texto[match.start():match.end()],
                     'prioridad': 2  # Prioridad normal
                 })
+                _registrar(numero, match.start())
     
     # Buscar nombres comunes de leyes (explícitas)
     for nombre, numero in LEY_NOMBRES_A_NUMEROS.items():
@@ -221,7 +374,7 @@ def extraer_ley_mejorada(texto: str, contexto_titulo: Optional[str] = None) -> O
             pos = texto_lower.find(nombre)
             
             # Evitar duplicados
-            if any(l['numero'] == numero and abs(l['posicion'] - pos) < 10 for l in leyes_explicitas):
+            if _duplicada(numero, pos):
                 continue
             
             start = max(0, pos - 50)
@@ -235,6 +388,7 @@ def extraer_ley_mejorada(texto: str, contexto_titulo: Optional[str] = None) -> O
                 'match_completo': nombre,
                 'prioridad': 1  # Alta prioridad para nombres conocidos
             })
+            _registrar(numero, pos)
     
     # Si hay leyes explícitas, aplicar lógica de priorización
     if leyes_explicitas:
@@ -242,7 +396,7 @@ def extraer_ley_mejorada(texto: str, contexto_titulo: Optional[str] = None) -> O
         leyes_explicitas.sort(key=lambda x: (x.get('prioridad', 2), x['posicion']))
         
         # Buscar verbos operativos en el texto
-        verbo_match = OP_VERB_RE.search(texto)
+        verbo_match = OP_VERB_RE_LC.search(texto_lower)
         verbo_pos = verbo_match.start() if verbo_match else 0
         
         # Prioridad 1: Ley mencionada inmediatamente después del verbo operativo
@@ -278,37 +432,17 @@ def extraer_ley_mejorada(texto: str, contexto_titulo: Optional[str] = None) -> O
                     # Buscar patrón "artículo X de la Ley"
                     if 'de la ley' in contexto and distancia < 200:
                         # Verificar que no es una referencia interna
-                        if not any(frase in contexto for frase in [
-                            'anexas a la ley',
-                            'términos de la ley',
-                            'dispuesto en la ley',
-                            'establecido en la ley',
-                            'previsto en la ley',
-                            'conforme a la ley',
-                            'según la ley',
-                            'en virtud de lo establecido en la ley',
-                            'incluyen los entes previstos',
-                        ]):
+                        if EXCLUDE_RE.search(contexto) is None:
                             return ley['numero']
                 
                 # Para cualquier verbo, si está muy cerca y en contexto de artículo
                 if distancia < 150 and any(palabra in contexto for palabra in ['artículo', 'inciso', 'capítulo']):
                     # Verificar que no es una referencia interna
-                    if not any(frase in contexto for frase in [
-                        'anexas a la ley',
-                        'términos de la ley',
-                        'dispuesto en la ley',
-                        'establecido en la ley',
-                        'previsto en la ley',
-                        'conforme a la ley',
-                        'según la ley',
-                        'en virtud de lo establecido en la ley',
-                        'incluyen los entes previstos',
-                    ]):
+                    if EXCLUDE_RE.search(contexto) is None:
                         return ley['numero']
         
         # Prioridad 2: Primera ley mencionada en el encabezado (antes de "el siguiente:")
-        gatillo_match = TRIGGER_RE.search(texto)
+        gatillo_match = TRIGGER_RE_LC.search(texto_lower) if _TRIGGER_KEYWORD in texto_lower else None
         gatillo_pos = gatillo_match.start() if gatillo_match else len(texto)
         
         leyes_antes_gatillo = [l for l in leyes_explicitas if l['posicion'] < gatillo_pos]
@@ -319,13 +453,7 @@ def extraer_ley_mejorada(texto: str, contexto_titulo: Optional[str] = None) -> O
                 # Verificar que está asociada al verbo operativo
                 if verbo_match and abs(ley['posicion'] - verbo_pos) < 200:
                     # Excluir referencias que claramente no son el objetivo
-                    if not any(frase in contexto for frase in [
-                        'tablas anexas',
-                        'índices de relación contenidos en',
-                        'en los términos',
-                        'conforme',
-                        'según',
-                    ]):
+                    if EXCLUDE_ANTES_GATILLO_RE.search(contexto) is None:
                         return ley['numero']
             
             # Si no encontramos una clara, tomar la primera antes del gatillo
@@ -345,24 +473,17 @@ def extraer_ley_mejorada(texto: str, contexto_titulo: Optional[str] = None) -> O
         # Prioridad 5: Tomar la primera ley mencionada
         return leyes_explicitas[0]['numero']
     
-    # Detectar menciones implícitas de LCT (solo si no hay ley explícita)
-    if not leyes_explicitas:
-        for patron_lct in PATRONES_LCT:
-            if patron_lct.search(texto):
-                leyes_inferidas.add("20744")
-                break
+    # Sin leyes explícitas: detectar menciones implícitas de LCT
+    for patron_lct in PATRONES_LCT:
+        if patron_lct.search(texto_lower):
+            return "20744"
     
     # Si el título es I y menciona "de la ley" o "esta ley" sin número específico,
-    # es muy probable que sea LCT (20744)
-    if contexto_titulo == "I" and not leyes_explicitas:
-        if re.search(r"(?:de\s+la\s+ley|esta\s+ley)", texto_lower):
-            tiene_ley_explicita = any(patron.search(texto) for patron in PATRONES_LEY_MEJORADOS)
-            if not tiene_ley_explicita:
-                leyes_inferidas.add("20744")
-    
-    # Si no hay leyes explícitas, usar inferidas
-    if leyes_inferidas:
-        return list(leyes_inferidas)[0]
+    # es muy probable que sea LCT (20744). patron_ley_encontrado ya indica si algún
+    # patrón de PATRONES_LEY_MEJORADOS coincidió, así que no hace falta re-buscarlos.
+    if contexto_titulo == "I" and not patron_ley_encontrado:
+        if _LCT_HINT_RE.search(texto_lower):
+            return "20744"
     
     return None
 
@@ -371,7 +492,11 @@ def extraer_ley_mejorada(texto: str, contexto_titulo: Optional[str] = None) -> O
 # Modelo de salida
 # ----------------------------
 
-@dataclass
+# slots=True (sin __dict__ por instancia) solo existe desde Python 3.10
+_DATACLASS_OPTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTS)
 class ObjetivoAccion:
     """Objeto estructurado que describe el objetivo de la acción del artículo del dictamen."""
     tipo: Optional[str] = None  # "nuevo" | "modifica"
@@ -384,8 +509,22 @@ class ObjetivoAccion:
     descripcion: Optional[str] = None
     texto_modificacion: Optional[str] = None  # Texto de la modificación propuesta (texto nuevo)
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convierte a diccionario para JSON (sin la copia recursiva de dataclasses.asdict)."""
+        return {
+            "tipo": self.tipo,
+            "ley_afectada": self.ley_afectada,
+            "accion": self.accion,
+            "destino_articulo": self.destino_articulo,
+            "destino_inciso": self.destino_inciso,
+            "destino_articulo_padre": self.destino_articulo_padre,
+            "destino_capitulo": self.destino_capitulo,
+            "descripcion": self.descripcion,
+            "texto_modificacion": self.texto_modificacion,
+        }
+
 
-@dataclass
+@dataclass(**_DATACLASS_OPTS)
 class DictamenArticulo:
     """Representa un artículo completo del dictamen con toda su información."""
     dictamen_articulo: str
@@ -393,9 +532,18 @@ class DictamenArticulo:
     texto_completo: str
     objetivo_accion: ObjetivoAccion
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convierte a diccionario para JSON, incluyendo objetivo_accion anidado."""
+        return {
+            "dictamen_articulo": self.dictamen_articulo,
+            "titulo": self.titulo,
+            "texto_completo": self.texto_completo,
+            "objetivo_accion": self.objetivo_accion.to_dict(),
+        }
+
 
 # Mantener Operation para compatibilidad temporal
-@dataclass
+@dataclass(**_DATACLASS_OPTS)
 class Operation:
     dictamen_articulo: str
     encabezado: str
@@ -408,51 +556,123 @@ class Operation:
     texto_nuevo: Optional[str] = None
     texto_nuevo_lineas: Optional[List[str]] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convierte a diccionario para JSON (sin la copia recursiva de dataclasses.asdict)."""
+        return {
+            "dictamen_articulo": self.dictamen_articulo,
+            "encabezado": self.encabezado,
+            "accion": self.accion,
+            "ley_numero": self.ley_numero,
+            "destino_articulo": self.destino_articulo,
+            "destino_inciso": self.destino_inciso,
+            "destino_articulo_padre": self.destino_articulo_padre,
+            "destino_capitulo": self.destino_capitulo,
+            "texto_nuevo": self.texto_nuevo,
+            "texto_nuevo_lineas": self.texto_nuevo_lineas,
+        }
+
 
 # ----------------------------
 # Extracción de texto desde PDF
 # ----------------------------
 
-def extract_lines_from_pdf(pdf_path: str) -> List[str]:
+# Páginas por tarea y mínimo de páginas para repartir la extracción entre procesos
+PDF_PAGES_PER_TASK = 8
+PDF_MIN_PAGES_PARALLEL = 16
+
+
+def _extract_pdfplumber_pages(task: Tuple[str, int, int]) -> List[str]:
+    """Extrae el texto de las páginas [inicio, fin) del PDF (se ejecuta en un proceso worker)."""
+    import pdfplumber  # type: ignore
+    pdf_path, start, stop = task
+    with pdfplumber.open(pdf_path) as pdf:
+        return [pdf.pages[k].extract_text() or "" for k in range(start, stop)]
+
+
+def iter_pdf_lines(pdf_path: str, workers: Optional[int] = None) -> Iterator[str]:
     """
-    Extrae texto del PDF línea por línea, preservando el orden del documento.
+    Extrae texto del PDF línea por línea, página a página, como generador.
+    
+    Cada página se procesa y se libera antes de pasar a la siguiente, de modo
+    que nunca se mantiene en memoria la lista completa de líneas del documento.
     
     Intenta usar pdfplumber primero (más preciso para extracción de texto).
-    Si pdfplumber no está disponible o falla, usa PyMuPDF (fitz) como fallback.
+    Si pdfplumber no está disponible o no puede abrir el archivo, usa PyMuPDF
+    (fitz) como fallback.
+    
+    La extracción de pdfplumber es Python puro (pdfminer) y no libera el GIL,
+    así que en documentos grandes las páginas se reparten en bloques entre
+    procesos. El orden de las líneas se preserva.
     
     Args:
         pdf_path: Ruta al archivo PDF del dictamen.
+        workers: Cantidad de procesos para extraer páginas. None usa
+                 min(8, cpu_count); 1 desactiva el paralelismo.
     
-    Returns:
-        Lista de strings, cada uno representando una línea de texto del PDF
-        en el orden en que aparecen en el documento.
+    Yields:
+        Cada línea de texto del PDF en el orden en que aparece en el documento.
     
     Raises:
         RuntimeError: Si no se puede extraer texto del PDF (ambas librerías fallan).
     """
     try:
         import pdfplumber  # type: ignore
-        lines: List[str] = []
-        with pdfplumber.open(pdf_path) as pdf:
+        pdf = pdfplumber.open(pdf_path)
+    except Exception:
+        pdf = None
+
+    if pdf is not None:
+        with pdf:
+            n_pages = len(pdf.pages)
+            if workers is None:
+                workers = min(8, os.cpu_count() or 1)
+            if workers > 1 and n_pages >= PDF_MIN_PAGES_PARALLEL:
+                tasks = [
+                    (pdf_path, start, min(start + PDF_PAGES_PER_TASK, n_pages))
+                    for start in range(0, n_pages, PDF_PAGES_PER_TASK)
+                ]
+                with ProcessPoolExecutor(max_workers=workers) as ex:
+                    for page_texts in ex.map(_extract_pdfplumber_pages, tasks):
+                        for txt in page_texts:
+                            yield from txt.splitlines()
+                return
             for page in pdf.pages:
                 txt = page.extract_text() or ""
-                page_lines = txt.splitlines()
-                lines.extend(page_lines)
-        return lines
-    except Exception:
-        # Fallback: PyMuPDF
-        try:
-            import fitz  # type: ignore
-            doc = fitz.open(pdf_path)
-            lines = []
-            for page in doc:
-                txt = page.get_text("text") or ""
-                lines.extend(txt.splitlines())
-            return lines
-        except Exception as e:
-            raise RuntimeError(
-                "No pude extraer texto del PDF. Instala 'pdfplumber' o 'pymupdf'."
-            ) from e
+                yield from txt.splitlines()
+        return
+
+    # Fallback: PyMuPDF
+    try:
+        import fitz  # type: ignore
+        doc = fitz.open(pdf_path)
+    except Exception as e:
+        raise RuntimeError(
+            "No pude extraer texto del PDF. Instala 'pdfplumber' o 'pymupdf'."
+        ) from e
+    for page in doc:
+        txt = page.get_text("text") or ""
+        yield from txt.splitlines()
+
+
+def extract_lines_from_pdf(pdf_path: str, workers: Optional[int] = None) -> List[str]:
+    """
+    Extrae texto del PDF línea por línea, preservando el orden del documento.
+    
+    Versión materializada de iter_pdf_lines, útil cuando se necesita la lista
+    completa de líneas crudas.
+    
+    Args:
+        pdf_path: Ruta al archivo PDF del dictamen.
+        workers: Cantidad de procesos para extraer páginas (ver iter_pdf_lines).
+    
+    Returns:
+        Lista de strings, cada uno representando una línea de texto del PDF
+        en el orden en que aparecen en el documento.
+    
+    Raises:
+        RuntimeError: Si no se puede extraer texto del PDF (ambas librerías fallan).
+    """
+    return list(iter_pdf_lines(pdf_path, workers=workers))
 
 
 # ----------------------------
@@ -471,9 +691,9 @@ def _is_probable_footer_header(line: str) -> bool:
     return False
 
 
-def normalize_lines(raw_lines: List[str]) -> List[str]:
+def iter_normalized_lines(raw_lines: Iterable[str]) -> Iterator[str]:
     """
-    Normaliza las líneas extraídas del PDF para mejorar el parsing.
+    Normaliza las líneas extraídas del PDF en una sola pasada, como generador.
     
     Realiza las siguientes transformaciones:
     1. Elimina encabezados/pies de página evidentes (números de página, etc.)
@@ -481,45 +701,80 @@ def normalize_lines(raw_lines: List[str]) -> List[str]:
     3. Colapsa espacios múltiples y tabs a un solo espacio
     4. Elimina espacios al final de cada línea
     
+    Solo retiene una línea pendiente (la que termina en guión) para decidir
+    si debe unirse con la siguiente, por lo que acepta cualquier iterable,
+    incluido el generador de iter_pdf_lines.
+    
     Args:
-        raw_lines: Lista de líneas crudas extraídas del PDF.
+        raw_lines: Iterable de líneas crudas extraídas del PDF.
     
-    Returns:
-        Lista de líneas normalizadas, listas para el parsing.
+    Yields:
+        Líneas normalizadas, listas para el parsing.
     """
-    # Filtrar basura obvia
-    filtered = [ln for ln in raw_lines if not _is_probable_footer_header(ln)]
+    pending: Optional[str] = None
+    for ln in raw_lines:
+        # Filtrar basura obvia
+        if _is_probable_footer_header(ln):
+            continue
 
-    # Normalizar espacios
-    filtered = [re.sub(r"[ \t]+", " ", ln).rstrip() for ln in filtered]
+        # Normalizar espacios
+        line = re.sub(r"[ \t]+", " ", ln).rstrip()
 
-    # Unir palabras partidas por guión al final de línea: "contra-\n to" -> "contrato"
-    joined: List[str] = []
-    i = 0
-    while i < len(filtered):
-        line = filtered[i]
-        if line.endswith("-") and i + 1 < len(filtered):
-            nxt = filtered[i + 1].lstrip()
+        # Unir palabras partidas por guión al final de línea: "contra-\n to" -> "contrato"
+        if pending is not None:
+            nxt = line.lstrip()
             # Si la siguiente línea comienza con letra, asumimos partición de palabra
             if nxt and nxt[0].isalpha():
-                joined.append(line[:-1] + nxt)
-                i += 2
+                yield pending[:-1] + nxt
+                pending = None
                 continue
-        joined.append(line)
-        i += 1
+            yield pending
+            pending = None
+
+        if line.endswith("-"):
+            pending = line
+        else:
+            yield line
+
+    if pending is not None:
+        yield pending
 
-    return joined
+
+def normalize_lines(raw_lines: Iterable[str]) -> List[str]:
+    """
+    Normaliza las líneas extraídas del PDF para mejorar el parsing.
+    
+    Ver iter_normalized_lines para el detalle de las transformaciones.
+    
+    Args:
+        raw_lines: Iterable de líneas crudas extraídas del PDF.
+    
+    Returns:
+        Lista de líneas normalizadas, listas para el parsing.
+    """
+    return list(iter_normalized_lines(raw_lines))
 
 
 # ----------------------------
 # Detección de "artículo del dictamen"
 # ----------------------------
 
+# Raíces presentes en todos los OP_VERBS (con variante acentuada donde la tilde cae
+# dentro de la raíz). Descartar por substring es mucho más barato que la alternación
+# en el caso negativo, que es el más frecuente.
+_VERB_STEMS = ("sust", "incorp", "derog", "deróg", "modif", "cre", "cré", "supr", "reempl")
+
+
 def looks_like_dictamen_header(header_tail: str) -> bool:
     """
     Devuelve True si el contenido del encabezado sugiere operación legislativa.
     """
-    return bool(OP_VERB_RE.search(header_tail or ""))
+    if not header_tail:
+        return False
+    tail_lower = header_tail.lower()
+    if not any(stem in tail_lower for stem in _VERB_STEMS):
+        return False
+    return OP_VERB_RE_LC.search(tail_lower) is not None
 
 
 def find_next_nonempty(lines: List[str], start: int) -> Tuple[int, str]:
@@ -531,6 +786,40 @@ def find_next_nonempty(lines: List[str], start: int) -> Tuple[int, str]:
     return j, lines[j]
 
 
+def _capture_header_continuation(lines: List[str], start: int, max_lines: int = 5) -> Tuple[List[str], int, bool]:
+    """
+    Captura las líneas de continuación de un encabezado del dictamen.
+    
+    Toma hasta max_lines líneas no vacías desde start y corta en la primera que
+    contiene el gatillo (se incluye), o que es un nuevo encabezado de artículo o
+    un encabezado estructural (no se incluye). Las líneas candidatas se evalúan
+    con una única búsqueda de HEADER_STOP_RE.
+    
+    Returns:
+        Tupla (lineas_capturadas, idx_siguiente, gatillo_encontrado).
+    """
+    candidatos: List[Tuple[int, str]] = []
+    j = start
+    while j < len(lines) and len(candidatos) < max_lines:
+        line = lines[j].strip()
+        if line:
+            candidatos.append((j, line))
+        j += 1
+
+    if not candidatos:
+        return [], j, False
+
+    joined = "\n".join(line for _, line in candidatos)
+    m = HEADER_STOP_RE.search(joined)
+    if not m:
+        return [line for _, line in candidatos], j, False
+
+    k = joined.count("\n", 0, m.start())
+    if m.lastgroup == "trig":
+        return [line for _, line in candidatos[:k + 1]], candidatos[k][0] + 1, True
+    return [line for _, line in candidatos[:k]], candidatos[k][0], False
+
+
 def is_dictamen_header(lines: List[str], idx: int) -> Tuple[bool, str, int, bool]:
     """
     Determina si lines[idx] es un encabezado de artículo del dictamen.
@@ -569,78 +858,27 @@ def is_dictamen_header(lines: List[str], idx: int) -> Tuple[bool, str, int, bool
 
     # Si la primera línea ya tiene verbo operativo
     if looks_like_dictamen_header(tail):
-        # Capturar líneas adicionales hasta el gatillo o nuevo artículo
-        header_parts = [f"ARTÍCULO {art_num}- {tail}"]
-        j = idx + 1
-        gatillo_encontrado = False
-        
         # Capturar hasta 5 líneas más o hasta encontrar gatillo/nuevo artículo
-        max_lines = 5
-        lines_captured = 0
-        while j < len(lines) and lines_captured < max_lines:
-            line = lines[j].strip()
-            if not line:
-                j += 1
-                continue
-            
-            # Si encontramos gatillo, incluir esta línea y terminar
-            if TRIGGER_RE.search(line):
-                header_parts.append(line)
-                j += 1
-                gatillo_encontrado = True
-                break
-            
-            # Si encontramos nuevo artículo, terminar sin incluir
-            if HEADER_RE.match(line):
-                break
-            
-            # Si encontramos encabezado estructural, terminar
-            if STRUCT_RE.match(line):
-                break
-            
-            # Incluir la línea
-            header_parts.append(line)
-            j += 1
-            lines_captured += 1
-        
-        combined = " ".join(header_parts)
+        partes, j, gatillo_encontrado = _capture_header_continuation(lines, idx + 1)
+        combined = " ".join([f"ARTÍCULO {art_num}- {tail}"] + partes)
         return (True, combined, j, gatillo_encontrado)
 
     # Caso: "ARTÍCULO N°-" y el verbo viene en la línea siguiente
     j, nxt = find_next_nonempty(lines, idx + 1)
     if nxt and looks_like_dictamen_header(nxt):
         # Capturar líneas adicionales
-        header_parts = [f"ARTÍCULO {art_num}- {nxt.strip()}"]
-        j += 1
-        gatillo_encontrado = False
-        
-        max_lines = 5
-        lines_captured = 0
-        while j < len(lines) and lines_captured < max_lines:
-            line = lines[j].strip()
-            if not line:
-                j += 1
-                continue
-            
-            if TRIGGER_RE.search(line):
-                header_parts.append(line)
-                j += 1
-                gatillo_encontrado = True
-                break
-            
-            if HEADER_RE.match(line) or STRUCT_RE.match(line):
-                break
-            
-            header_parts.append(line)
-            j += 1
-            lines_captured += 1
-        
-        combined = " ".join(header_parts)
+        partes, j, gatillo_encontrado = _capture_header_continuation(lines, j + 1)
+        combined = " ".join([f"ARTÍCULO {art_num}- {nxt.strip()}"] + partes)
         return (True, combined, j, gatillo_encontrado)
 
     return (False, "", idx + 1, False)
 
 
+def _intern_opt(value: Optional[str]) -> Optional[str]:
+    """Interna tokens cortos y repetidos (números de ley, títulos) si no son None."""
+    return sys.intern(value) if value else value
+
+
 def parse_action_and_target(header_text: str, contexto_titulo: Optional[str] = None) -> Dict[str, Optional[str]]:
     """
     Extrae metadatos básicos de la operación legislativa desde el encabezado.
@@ -677,44 +915,60 @@ def parse_action_and_target(header_text: str, contexto_titulo: Optional[str] = N
         "destino_capitulo": None,
     }
 
-    mv = OP_VERB_RE.search(header_text)
+    # Minúsculas una sola vez: todas las búsquedas siguientes usan header_lower
+    header_lower = _to_lower(header_text)
+
+    mv = OP_VERB_RE_LC.search(header_lower)
     if mv:
-        out["accion"] = mv.group(1).lower()
+        accion = mv.group(1)
+        out["accion"] = _OP_VERBS_INTERNED.get(accion) or sys.intern(accion)
 
     # Usar lógica mejorada para extraer ley
-    out["ley_numero"] = extraer_ley_mejorada(header_text, contexto_titulo)
+    out["ley_numero"] = _intern_opt(extraer_ley_mejorada(header_text, contexto_titulo, header_lower))
+
+    # Una sola pasada: primera coincidencia de cada tipo de destino. "art" también
+    # registra el primer "artículo N" contenido en las alternativas más específicas,
+    # que finditer consume sin volver a ofrecerlo como coincidencia suelta.
+    targets: Dict[str, str] = {}
+    for m in TARGETS_RE.finditer(header_lower):
+        kind = m.lastgroup
+        if kind == "incpar":
+            if "inc" not in targets:
+                targets["inc"] = header_text[m.start("inc"):m.end("inc")]
+                targets["incpar"] = m.group("incpar")
+            continue
+        value = header_text[m.start(kind):m.end(kind)]
+        if kind not in targets:
+            targets[kind] = value
+        if kind in ("incorp", "verb_art") and "art" not in targets:
+            targets["art"] = value
 
     # Para derogaciones, buscar primero si se deroga un capítulo completo
     if out["accion"] == "derógase" or out["accion"] == "derogase":
-        mcap = TARGET_CAPITULO_RE.search(header_text)
-        if mcap:
-            out["destino_capitulo"] = mcap.group(1).strip()
+        if "cap" in targets:
+            out["destino_capitulo"] = targets["cap"].strip()
             return out
 
-    minc = TARGET_INCISO_RE.search(header_text)
-    if minc:
-        out["destino_inciso"] = f"{minc.group(1)})"
-        out["destino_articulo_padre"] = minc.group(2)
+    if "inc" in targets:
+        out["destino_inciso"] = f"{targets['inc']})"
+        out["destino_articulo_padre"] = targets["incpar"]
         return out
 
     # Para incorporaciones, buscar primero el patrón específico
     if out["accion"] == "incorpórase" or out["accion"] == "incorporase":
-        mincorp = INCORPORATION_TARGET_RE.search(header_text)
-        if mincorp:
-            out["destino_articulo"] = mincorp.group(1).strip()
+        if "incorp" in targets:
+            out["destino_articulo"] = targets["incorp"].strip()
             return out
 
     # Para sustituciones/derogaciones/modificaciones, buscar "el artículo X" después del verbo
     if out["accion"] in ("sustitúyese", "sustituyese", "derógase", "derogase", "modifícase", "modificase", "suprímese", "suprimese", "reemplázase", "reemplazase"):
-        mart_after_verb = TARGET_ART_AFTER_VERB_RE.search(header_text)
-        if mart_after_verb:
-            out["destino_articulo"] = mart_after_verb.group(1).strip()
+        if "verb_art" in targets:
+            out["destino_articulo"] = targets["verb_art"].strip()
             return out
 
     # Fallback: buscar cualquier "artículo X"
-    mart = TARGET_ART_RE.search(header_text)
-    if mart:
-        out["destino_articulo"] = mart.group(1).strip()
+    if "art" in targets:
+        out["destino_articulo"] = targets["art"].strip()
 
     return out
 
@@ -795,28 +1049,10 @@ def construir_objetivo_accion(
         texto_completo = encabezado
         if texto_nuevo:
             texto_completo += "\n" + texto_nuevo
-        ley_afectada = extraer_ley_mejorada(texto_completo, contexto_titulo)
+        ley_afectada = _intern_opt(extraer_ley_mejorada(texto_completo, contexto_titulo))
     
     # Normalizar acción
-    accion_normalizada = None
-    if accion:
-        accion_map = {
-            "sustitúyese": "sustituye",
-            "sustituyese": "sustituye",
-            "incorpórase": "incorpora",
-            "incorporase": "incorpora",
-            "derógase": "deroga",
-            "derogase": "deroga",
-            "modifícase": "modifica",
-            "modificase": "modifica",
-            "suprímese": "suprime",
-            "suprimese": "suprime",
-            "reemplázase": "reemplaza",
-            "reemplazase": "reemplaza",
-            "créase": "crea",
-            "crease": "crea",
-        }
-        accion_normalizada = accion_map.get(accion.lower())
+    accion_normalizada = ACCION_MAP.get(accion.lower()) if accion else None
     
     # Extraer destino_articulo desde texto_nuevo si no está en encabezado
     destino_art_final = destino_articulo
@@ -861,6 +1097,13 @@ def _generar_descripcion_objetivo(
     destino_capitulo: Optional[str],
 ) -> str:
     """Genera una descripción textual del objetivo de la acción."""
+    # Caso más frecuente: modificación de un artículo de una ley identificada
+    if (
+        tipo != "nuevo" and accion and destino_articulo and ley_afectada
+        and not destino_capitulo and not destino_inciso
+    ):
+        return f"{accion.capitalize()} el artículo {destino_articulo} de la Ley {ley_afectada}"
+    
     partes = []
     
     if accion:
@@ -890,6 +1133,15 @@ def _generar_descripcion_objetivo(
     return " ".join(partes)
 
 
+# Número de artículo al inicio del texto nuevo (puede incluir bis, ter, quater, etc.).
+# Acepta tanto guion (-) como punto (.) después del número. Se usa con .match: solo
+# cuenta el encabezado inicial, no las referencias a otros artículos dentro del texto.
+_ARTICLE_NUM_RE = re.compile(
+    r"\s*ART[ÍI]CULO\s+(\d+(?:\s*" + _SUFIJO_ART + r")?)\s*[°º]?[\.-]",
+    re.IGNORECASE,
+)
+
+
 def extract_article_number_from_texto_nuevo(texto_nuevo: str) -> Optional[str]:
     """
     Extrae el número de artículo desde el inicio de texto_nuevo.
@@ -906,10 +1158,7 @@ def extract_article_number_from_texto_nuevo(texto_nuevo: str) -> Optional[str]:
     if not texto_nuevo:
         return None
     
-    # Patrón para extraer número de artículo (puede incluir bis, ter, quater, etc.)
-    # Acepta tanto guion (-) como punto (.) después del número
-    pattern = r"ART[ÍI]CULO\s+(\d+(?:\s*(?:bis|ter|quater|quinquies|sexies|septies|octies|nonies|decies))?)\s*[°º]?[\.-]"
-    match = re.search(pattern, texto_nuevo, re.IGNORECASE)
+    match = _ARTICLE_NUM_RE.match(texto_nuevo)
     
     if match:
         return match.group(1).strip()
@@ -921,6 +1170,21 @@ def extract_article_number_from_texto_nuevo(texto_nuevo: str) -> Optional[str]:
 # Parser principal
 # ----------------------------
 
+# Línea que solo contiene un número (número de página suelto); se aplica a la línea ya stripeada
+_PAGE_NUMBER_RE = re.compile(r"^\d+$")
+
+# Verbos de incorporación (habilitan el inicio automático del texto nuevo sin gatillo)
+_INCORPORA_SET = frozenset({"incorpórase", "incorporase"})
+
+
+class EstadoParser(IntEnum):
+    """Estados de la máquina de parse_dictamen."""
+    SIN_ARTICULO = 0   # Buscando inicio de artículo del dictamen
+    ENCABEZADO = 1     # Capturando líneas del encabezado antes del gatillo
+    INTERMEDIO = 2     # Encabezado terminado, gatillo todavía no encontrado
+    TEXTO_NUEVO = 3    # Capturando el texto que se incorpora/modifica
+
+
 def parse_dictamen(lines: List[str], fill_objetivo_accion: bool = True) -> List[DictamenArticulo]:
     """
     Parsea el dictamen completo y retorna una lista de artículos estructurados.
@@ -931,10 +1195,15 @@ def parse_dictamen(lines: List[str], fill_objetivo_accion: bool = True) -> List[
     3. Captura el texto completo de cada artículo hasta encontrar delimitadores
     4. Construye objetos DictamenArticulo con toda la información
     
-    Estados de la máquina:
-    - Sin artículo: buscando inicio de artículo del dictamen
-    - Capturando encabezado: capturando líneas del encabezado antes del gatillo
-    - Capturando texto nuevo: capturando el texto que se incorpora/modifica
+    Estados de la máquina (EstadoParser):
+    - SIN_ARTICULO: buscando inicio de artículo del dictamen
+    - ENCABEZADO: capturando líneas del encabezado antes del gatillo
+    - INTERMEDIO: encabezado terminado, buscando el gatillo
+    - TEXTO_NUEVO: capturando el texto que se incorpora/modifica
+    
+    Cada estado solo evalúa las regex que le corresponden: el gatillo se
+    busca únicamente antes del texto nuevo y los encabezados estructurales
+    cortan el artículo solo mientras se captura texto nuevo.
     
     Delimitadores que finalizan un artículo:
     - Nuevo artículo del dictamen (ARTÍCULO N°-)
@@ -959,39 +1228,39 @@ def parse_dictamen(lines: List[str], fill_objetivo_accion: bool = True) -> List[
     current_encabezado_completo: List[str] = []
     current_texto_intermedio: List[str] = []
     current_texto_nuevo: List[str] = []
+    # Los buffers se vacían con clear() en lugar de reasignarse, así sus métodos
+    # append se enlazan a variables locales una sola vez para todo el bucle
+    agregar_articulo = articulos.append
+    agregar_encabezado = current_encabezado_completo.append
+    agregar_intermedio = current_texto_intermedio.append
+    agregar_nuevo = current_texto_nuevo.append
+    ultima_en_blanco = False  # True si el último elemento de current_texto_nuevo es ""
     current_meta: Optional[Dict[str, Optional[str]]] = None
+    current_accion: Optional[str] = None  # current_meta["accion"], leído en cada línea
     current_dictamen_art: Optional[str] = None
-    capturing_new_text = False
-    capturing_header = False
+    estado = EstadoParser.SIN_ARTICULO
+    # Resultado de _buscar_gatillo sobre lines[gatillo_lookahead_idx], calculado como lookahead
+    gatillo_lookahead_idx = -1
+    gatillo_lookahead: Optional[re.Match] = None
 
     def finalizar_articulo_actual() -> None:
         """Finaliza el artículo actual y lo agrega a la lista."""
-        nonlocal current_encabezado, current_encabezado_completo, current_texto_intermedio
-        nonlocal current_texto_nuevo, current_meta, current_dictamen_art, capturing_new_text, capturing_header
+        nonlocal current_encabezado, ultima_en_blanco, current_meta, current_accion, current_dictamen_art, estado
         
         if not current_dictamen_art or not current_meta:
             return
         
-        # Construir texto completo
-        texto_completo_parts = []
-        
-        # Encabezado completo
-        if current_encabezado_completo:
-            texto_completo_parts.append("\n".join(current_encabezado_completo))
-        
-        # Texto intermedio
-        if current_texto_intermedio:
-            texto_completo_parts.append("\n".join(current_texto_intermedio))
-        
-        # Texto nuevo
-        if current_texto_nuevo:
-            texto_completo_parts.append("\n".join(current_texto_nuevo))
-        
-        texto_completo = "\n".join(texto_completo_parts).strip()
+        # Construir texto completo (encabezado + intermedio + texto nuevo) con un solo join
+        texto_unido = "\n".join(chain(current_encabezado_completo, current_texto_intermedio, current_texto_nuevo))
+        texto_completo = texto_unido.strip()
         
         # Construir objetivo de acción
         if fill_objetivo_accion:
-            texto_nuevo_str = "\n".join(current_texto_nuevo).strip() if current_texto_nuevo else None
+            texto_nuevo_str = None
+            if current_texto_nuevo:
+                # El texto nuevo es el sufijo de texto_unido: se recorta en vez de volver a unirlo
+                largo_nuevo = sum(map(len, current_texto_nuevo)) + len(current_texto_nuevo) - 1
+                texto_nuevo_str = texto_unido[len(texto_unido) - largo_nuevo:].strip()
             objetivo = construir_objetivo_accion(
                 encabezado=current_encabezado or "",
                 texto_nuevo=texto_nuevo_str,
@@ -1014,164 +1283,166 @@ def parse_dictamen(lines: List[str], fill_objetivo_accion: bool = True) -> List[
             texto_completo=texto_completo,
             objetivo_accion=objetivo,
         )
-        articulos.append(articulo)
+        agregar_articulo(articulo)
         
         # Resetear estado
         current_encabezado = None
-        current_encabezado_completo = []
-        current_texto_intermedio = []
-        current_texto_nuevo = []
+        current_encabezado_completo.clear()
+        current_texto_intermedio.clear()
+        current_texto_nuevo.clear()
+        ultima_en_blanco = False
         current_meta = None
+        current_accion = None
         current_dictamen_art = None
-        capturing_new_text = False
-        capturing_header = False
+        estado = EstadoParser.SIN_ARTICULO
 
     while i < len(lines):
         line = lines[i]
+        s = line.strip()
 
-        # Detectar inicio de nuevo título
-        titulo_match = TITULO_RE.match(line)
-        if not titulo_match:
-            titulo_match = TITULO_RE_ANYWHERE.search(line)
-        
-        if titulo_match:
+        # Clasificar la línea con una sola coincidencia (título / estructural / artículo)
+        clase = _LINE_CLASSIFIER.match(line)
+        tipo_linea = clase.lastgroup if clase else None
+
+        # Detectar inicio de nuevo título (en cualquier estado)
+        if tipo_linea == "titulo":
             # Finalizar artículo actual si existe
-            if current_dictamen_art:
+            if estado != EstadoParser.SIN_ARTICULO:
                 finalizar_articulo_actual()
             
             # Iniciar nuevo título
-            current_titulo = titulo_match.group(1).strip()
-            i += 1
-            continue
-
-        # Delimitadores fuertes: encabezados estructurales (CAPÍTULO, SECCIÓN, etc.)
-        # Solo finalizamos si estamos capturando texto nuevo (no si estamos en encabezado)
-        # y no es un nuevo título del dictamen
-        if STRUCT_RE.match(line) and current_dictamen_art and capturing_new_text:
-            if not TITULO_RE.match(line):
-                # Finalizar artículo actual antes del encabezado estructural
-                finalizar_articulo_actual()
+            current_titulo = sys.intern(clase.group("titulo_num").strip())
             i += 1
             continue
 
         # ¿Es un encabezado de artículo?
-        if HEADER_RE.match(line):
+        if tipo_linea == "header":
             is_dic, full_header, next_i, gatillo_en_header = is_dictamen_header(lines, i)
 
             if is_dic:
                 # Finalizar artículo anterior si existe
-                if current_dictamen_art:
+                if estado != EstadoParser.SIN_ARTICULO:
                     finalizar_articulo_actual()
 
                 # Iniciar nuevo artículo
-                m = HEADER_RE.match(line)
-                assert m is not None
-                current_dictamen_art = m.group(1).strip()
+                current_dictamen_art = clase.group("art").strip()
                 current_encabezado = full_header.strip()
-                current_encabezado_completo = [full_header.strip()]
+                current_encabezado_completo.clear()
+                agregar_encabezado(current_encabezado)
                 
                 # Extraer metadata (acción, ley, destino, etc.)
                 current_meta = parse_action_and_target(full_header, current_titulo)
+                current_accion = current_meta["accion"]
                 
                 # Si el gatillo fue encontrado en el encabezado (por is_dictamen_header),
                 # activar inmediatamente la captura de texto nuevo. Esto evita que
                 # encabezados estructurales (como "CAPÍTULO VII") se incluyan en el
                 # texto del artículo anterior.
-                if gatillo_en_header:
-                    capturing_header = False
-                    capturing_new_text = True
-                else:
-                    capturing_header = True
-                    capturing_new_text = False
-                current_texto_intermedio = []
-                current_texto_nuevo = []
+                estado = EstadoParser.TEXTO_NUEVO if gatillo_en_header else EstadoParser.ENCABEZADO
+                current_texto_intermedio.clear()
+                current_texto_nuevo.clear()
+                ultima_en_blanco = False
                 i = next_i
                 continue
 
             # Si NO es dictamen header: puede ser parte del texto nuevo o intermedio
-            if current_dictamen_art:
-                if capturing_new_text:
-                    if line.strip():
-                        current_texto_nuevo.append(line.strip())
-                elif capturing_header:
-                    # Texto intermedio entre encabezado y gatillo
-                    if line.strip():
-                        current_texto_intermedio.append(line.strip())
-                i += 1
-                continue
+            if estado == EstadoParser.TEXTO_NUEVO:
+                if s:
+                    agregar_nuevo(s)
+                    ultima_en_blanco = False
+            elif estado == EstadoParser.ENCABEZADO:
+                # Texto intermedio entre encabezado y gatillo
+                if s:
+                    agregar_intermedio(s)
+            i += 1
+            continue
 
-        # Si hay artículo en curso, buscar gatillo para iniciar captura de texto nuevo
-        if current_dictamen_art and not capturing_new_text:
-            mt = TRIGGER_RE.search(line)
-            if mt:
-                capturing_new_text = True
-                capturing_header = False
-                
-                # Agregar parte antes del gatillo al intermedio si existe
-                before = line[:mt.start()].strip()
-                if before:
-                    current_texto_intermedio.append(before)
-                
-                # Agregar parte después del gatillo al texto nuevo
-                after = line[mt.end():].strip()
-                if after:
-                    current_texto_nuevo.append(after)
+        if estado == EstadoParser.SIN_ARTICULO:
+            # Fuera de un artículo del dictamen no se captura texto
+            i += 1
+            continue
+
+        if estado == EstadoParser.TEXTO_NUEVO:
+            # Delimitadores fuertes: encabezados estructurales (CAPÍTULO, SECCIÓN, etc.)
+            if tipo_linea == "struct":
+                # Finalizar artículo actual antes del encabezado estructural
+                finalizar_articulo_actual()
                 i += 1
                 continue
+
+            if s:
+                agregar_nuevo(s)
+                ultima_en_blanco = False
+            elif current_texto_nuevo and not ultima_en_blanco:
+                agregar_nuevo("")
+                ultima_en_blanco = True
+            i += 1
+            continue
+
+        # ENCABEZADO / INTERMEDIO: buscar gatillo para iniciar captura de texto nuevo
+        # (reutilizando la búsqueda hecha como lookahead en la iteración anterior)
+        if gatillo_lookahead_idx == i:
+            mt = gatillo_lookahead
+        else:
+            mt = _buscar_gatillo(line)
+        if mt:
+            estado = EstadoParser.TEXTO_NUEVO
             
-            # Para incorporaciones, si no hay gatillo, buscar inicio automático
-            if current_meta and (current_meta["accion"] == "incorpórase" or current_meta["accion"] == "incorporase"):
-                if HEADER_RE.match(line.strip()):
-                    capturing_new_text = True
-                    capturing_header = False
-                    if line.strip():
-                        current_texto_nuevo.append(line.strip())
-                    i += 1
-                    continue
-                elif line.strip() and i < len(lines) - 1:
-                    next_line = lines[i + 1].strip() if i + 1 < len(lines) else ""
-                    if next_line and not STRUCT_RE.match(next_line) and not TITULO_RE.match(next_line):
-                        if not re.match(r"^\s*\d+\s*$", line.strip()) and not HEADER_RE.match(line.strip()):
-                            capturing_new_text = True
-                            capturing_header = False
-                            current_texto_nuevo.append(line.strip())
-                            i += 1
-                            continue
-
-        # Capturar texto según el estado
-        if current_dictamen_art:
-            if capturing_new_text:
-                s = line.strip()
-                if s:
-                    current_texto_nuevo.append(s)
-                elif current_texto_nuevo and current_texto_nuevo[-1] != "":
-                    current_texto_nuevo.append("")
-            elif capturing_header:
-                # Continuar capturando encabezado si está en múltiples líneas
-                s = line.strip()
-                if s:
-                    current_encabezado_completo.append(s)
-                    # Si la línea siguiente no parece ser parte del encabezado, terminar
-                    if i + 1 < len(lines):
-                        next_line = lines[i + 1].strip()
-                        if not OP_VERB_RE.search(next_line) and not TRIGGER_RE.search(next_line):
-                            capturing_header = False
-            else:
-                # Texto intermedio
-                s = line.strip()
-                if s:
-                    current_texto_intermedio.append(s)
+            # Agregar parte antes del gatillo al intermedio si existe
+            before = line[:mt.start()].strip()
+            if before:
+                agregar_intermedio(before)
+            
+            # Agregar parte después del gatillo al texto nuevo
+            after = line[mt.end():].strip()
+            if after:
+                agregar_nuevo(after)
+            i += 1
+            continue
+        
+        # Para incorporaciones, si no hay gatillo, buscar inicio automático
+        # (las líneas "ARTÍCULO N-" ya se despacharon como tipo_linea == "header")
+        if current_accion in _INCORPORA_SET:
+            if s and i < len(lines) - 1:
+                next_line = lines[i + 1].strip() if i + 1 < len(lines) else ""
+                if next_line and not STRUCT_RE.match(next_line) and not TITULO_RE.match(next_line):
+                    if not _PAGE_NUMBER_RE.match(s):
+                        estado = EstadoParser.TEXTO_NUEVO
+                        agregar_nuevo(s)
+                        i += 1
+                        continue
+
+        if estado == EstadoParser.ENCABEZADO:
+            # Continuar capturando encabezado si está en múltiples líneas
+            if s:
+                agregar_encabezado(s)
+                # Si la línea siguiente no parece ser parte del encabezado, terminar
+                if i + 1 < len(lines):
+                    # El gatillo se busca sobre la línea cruda para que la coincidencia
+                    # sirva tal cual (con sus posiciones) en la próxima iteración
+                    gatillo_lookahead_idx = i + 1
+                    gatillo_lookahead = _buscar_gatillo(lines[i + 1])
+                    if not gatillo_lookahead and not OP_VERB_RE.search(lines[i + 1]):
+                        estado = EstadoParser.INTERMEDIO
+        else:
+            # Texto intermedio
+            if s:
+                agregar_intermedio(s)
 
         i += 1
 
     # Cierre final
-    if current_dictamen_art:
+    if estado != EstadoParser.SIN_ARTICULO:
         finalizar_articulo_actual()
 
     return articulos
 
 
-def parse_dictamen_pdf(pdf_path: str, fill_objetivo_accion: bool = True) -> List[DictamenArticulo]:
+def parse_dictamen_pdf(
+    pdf_path: str,
+    fill_objetivo_accion: bool = True,
+    workers: Optional[int] = None,
+) -> List[DictamenArticulo]:
     """
     Parsea un PDF de dictamen y retorna una lista de artículos del dictamen.
     
@@ -1179,12 +1450,12 @@ def parse_dictamen_pdf(pdf_path: str, fill_objetivo_accion: bool = True) -> List
         pdf_path: Ruta al archivo PDF del dictamen
         fill_objetivo_accion: Si True, completa objetivo_accion con datos parseados.
                              Si False, deja objetivo_accion vacío (solo esquema).
+        workers: Cantidad de procesos para extraer páginas (ver iter_pdf_lines).
     
     Returns:
         Lista de artículos del dictamen con texto completo y objetivo de acción
     """
-    raw = extract_lines_from_pdf(pdf_path)
-    lines = normalize_lines(raw)
+    lines = normalize_lines(iter_pdf_lines(pdf_path, workers=workers))
     return parse_dictamen(lines, fill_objetivo_accion=fill_objetivo_accion)
 
 
@@ -1194,16 +1465,32 @@ def parse_dictamen_pdf_legacy(pdf_path: str, fill_objetivo_accion: bool = True)
     Mantenida para compatibilidad.
     """
     articulos = parse_dictamen_pdf(pdf_path, fill_objetivo_accion=fill_objetivo_accion)
-    titulos_ops: Dict[str, List[Operation]] = {}
+    return articulos_to_titulos_ops(articulos)
+
+
+def articulos_to_titulos_ops(articulos: List[DictamenArticulo]) -> Dict[str, List[Operation]]:
+    """
+    Convierte artículos ya parseados a Operation agrupadas por título (formato legacy).
+    
+    Permite obtener el formato legacy sin volver a parsear el PDF cuando ya se
+    tiene el resultado de parse_dictamen / parse_dictamen_pdf.
+    
+    Args:
+        articulos: Artículos del dictamen ya parseados.
+    
+    Returns:
+        Diccionario título -> lista de Operation, en el orden de los artículos.
+    """
+    titulos_ops: DefaultDict[str, List[Operation]] = defaultdict(list)
     
     for articulo in articulos:
-        if articulo.titulo not in titulos_ops:
-            titulos_ops[articulo.titulo] = []
+        # Partir el texto una sola vez: la primera línea es el encabezado
+        lineas = articulo.texto_completo.split("\n") if articulo.texto_completo else None
         
         # Convertir a Operation para compatibilidad
         op = Operation(
             dictamen_articulo=articulo.dictamen_articulo,
-            encabezado=articulo.texto_completo.split("\n")[0] if articulo.texto_completo else "",
+            encabezado=lineas[0] if lineas else "",
             accion=articulo.objetivo_accion.accion,
             ley_numero=articulo.objetivo_accion.ley_afectada,
             destino_articulo=articulo.objetivo_accion.destino_articulo,
@@ -1211,11 +1498,113 @@ def parse_dictamen_pdf_legacy(pdf_path: str, fill_objetivo_accion: bool = True)
             destino_articulo_padre=articulo.objetivo_accion.destino_articulo_padre,
             destino_capitulo=articulo.objetivo_accion.destino_capitulo,
             texto_nuevo=articulo.texto_completo,  # Incluir todo como texto nuevo para compatibilidad
-            texto_nuevo_lineas=articulo.texto_completo.split("\n") if articulo.texto_completo else None,
+            texto_nuevo_lineas=lineas,
         )
         titulos_ops[articulo.titulo].append(op)
     
-    return titulos_ops
+    # Devolver un dict común: los títulos inexistentes siguen dando KeyError
+    return dict(titulos_ops)
+
+
+# ----------------------------
+# Procesamiento en lote
+# ----------------------------
+
+# Archivos por tarea enviados a cada worker y cantidad de resultados cacheados por hash
+PDF_BATCH_CHUNKSIZE = 4
+PDF_CACHE_SIZE = 32
+
+# Cache LRU: (sha256 del archivo, fill_objetivo_accion) -> artículos parseados
+_PDF_CACHE: "OrderedDict[Tuple[str, bool], List[DictamenArticulo]]" = OrderedDict()
+
+
+def _file_digest(path: str) -> str:
+    """Calcula el sha256 del contenido de un archivo."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _worker_init() -> None:
+    """
+    Inicializador de los procesos del pool de parse_dictamen_pdfs: importa el
+    extractor de PDF una sola vez por worker en lugar de hacerlo en el primer archivo.
+    Las regex del módulo ya quedan compiladas al importarlo.
+    """
+    try:
+        import pdfplumber  # type: ignore  # noqa: F401
+    except ImportError:
+        pass
+
+
+def _parse_one_pdf(task: Tuple[str, bool]) -> Tuple[str, List[DictamenArticulo]]:
+    """Parsea un PDF completo dentro de un worker (extracción secuencial de páginas)."""
+    pdf_path, fill_objetivo_accion = task
+    return pdf_path, parse_dictamen_pdf(pdf_path, fill_objetivo_accion=fill_objetivo_accion, workers=1)
+
+
+def parse_dictamen_pdfs(
+    pdf_paths: Iterable[str],
+    fill_objetivo_accion: bool = True,
+    processes: Optional[int] = None,
+) -> Dict[str, List[DictamenArticulo]]:
+    """
+    Parsea varios PDFs de dictámenes repartiéndolos entre procesos.
+    
+    Cada worker se inicializa una sola vez (importa el extractor de PDF) y
+    recibe los archivos en bloques vía imap_unordered. Los archivos con el mismo
+    contenido se parsean una única vez, y los resultados quedan en una cache LRU
+    por hash de archivo para evitar reparseos en llamadas posteriores.
+    
+    Args:
+        pdf_paths: Rutas a los PDFs de dictámenes.
+        fill_objetivo_accion: Ver parse_dictamen_pdf.
+        processes: Cantidad de procesos. None usa cpu_count; 1 procesa en serie.
+    
+    Returns:
+        Diccionario ruta -> lista de artículos del dictamen, en el orden de pdf_paths.
+        Cada lista es nueva, pero los DictamenArticulo se comparten con la cache
+        y no deben modificarse.
+    """
+    paths = list(pdf_paths)
+    digests = {path: _file_digest(path) for path in paths}
+
+    # Un archivo representativo por contenido que no esté en cache
+    por_digest: Dict[str, List[DictamenArticulo]] = {}
+    pending: Dict[str, str] = {}
+    for path in paths:
+        key = (digests[path], fill_objetivo_accion)
+        if key in _PDF_CACHE:
+            _PDF_CACHE.move_to_end(key)
+            por_digest[digests[path]] = _PDF_CACHE[key]
+        else:
+            pending.setdefault(digests[path], path)
+
+    tasks = [(path, fill_objetivo_accion) for path in pending.values()]
+    if processes is None:
+        processes = os.cpu_count() or 1
+    processes = min(processes, len(tasks))
+
+    if processes > 1:
+        chunksize = max(1, min(PDF_BATCH_CHUNKSIZE, len(tasks) // processes))
+        with mp.Pool(processes=processes, initializer=_worker_init) as pool:
+            parsed = dict(pool.imap_unordered(_parse_one_pdf, tasks, chunksize=chunksize))
+    else:
+        parsed = dict(_parse_one_pdf(task) for task in tasks)
+
+    for digest, path in pending.items():
+        por_digest[digest] = parsed[path]
+    # Armar el resultado antes de desalojar: la cache puede ser más chica que la llamada
+    resultado = {path: list(por_digest[digests[path]]) for path in paths}
+
+    for digest, path in pending.items():
+        _PDF_CACHE[(digest, fill_objetivo_accion)] = parsed[path]
+    while len(_PDF_CACHE) > PDF_CACHE_SIZE:
+        _PDF_CACHE.popitem(last=False)
+
+    return resultado
 
 
 # ----------------------------
@@ -1224,22 +1613,104 @@ def parse_dictamen_pdf_legacy(pdf_path: str, fill_objetivo_accion: bool = True)
 
 def _dictamen_articulo_to_dict(articulo: DictamenArticulo) -> Dict[str, Any]:
     """Convierte DictamenArticulo a diccionario para JSON."""
-    return {
-        "dictamen_articulo": articulo.dictamen_articulo,
-        "titulo": articulo.titulo,
-        "texto_completo": articulo.texto_completo,
-        "objetivo_accion": {
-            "tipo": articulo.objetivo_accion.tipo,
-            "ley_afectada": articulo.objetivo_accion.ley_afectada,
-            "accion": articulo.objetivo_accion.accion,
-            "destino_articulo": articulo.objetivo_accion.destino_articulo,
-            "destino_inciso": articulo.objetivo_accion.destino_inciso,
-            "destino_articulo_padre": articulo.objetivo_accion.destino_articulo_padre,
-            "destino_capitulo": articulo.objetivo_accion.destino_capitulo,
-            "descripcion": articulo.objetivo_accion.descripcion,
-            "texto_modificacion": articulo.objetivo_accion.texto_modificacion,
-        },
-    }
+    return articulo.to_dict()
+
+
+def _op_to_dict(op: Operation) -> Dict[str, Any]:
+    """Convierte Operation a diccionario para JSON (formato legacy por título)."""
+    return op.to_dict()
+
+
+def _procesar_pdf_cli(
+    pdf_path: str,
+    output: str,
+    pretty: bool,
+    por_titulo: bool,
+    fill_objetivo_accion: bool,
+    workers: Optional[int],
+) -> List[str]:
+    """
+    Parsea un PDF y escribe las salidas del CLI (texto normalizado + JSON).
+    
+    Returns:
+        Mensajes de resumen a mostrar, en orden.
+    """
+    mensajes: List[str] = []
+    # Extraer y normalizar una sola vez: las mismas líneas alimentan el parser
+    # y el archivo de texto normalizado
+    lines = normalize_lines(iter_pdf_lines(pdf_path, workers=workers))
+    articulos = parse_dictamen(lines, fill_objetivo_accion=fill_objetivo_accion)
+    
+    # Guardar archivo de texto plano normalizado (útil para debugging)
+    text_output = f"{output}_normalizado.txt"
+    with open(text_output, "w", encoding="utf-8") as f:
+        for i, line in enumerate(lines, 1):
+            f.write(f"{i:5d}|{line}\n")
+    mensajes.append(f"Archivo de texto normalizado guardado: {text_output}")
+
+    if por_titulo:
+        # Formato legacy: archivos por título
+        titulos_ops = articulos_to_titulos_ops(articulos)
+        total_ops = 0
+        for titulo_num, ops in titulos_ops.items():
+            payload: List[Dict[str, Any]] = [_op_to_dict(op) for op in ops]
+            output_file = f"{output}_titulo_{titulo_num}.json"
+            write_json(output_file, payload, pretty)
+            with_text = sum(1 for x in payload if x.get("texto_nuevo"))
+            mensajes.append(f"Título {titulo_num}: {len(payload)} operaciones ({with_text} con texto nuevo) -> {output_file}")
+            total_ops += len(payload)
+        mensajes.append(f"\nTotal de títulos encontrados: {len(titulos_ops)}")
+        mensajes.append(f"Total de operaciones: {total_ops}")
+    else:
+        # Formato nuevo: un único archivo con todos los artículos
+        output_file = f"{output}.json"
+        payload: List[Dict[str, Any]] = [_dictamen_articulo_to_dict(art) for art in articulos]
+        write_json(output_file, payload, pretty)
+        
+        mensajes.append(f"\nTotal de artículos del dictamen: {len(articulos)}")
+        mensajes.append(f"Archivo JSON generado: {output_file}")
+        
+        # Estadísticas por título
+        titulos_count: Dict[str, int] = {}
+        for art in articulos:
+            titulos_count[art.titulo] = titulos_count.get(art.titulo, 0) + 1
+        
+        mensajes.append(f"\nArtículos por título:")
+        for titulo in sorted(titulos_count.keys()):
+            mensajes.append(f"  Título {titulo}: {titulos_count[titulo]} artículos")
+    
+    return mensajes
+
+
+def _procesar_pdf_cli_tarea(
+    task: Tuple[str, str, bool, bool, bool, Optional[int]],
+) -> Tuple[str, List[str], Optional[str]]:
+    """
+    Adaptador de _procesar_pdf_cli para el pool del modo --batch.
+    
+    Un PDF que falla no corta el lote: el error se devuelve como texto (las
+    excepciones de los extractores no siempre se pueden serializar entre procesos).
+    
+    Returns:
+        (ruta del PDF, mensajes de resumen, error o None)
+    """
+    try:
+        return task[0], _procesar_pdf_cli(*task), None
+    except Exception as e:
+        return task[0], [], f"{type(e).__name__}: {e}"
+
+
+def _imprimir_lote(resultados: Iterable[Tuple[str, List[str], Optional[str]]]) -> int:
+    """Muestra el resumen de cada PDF del modo --batch y devuelve la cantidad de errores."""
+    errores = 0
+    for pdf, mensajes, error in resultados:
+        print(f"\n=== {pdf} ===")
+        if error is not None:
+            errores += 1
+            print(f"Error: {error}", file=sys.stderr)
+        else:
+            print("\n".join(mensajes))
+    return errores
 
 
 def main() -> None:
@@ -1255,6 +1726,9 @@ def main() -> None:
         
         # Generar archivos separados por título (formato legacy)
         python parser.py dictamen.pdf --por-titulo
+        
+        # Procesar varios dictámenes en paralelo (un proceso por PDF)
+        python parser.py a.pdf b.pdf c.pdf --batch -o salida
     """
     ap = argparse.ArgumentParser(
         description="Parsea dictámenes legislativos y extrae artículos con texto completo "
@@ -1265,9 +1739,10 @@ Ejemplos:
   %(prog)s dictamen.pdf -o salida --pretty
   %(prog)s dictamen.pdf --sin-objetivo-accion
   %(prog)s dictamen.pdf --por-titulo
+  %(prog)s a.pdf b.pdf --batch -o salida
         """
     )
-    ap.add_argument("pdf", help="Ruta al archivo PDF del dictamen.")
+    ap.add_argument("pdf", nargs="+", help="Ruta al archivo PDF del dictamen (varias con --batch).")
     ap.add_argument(
         "-o", "--output",
         default="dictamen_parseado",
@@ -1290,59 +1765,56 @@ Ejemplos:
         help="Generar objetivo_accion vacío (solo esquema con campos en None, sin datos parseados). "
              "Útil cuando el procesamiento de objetivo_accion se hará en una etapa posterior."
     )
+    ap.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Cantidad de procesos para extraer el texto del PDF. "
+             "Por defecto: min(8, núcleos disponibles). Usar 1 para extracción secuencial. "
+             "Con --batch: cantidad de PDFs procesados en paralelo (por defecto: núcleos disponibles)."
+    )
+    ap.add_argument(
+        "--batch",
+        action="store_true",
+        help="Procesar varios PDFs en paralelo, uno por proceso. Las salidas de cada PDF "
+             "usan el prefijo <output>_<nombre del PDF>."
+    )
     args = ap.parse_args()
 
     fill_objetivo_accion = not args.sin_objetivo_accion
-    articulos = parse_dictamen_pdf(args.pdf, fill_objetivo_accion=fill_objetivo_accion)
-    
-    # Guardar archivo de texto plano normalizado (útil para debugging)
-    raw = extract_lines_from_pdf(args.pdf)
-    lines = normalize_lines(raw)
-    text_output = f"{args.output}_normalizado.txt"
-    with open(text_output, "w", encoding="utf-8") as f:
-        for i, line in enumerate(lines, 1):
-            f.write(f"{i:5d}|{line}\n")
-    print(f"Archivo de texto normalizado guardado: {text_output}")
 
-    if args.por_titulo:
-        # Formato legacy: archivos por título
-        titulos_ops = parse_dictamen_pdf_legacy(args.pdf, fill_objetivo_accion=fill_objetivo_accion)
-        total_ops = 0
-        for titulo_num, ops in titulos_ops.items():
-            payload: List[Dict[str, Any]] = [asdict(op) for op in ops]
-            output_file = f"{args.output}_titulo_{titulo_num}.json"
-            with open(output_file, "w", encoding="utf-8") as f:
-                if args.pretty:
-                    json.dump(payload, f, ensure_ascii=False, indent=2)
-                else:
-                    json.dump(payload, f, ensure_ascii=False)
-            with_text = sum(1 for x in payload if x.get("texto_nuevo"))
-            print(f"Título {titulo_num}: {len(payload)} operaciones ({with_text} con texto nuevo) -> {output_file}")
-            total_ops += len(payload)
-        print(f"\nTotal de títulos encontrados: {len(titulos_ops)}")
-        print(f"Total de operaciones: {total_ops}")
+    if not args.batch:
+        if len(args.pdf) > 1:
+            ap.error("para procesar varios PDFs usar --batch")
+        for mensaje in _procesar_pdf_cli(
+            args.pdf[0], args.output, args.pretty, args.por_titulo, fill_objetivo_accion, args.workers
+        ):
+            print(mensaje)
+        return
+
+    # Modo lote: un proceso por PDF; cada worker escribe sus propios archivos
+    # con prefijo <output>_<nombre del PDF>
+    prefijos: Dict[str, List[str]] = defaultdict(list)
+    for pdf in args.pdf:
+        prefijos[f"{args.output}_{os.path.splitext(os.path.basename(pdf))[0]}"].append(pdf)
+    repetidos = [pdfs for pdfs in prefijos.values() if len(pdfs) > 1]
+    if repetidos:
+        # Dos PDFs con el mismo nombre escribirían los mismos archivos de salida
+        ap.error("PDFs con el mismo nombre de archivo en --batch: "
+                 + "; ".join(", ".join(pdfs) for pdfs in repetidos))
+    tasks = [
+        (pdfs[0], prefijo, args.pretty, args.por_titulo, fill_objetivo_accion, 1)
+        for prefijo, pdfs in prefijos.items()
+    ]
+    processes = min(args.workers or os.cpu_count() or 1, len(tasks))
+    if processes > 1:
+        with mp.Pool(processes=processes, initializer=_worker_init) as pool:
+            errores = _imprimir_lote(pool.imap_unordered(_procesar_pdf_cli_tarea, tasks))
     else:
-        # Formato nuevo: un único archivo con todos los artículos
-        output_file = f"{args.output}.json"
-        payload: List[Dict[str, Any]] = [_dictamen_articulo_to_dict(art) for art in articulos]
-        
-        with open(output_file, "w", encoding="utf-8") as f:
-            if args.pretty:
-                json.dump(payload, f, ensure_ascii=False, indent=2)
-            else:
-                json.dump(payload, f, ensure_ascii=False)
-        
-        print(f"\nTotal de artículos del dictamen: {len(articulos)}")
-        print(f"Archivo JSON generado: {output_file}")
-        
-        # Estadísticas por título
-        titulos_count: Dict[str, int] = {}
-        for art in articulos:
-            titulos_count[art.titulo] = titulos_count.get(art.titulo, 0) + 1
-        
-        print(f"\nArtículos por título:")
-        for titulo in sorted(titulos_count.keys()):
-            print(f"  Título {titulo}: {titulos_count[titulo]} artículos")
+        errores = _imprimir_lote(map(_procesar_pdf_cli_tarea, tasks))
+    print(f"\nPDFs procesados: {len(tasks) - errores} de {len(tasks)}")
+    if errores:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
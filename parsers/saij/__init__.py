@@ -1,6 +1,5 @@
 """Parser para convertir JSON oficial de SAIJ a formato estructurado."""
 
-from .parser import parse_saij_json, procesar_articulo
-
-__all__ = ["parse_saij_json", "procesar_articulo"]
+from .parser import parse_saij_json, procesar_articulo, ley_a_columnas, columnas_a_ley
 
+__all__ = ["parse_saij_json", "procesar_articulo", "ley_a_columnas", "columnas_a_ley"]
@@ -8,46 +8,98 @@ Convierte el JSON oficial (view-document.json) a un formato normalizado
 con títulos, capítulos y artículos estructurados.
 """
 
-import json
+import os
 import re
-from typing import Dict, Any, List, Optional
+import string
+import sys
+from itertools import chain
+from typing import Dict, Any, List, Optional, Tuple
+
+# Permite importar utils/ al ejecutar este archivo como script
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from utils.json_io import load_json, loads_json, write_json
+
+
+# Patrones compilados una sola vez al importar el módulo
+
+# Etiquetas [[p]], [[/p]], [[r uuid:...]], [[/r]]: una sola alternativa cubre
+# párrafos y referencias, así el texto se recorre una vez
+_TAG_ALL = re.compile(r'\[\[/?[pr][^\]]*\]\]')
+_WS_RE = re.compile(r'\s+')
+
+# Incisos: a) texto, b) texto, etc. (en líneas separadas o en el mismo párrafo)
+_INCISO_PAT1 = re.compile(r'([a-z])\)\s+([^a-z\)]+?)(?=\n|$|([a-z])\)|ARTICULO|\[\[)',
+                          re.IGNORECASE | re.MULTILINE | re.DOTALL)
+# Incisos después de [[p]]
+_INCISO_PAT2 = re.compile(r'\[\[p\]\]\s*([a-z])\)\s+([^\[]+?)(?=\[\[|$|([a-z])\)|ARTICULO)',
+                          re.IGNORECASE | re.MULTILINE | re.DOTALL)
+# Letras válidas de inciso en párrafos que empiezan con "a) ", "B) ", etc.
+_LETRAS_INCISO = frozenset(string.ascii_letters)
+
+# Particiones de la norma
+_TITULO_RE = re.compile(r'(?:TITULO|TÍTULO)\s+([IVXLCDM0-9]+|PRELIMINAR|UNICO|ÚNICO)[\.\s\-]*(.*)', re.IGNORECASE)
+_CAP_RE = re.compile(r'\*?\s*(?:CAPITULO|CAPÍTULO)\s+([IVXLCDM0-9]+)[\.\s\-]*(.*)', re.IGNORECASE)
+
+# Referencias normativas de un artículo SAIJ: (clave de origen, clave normalizada,
+# si el valor se normaliza a lista). "derogado-por" se copia tal cual.
+_REF_FIELDS = (
+    ('antecedentes', 'antecedentes', True),
+    ('modificado-por', 'modificado_por', True),
+    ('derogado-por', 'derogado_por', False),
+    ('observado-por', 'observado_por', True),
+    ('referencias-normativas', 'referencias_normativas', True),
+)
+# Claves de referencias normativas en un artículo ya normalizado
+_REF_KEYS = frozenset(('antecedentes', 'modificado_por', 'derogado_por', 'observado_por', 'referencias_normativas'))
+
+# Campos del artículo con columna propia en la representación columnar (ver ley_a_columnas)
+_ARTICULO_COLUMNAS = frozenset(('numero', 'titulo', 'texto', 'incisos'))
+
+
+def _as_list(valor: Any) -> List[Any]:
+    """
+    Normaliza un campo de SAIJ que puede venir como lista o como elemento único.
+    
+    Los campos repetibles traen un dict cuando tienen un solo elemento; None
+    (campo ausente) se trata como lista vacía.
+    """
+    if type(valor) is list:
+        return valor
+    return [valor] if valor is not None else []
 
 
 def limpiar_texto(texto: str) -> str:
     """Limpia el texto de etiquetas HTML/XML."""
     if not texto:
         return ""
-    # Remover etiquetas [[p]], [[/p]], [[r uuid:...]], etc.
-    texto = re.sub(r'\[\[/?(p|r|/r)[^\]]*\]\]', '', texto)
-    # Remover referencias [[r uuid:...]]
-    texto = re.sub(r'\[\[r[^\]]+\]\]', '', texto)
+    # Remover etiquetas [[p]], [[/p]] y referencias [[r uuid:...]]
+    texto = _TAG_ALL.sub('', texto)
     # Normalizar espacios
-    texto = re.sub(r'\s+', ' ', texto)
+    texto = _WS_RE.sub(' ', texto)
     return texto.strip()
 
 
 def procesar_incisos(texto: str) -> List[Dict[str, str]]:
     """Extrae incisos del texto del artículo."""
     incisos = []
-    if not texto:
+    # Todo inciso tiene la forma "a)": sin ")" no hay nada que buscar
+    if not texto or ')' not in texto:
         return incisos
     
     # Primero limpiar el texto pero preservar estructura de incisos
     texto_limpio = texto
     
-    # Buscar patrones: a) texto, b) texto, etc.
-    # Los incisos pueden estar en líneas separadas o en el mismo párrafo
-    patron = re.compile(r'([a-z])\)\s+([^a-z\)]+?)(?=\n|$|([a-z])\)|ARTICULO|\[\[)', 
-                       re.IGNORECASE | re.MULTILINE | re.DOTALL)
-    
-    # También buscar después de [[p]]
-    patron2 = re.compile(r'\[\[p\]\]\s*([a-z])\)\s+([^\[]+?)(?=\[\[|$|([a-z])\)|ARTICULO)', 
-                        re.IGNORECASE | re.MULTILINE | re.DOTALL)
-    
-    matches = list(patron.finditer(texto_limpio)) + list(patron2.finditer(texto_limpio))
+    # Buscar patrones: a) texto, b) texto, etc., y también después de [[p]]
+    # (_INCISO_PAT2 exige "[[p]]" en mayúsculas o minúsculas: si no aparece no hace
+    # falta recorrer el texto)
+    matches = _INCISO_PAT1.finditer(texto_limpio)
+    if '[[p]]' in texto_limpio or '[[P]]' in texto_limpio:
+        matches = chain(matches, _INCISO_PAT2.finditer(texto_limpio))
     
     for match in matches:
-        letra = match.group(1).lower()
+        # Hay a lo sumo 26 letras distintas: internarlas evita una copia por inciso
+        letra = sys.intern(match.group(1).lower())
         texto_inciso = match.group(2).strip()
         texto_inciso = limpiar_texto(texto_inciso)
         if texto_inciso:
@@ -59,14 +111,15 @@ def procesar_incisos(texto: str) -> List[Dict[str, str]]:
     # Si no encontró con regex, buscar manualmente
     if not incisos:
         # Dividir por [[p]] y buscar incisos
-        partes = re.split(r'\[\[p\]\]', texto_limpio)
+        partes = texto_limpio.split('[[p]]')
         for parte in partes:
             parte = parte.replace('[[/p]]', '').strip()
-            match_inciso = re.match(r'^([a-z])\)\s+(.+)$', parte, re.IGNORECASE | re.DOTALL)
-            if match_inciso:
+            # Letra, ")" y espacio: como la parte ya está recortada, después del
+            # espacio queda al menos un carácter de texto
+            if len(parte) > 2 and parte[1] == ')' and parte[0] in _LETRAS_INCISO and parte[2].isspace():
                 incisos.append({
-                    "letra": match_inciso.group(1).lower(),
-                    "texto": limpiar_texto(match_inciso.group(2))
+                    "letra": sys.intern(parte[0].lower()),
+                    "texto": limpiar_texto(parte[3:])
                 })
     
     return incisos
@@ -94,44 +147,17 @@ def procesar_articulo(art: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         articulo['incisos'] = incisos
     
     # Procesar referencias normativas
-    if 'antecedentes' in art:
-        refs = art['antecedentes']
-        if isinstance(refs, dict) and 'referencia-normativa' in refs:
-            ref_norm = refs['referencia-normativa']
-            articulo['antecedentes'] = ref_norm if isinstance(ref_norm, list) else [ref_norm]
-        elif isinstance(refs, list):
-            articulo['antecedentes'] = refs
-    
-    if 'modificado-por' in art:
-        modif = art['modificado-por']
-        if isinstance(modif, dict) and 'referencia-normativa' in modif:
-            ref_norm = modif['referencia-normativa']
-            articulo['modificado_por'] = ref_norm if isinstance(ref_norm, list) else [ref_norm]
-        elif isinstance(modif, list):
-            articulo['modificado_por'] = modif
-    
-    if 'derogado-por' in art:
-        der = art['derogado-por']
-        if isinstance(der, dict) and 'referencia-normativa' in der:
-            articulo['derogado_por'] = der['referencia-normativa']
-        else:
-            articulo['derogado_por'] = der
-    
-    if 'observado-por' in art:
-        obs = art['observado-por']
-        if isinstance(obs, dict) and 'referencia-normativa' in obs:
-            ref_norm = obs['referencia-normativa']
-            articulo['observado_por'] = ref_norm if isinstance(ref_norm, list) else [ref_norm]
-        elif isinstance(obs, list):
-            articulo['observado_por'] = obs
-    
-    if 'referencias-normativas' in art:
-        refs = art['referencias-normativas']
-        if isinstance(refs, dict) and 'referencia-normativa' in refs:
-            ref_norm = refs['referencia-normativa']
-            articulo['referencias_normativas'] = ref_norm if isinstance(ref_norm, list) else [ref_norm]
-        elif isinstance(refs, list):
-            articulo['referencias_normativas'] = refs
+    for clave_src, clave_dst, como_lista in _REF_FIELDS:
+        if clave_src not in art:
+            continue
+        valor = art[clave_src]
+        if isinstance(valor, dict) and 'referencia-normativa' in valor:
+            ref_norm = valor['referencia-normativa']
+            if como_lista and not isinstance(ref_norm, list):
+                ref_norm = [ref_norm]
+            articulo[clave_dst] = ref_norm
+        elif not como_lista or isinstance(valor, list):
+            articulo[clave_dst] = valor
     
     if 'observa-a' in art:
         articulo['observa_a'] = art['observa-a']
@@ -143,16 +169,42 @@ def procesar_articulo(art: Dict[str, Any]) -> Optional[Dict[str, Any]]:
 
 
 def limpiar_estructura(obj: Any) -> None:
-    """Elimina arrays vacíos de la estructura."""
-    if isinstance(obj, dict):
-        for key in list(obj.keys()):
-            if isinstance(obj[key], list) and not obj[key]:
-                del obj[key]
-            else:
-                limpiar_estructura(obj[key])
-    elif isinstance(obj, list):
-        for item in obj:
-            limpiar_estructura(item)
+    """
+    Elimina arrays vacíos de la estructura.
+    
+    Recorre el árbol con una pila explícita en lugar de recursión: evita el costo
+    de una llamada por nodo y el límite de recursión en estructuras muy anidadas.
+    """
+    pila = [obj]
+    while pila:
+        actual = pila.pop()
+        if isinstance(actual, dict):
+            for key in list(actual):
+                valor = actual[key]
+                if isinstance(valor, list) and not valor:
+                    del actual[key]
+                elif isinstance(valor, (dict, list)):
+                    pila.append(valor)
+        elif isinstance(actual, list):
+            pila.extend(actual)
+
+
+def _leer_documento(input_path: str) -> Tuple[Dict[str, Any], Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    Lee el documento de SAIJ y devuelve (metadata, content, segmentos).
+    
+    'data' puede venir como objeto o como string con JSON anidado.
+    """
+    data = load_json(input_path)
+    raw_data = data.get('data')
+    if isinstance(raw_data, str):
+        doc_data = loads_json(raw_data)
+    else:
+        doc_data = raw_data
+
+    document = doc_data['document']
+    content = document['content']
+    return document['metadata'], content, content.get('segmento', [])
 
 
 def parse_saij_json(input_path: str) -> Dict[str, Any]:
@@ -165,18 +217,7 @@ def parse_saij_json(input_path: str) -> Dict[str, Any]:
     Returns:
         Diccionario con la estructura de la ley normalizada
     """
-    with open(input_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-
-    raw_data = data.get('data')
-    if isinstance(raw_data, str):
-        doc_data = json.loads(raw_data)
-    else:
-        doc_data = raw_data
-
-    document = doc_data['document']
-    metadata = document['metadata']
-    content = document['content']
+    metadata, content, segmentos = _leer_documento(input_path)
 
     # Crear estructura principal
     ley_estructurada = {
@@ -207,9 +248,6 @@ def parse_saij_json(input_path: str) -> Dict[str, Any]:
         }
     }
 
-    # Procesar todos los segmentos
-    segmentos = content.get('segmento', [])
-
     # Si hay artículos directos en content (fuera de segmentos), agregarlos a un título genérico
     if 'articulo' in content:
         titulo_obj = {
@@ -218,20 +256,18 @@ def parse_saij_json(input_path: str) -> Dict[str, Any]:
             "capitulos": [],
             "articulos": []
         }
-        arts = content['articulo']
-        if not isinstance(arts, list):
-            arts = [arts]
-        for art in arts:
+        for art in _as_list(content['articulo']):
             art_procesado = procesar_articulo(art)
             if art_procesado:
                 titulo_obj['articulos'].append(art_procesado)
         ley_estructurada['ley']['titulos'].append(titulo_obj)
 
+    # Procesar todos los segmentos
     for segmento in segmentos:
         titulo_particion = segmento.get('titulo-particion', '')
         
         # Detectar TÍTULO con regex más permisivo
-        match_titulo = re.match(r'(?:TITULO|TÍTULO)\s+([IVXLCDM0-9]+|PRELIMINAR|UNICO|ÚNICO)[\.\s\-]*(.*)', titulo_particion, re.IGNORECASE)
+        match_titulo = _TITULO_RE.match(titulo_particion)
         
         if match_titulo:
             numero_titulo = match_titulo.group(1)
@@ -250,21 +286,17 @@ def parse_saij_json(input_path: str) -> Dict[str, Any]:
         }
         
         # Procesar artículos directos
-        if 'articulo' in segmento:
-            arts = segmento['articulo']
-            if not isinstance(arts, list):
-                arts = [arts]
-            for art in arts:
-                art_procesado = procesar_articulo(art)
-                if art_procesado:
-                    titulo_obj['articulos'].append(art_procesado)
+        for art in _as_list(segmento.get('articulo')):
+            art_procesado = procesar_articulo(art)
+            if art_procesado:
+                titulo_obj['articulos'].append(art_procesado)
         
         # Procesar sub-segmentos (capítulos)
         if 'segmento' in segmento:
             for sub_seg in segmento['segmento']:
                 cap_titulo = sub_seg.get('titulo-particion', '')
                 # Múltiples patrones para capítulos
-                match_cap = (re.match(r'\*?\s*(?:CAPITULO|CAPÍTULO)\s+([IVXLCDM0-9]+)[\.\s\-]*(.*)', cap_titulo, re.IGNORECASE))
+                match_cap = _CAP_RE.match(cap_titulo)
                 
                 if match_cap:
                     numero_cap = match_cap.group(1)
@@ -280,14 +312,10 @@ def parse_saij_json(input_path: str) -> Dict[str, Any]:
                 }
                 
                 # Procesar artículos del capítulo
-                if 'articulo' in sub_seg:
-                    arts = sub_seg['articulo']
-                    if not isinstance(arts, list):
-                        arts = [arts]
-                    for art in arts:
-                        art_procesado = procesar_articulo(art)
-                        if art_procesado:
-                            capitulo_obj['articulos'].append(art_procesado)
+                for art in _as_list(sub_seg.get('articulo')):
+                    art_procesado = procesar_articulo(art)
+                    if art_procesado:
+                        capitulo_obj['articulos'].append(art_procesado)
                 
                 # Solo agregar capítulo si tiene artículos o nombre relevante
                 if capitulo_obj['articulos'] or match_cap:
@@ -303,6 +331,110 @@ def parse_saij_json(input_path: str) -> Dict[str, Any]:
     return ley_estructurada
 
 
+def ley_a_columnas(ley_estructurada: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convierte la estructura anidada en tablas columnares (una lista por campo).
+    
+    En lugar de un dict por artículo y por inciso, cada tabla guarda una lista por
+    campo y las relaciones se expresan con índices: muchos menos objetos chicos
+    para recorrer, serializar o cargar en un DataFrame. columnas_a_ley hace la
+    conversión inversa.
+    
+    Args:
+        ley_estructurada: Resultado de parse_saij_json.
+    
+    Returns:
+        Diccionario con "ley" (metadatos, sin títulos) y las tablas "titulos",
+        "capitulos" (titulo_idx), "articulos" (titulo_idx, capitulo_idx o None,
+        y "extra" con las referencias normativas u otros campos) e "incisos"
+        (articulo_idx).
+    """
+    ley = ley_estructurada['ley']
+    titulos: Dict[str, List[Any]] = {"numero": [], "nombre": []}
+    capitulos: Dict[str, List[Any]] = {"titulo_idx": [], "numero": [], "nombre": []}
+    articulos: Dict[str, List[Any]] = {
+        "titulo_idx": [], "capitulo_idx": [], "numero": [], "titulo": [], "texto": [], "extra": []
+    }
+    incisos: Dict[str, List[Any]] = {"articulo_idx": [], "letra": [], "texto": []}
+
+    def agregar_articulos(arts: List[Dict[str, Any]], titulo_idx: int, capitulo_idx: Optional[int]) -> None:
+        for art in arts:
+            articulo_idx = len(articulos["numero"])
+            articulos["titulo_idx"].append(titulo_idx)
+            articulos["capitulo_idx"].append(capitulo_idx)
+            articulos["numero"].append(art['numero'])
+            articulos["titulo"].append(art['titulo'])
+            articulos["texto"].append(art['texto'])
+            extra = {k: v for k, v in art.items() if k not in _ARTICULO_COLUMNAS}
+            articulos["extra"].append(extra or None)
+            for inciso in art.get('incisos', ()):
+                incisos["articulo_idx"].append(articulo_idx)
+                incisos["letra"].append(inciso['letra'])
+                incisos["texto"].append(inciso['texto'])
+
+    for titulo_idx, titulo in enumerate(ley.get('titulos', ())):
+        titulos["numero"].append(titulo['numero'])
+        titulos["nombre"].append(titulo['nombre'])
+        agregar_articulos(titulo.get('articulos', ()), titulo_idx, None)
+        for cap in titulo.get('capitulos', ()):
+            capitulos["titulo_idx"].append(titulo_idx)
+            capitulos["numero"].append(cap['numero'])
+            capitulos["nombre"].append(cap['nombre'])
+            agregar_articulos(cap.get('articulos', ()), titulo_idx, len(capitulos["numero"]) - 1)
+
+    return {
+        "ley": {k: v for k, v in ley.items() if k != 'titulos'},
+        "titulos": titulos,
+        "capitulos": capitulos,
+        "articulos": articulos,
+        "incisos": incisos,
+    }
+
+
+def columnas_a_ley(columnas: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Reconstruye la estructura anidada de parse_saij_json a partir de ley_a_columnas.
+    
+    Args:
+        columnas: Resultado de ley_a_columnas.
+    
+    Returns:
+        Diccionario {"ley": {...}} igual al que devuelve parse_saij_json.
+    """
+    titulos_cols = columnas['titulos']
+    capitulos_cols = columnas['capitulos']
+    articulos_cols = columnas['articulos']
+    incisos_cols = columnas['incisos']
+
+    incisos_por_articulo: Dict[int, List[Dict[str, str]]] = {}
+    for articulo_idx, letra, texto in zip(incisos_cols['articulo_idx'], incisos_cols['letra'], incisos_cols['texto']):
+        incisos_por_articulo.setdefault(articulo_idx, []).append({"letra": letra, "texto": texto})
+
+    titulos = [{"numero": numero, "nombre": nombre} for numero, nombre in zip(titulos_cols['numero'], titulos_cols['nombre'])]
+    capitulos = []
+    for titulo_idx, numero, nombre in zip(capitulos_cols['titulo_idx'], capitulos_cols['numero'], capitulos_cols['nombre']):
+        capitulo = {"numero": numero, "nombre": nombre}
+        capitulos.append(capitulo)
+        titulos[titulo_idx].setdefault('capitulos', []).append(capitulo)
+
+    for articulo_idx, (titulo_idx, capitulo_idx, numero, titulo, texto, extra) in enumerate(zip(
+        articulos_cols['titulo_idx'], articulos_cols['capitulo_idx'], articulos_cols['numero'],
+        articulos_cols['titulo'], articulos_cols['texto'], articulos_cols['extra'],
+    )):
+        articulo = {"numero": numero, "titulo": titulo, "texto": texto}
+        if articulo_idx in incisos_por_articulo:
+            articulo['incisos'] = incisos_por_articulo[articulo_idx]
+        if extra:
+            articulo.update(extra)
+        contenedor = titulos[titulo_idx] if capitulo_idx is None else capitulos[capitulo_idx]
+        contenedor.setdefault('articulos', []).append(articulo)
+
+    ley = dict(columnas['ley'])
+    if titulos:
+        ley['titulos'] = titulos
+    return {"ley": ley}
+
+
 def main() -> None:
     """CLI para convertir JSON de SAIJ."""
     import argparse
@@ -312,17 +444,15 @@ def main() -> None:
     ap.add_argument("-o", "--output", default="ley_contrato_trabajo_oficial_completa.json", 
                     help="Archivo JSON de salida")
     ap.add_argument("--pretty", action="store_true", help="JSON con indentación")
+    ap.add_argument("--columnar", action="store_true",
+                    help="Guardar tablas columnares (una lista por campo) en lugar de la estructura anidada")
     args = ap.parse_args()
 
     print(f"Procesando {args.input}...")
     ley_estructurada = parse_saij_json(args.input)
 
     # Guardar JSON completo
-    with open(args.output, 'w', encoding='utf-8') as f:
-        if args.pretty:
-            json.dump(ley_estructurada, f, ensure_ascii=False, indent=2)
-        else:
-            json.dump(ley_estructurada, f, ensure_ascii=False)
+    write_json(args.output, ley_a_columnas(ley_estructurada) if args.columnar else ley_estructurada, args.pretty)
 
     # Estadísticas
     print("=" * 70)
@@ -336,49 +466,52 @@ def main() -> None:
     total_capitulos = 0
     total_incisos = 0
     articulos_con_referencias = 0
+    # Líneas del detalle por título, armadas en el mismo recorrido que los totales
+    lineas_titulos = []
 
     for titulo in titulos_lista:
-        total_articulos += len(titulo.get('articulos', []))
-        total_capitulos += len(titulo.get('capitulos', []))
+        articulos_titulo = titulo.get('articulos', [])
+        capitulos = titulo.get('capitulos', [])
+        arts_titulo = len(articulos_titulo)
+        total_capitulos += len(capitulos)
         
-        for art in titulo.get('articulos', []):
+        for art in articulos_titulo:
             total_incisos += len(art.get('incisos', []))
-            if any(key in art for key in ['antecedentes', 'modificado_por', 'derogado_por', 'observado_por', 'referencias_normativas']):
+            if not _REF_KEYS.isdisjoint(art):
                 articulos_con_referencias += 1
         
-        for cap in titulo.get('capitulos', []):
-            total_articulos += len(cap.get('articulos', []))
-            for art in cap.get('articulos', []):
-                total_incisos += len(art.get('incisos', []))
-                if any(key in art for key in ['antecedentes', 'modificado_por', 'derogado_por', 'observado_por', 'referencias_normativas']):
-                    articulos_con_referencias += 1
-
-    print(f"Total de capítulos: {total_capitulos}")
-    print(f"Total de artículos: {total_articulos}")
-    print(f"Total de incisos: {total_incisos}")
-    print(f"Artículos con referencias normativas: {articulos_con_referencias}")
-    print("=" * 70)
-    print("\nEstructura por título:")
-    for titulo in titulos_lista:
-        arts_titulo = len(titulo.get('articulos', []))
-        capitulos = titulo.get('capitulos', [])
-        
         # Construir lista de artículos por capítulo
         partes = []
         if arts_titulo > 0:
             partes.append(str(arts_titulo))
         
+        total = arts_titulo
         for cap in capitulos:
-            arts_cap = len(cap.get('articulos', []))
+            articulos_cap = cap.get('articulos', [])
+            arts_cap = len(articulos_cap)
+            total += arts_cap
             if arts_cap > 0:
                 partes.append(str(arts_cap))
+            for art in articulos_cap:
+                total_incisos += len(art.get('incisos', []))
+                if not _REF_KEYS.isdisjoint(art):
+                    articulos_con_referencias += 1
+        total_articulos += total
         
-        total = arts_titulo + sum(len(cap.get('articulos', [])) for cap in capitulos)
         if partes:
             descripcion = " + ".join(partes)
-            print(f"  Título {titulo['numero']}: {descripcion} = {total} arts")
+            lineas_titulos.append(f"  Título {titulo['numero']}: {descripcion} = {total} arts")
         else:
-            print(f"  Título {titulo['numero']}: 0 arts")
+            lineas_titulos.append(f"  Título {titulo['numero']}: 0 arts")
+
+    print(f"Total de capítulos: {total_capitulos}")
+    print(f"Total de artículos: {total_articulos}")
+    print(f"Total de incisos: {total_incisos}")
+    print(f"Artículos con referencias normativas: {articulos_con_referencias}")
+    print("=" * 70)
+    print("\nEstructura por título:")
+    if lineas_titulos:
+        print("\n".join(lineas_titulos))
     print("=" * 70)
 
 
@@ -23,16 +23,46 @@ Uso desde línea de comandos:
     
     # Con UUID directo (opcional, si la búsqueda automática falla)
     python scraper.py 20744 --uuid "123456789-0abc-defg-g61-50000scanyel"
+    
+    # Varias leyes a la vez (en paralelo si aiohttp está instalado)
+    python scraper.py 20744 26206 24013 --directorio "data"
 """
 
-import re
+import os
+import stat
 import json
+import time
+import asyncio
+import hashlib
 import logging
+import functools
+import tempfile
+from email.message import Message
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Awaitable, Callable, Iterable, Union
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # orjson es opcional: se usa json de la biblioteca estándar
+    orjson = None
+
+try:
+    import aiohttp  # type: ignore
+except ImportError:  # aiohttp es opcional: sin él las descargas en lote son secuenciales
+    aiohttp = None
+
+try:
+    import brotli  # type: ignore  # noqa: F401
+except ImportError:  # brotli es opcional: urllib3/aiohttp lo usan para decodificar 'br'
+    try:
+        import brotlicffi as brotli  # type: ignore  # noqa: F401
+    except ImportError:
+        brotli = None
 
 
 logging.basicConfig(
@@ -46,85 +76,288 @@ BASE_URL = "https://www.saij.gob.ar"
 SEARCH_URL = f"{BASE_URL}/busqueda"
 VIEW_DOCUMENT_URL = f"{BASE_URL}/view-document"
 
+# Solo se anuncia 'br' si hay un decodificador Brotli instalado (comprime el JSON
+# de los documentos bastante más que gzip)
+ACCEPT_ENCODING = 'br, gzip, deflate' if brotli is not None else 'gzip, deflate'
+
+
+# Reintentos ante errores transitorios de SAIJ, comunes a la sesión de requests y a aiohttp
+REINTENTOS = 5
+REINTENTOS_BACKOFF = 0.5
+REINTENTOS_ESTADOS = (429, 500, 502, 503, 504)
 
-def buscar_ley_json(numero_norma: int) -> list[str]:
+
+def crear_sesion() -> requests.Session:
     """
-    Busca una ley por número de norma en SAIJ y devuelve los UUIDs de los documentos encontrados.
+    Crea una sesión HTTP con conexiones keep-alive y reintentos ante errores transitorios.
     
-    La búsqueda devuelve un JSON con los resultados. De ese JSON se extraen los UUIDs
-    de los documentos en searchResults.documentResultList.
+    Reutilizar la sesión entre la búsqueda y la descarga del documento (y entre
+    leyes, al descargar en lote) evita repetir el handshake TCP/TLS con SAIJ en
+    cada petición.
     
-    Args:
-        numero_norma: Número de la norma a buscar (ej: 20744)
-        
     Returns:
-        Lista de UUIDs de los documentos encontrados
-        
-    Raises:
-        requests.RequestException: Si hay un error en la petición HTTP
-        ValueError: Si no se encuentran resultados o la respuesta no es válida
+        Sesión de requests con el adaptador montado para https://
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=REINTENTOS,
+        backoff_factor=REINTENTOS_BACKOFF,
+        status_forcelist=REINTENTOS_ESTADOS,
+    )
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry))
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (compatible; lct-saij-scraper)',
+        'Accept-Encoding': ACCEPT_ENCODING,
+    })
+    return session
+
+
+# Sesión compartida por defecto entre todas las peticiones del módulo
+SESSION = crear_sesion()
+
+# Decodificador JSON: orjson acepta str o bytes (evita detectar la codificación de la respuesta)
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+# Caché en disco de respuestas de SAIJ (búsquedas y documentos)
+CACHE_DIR = Path('.cache') / 'saij'
+CACHE_TTL = 7 * 24 * 3600
+# La CLI la ajusta con --no-cache (no leer ni escribir) y --refresh (no leer, sí escribir)
+CACHE_CONFIG = {'habilitada': True, 'refrescar': False}
+
+# Headers de la respuesta del documento que se guardan junto al JSON
+_HEADERS_CACHEADOS = ('Content-Disposition', 'Content-Type')
+
+
+class _RespuestaCacheada:
+    """Sustituto mínimo de la respuesta HTTP cuando el documento sale de la caché (solo headers)."""
+
+    def __init__(self, headers: Dict[str, str]):
+        self.headers = CaseInsensitiveDict(headers)
+
+
+def _ruta_cache(clave: str, args: tuple, kwargs: Dict[str, Any]) -> Path:
+    """Ruta del archivo de caché para una llamada (ignora sesiones y otros argumentos no escalares)."""
+    partes = [clave]
+    partes.extend(a for a in args if isinstance(a, (str, int, float)))
+    partes.extend(f"{k}={v}" for k, v in sorted(kwargs.items()) if isinstance(v, (str, int, float)))
+    digest = hashlib.sha1(json.dumps(partes, ensure_ascii=False).encode('utf-8')).hexdigest()
+    return CACHE_DIR / f"{digest}.json"
+
+
+def _leer_cache(ruta: Path, ttl: float) -> Optional[Any]:
+    """Devuelve el contenido cacheado si existe y no venció; None si no."""
+    if not CACHE_CONFIG['habilitada'] or CACHE_CONFIG['refrescar']:
+        return None
+    try:
+        if time.time() - os.path.getmtime(ruta) >= ttl:
+            return None
+        with open(ruta, 'r', encoding='utf-8') as f:
+            contenido = json.load(f)
+    except (OSError, ValueError):
+        return None
+    logger.info(f"Usando respuesta cacheada: {ruta}")
+    return contenido
+
+
+def _escribir_cache(ruta: Path, contenido: Any) -> None:
+    """Guarda contenido en la caché de forma atómica (archivo temporal + os.replace)."""
+    if not CACHE_CONFIG['habilitada']:
+        return
+    try:
+        ruta.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=ruta.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(contenido, f, ensure_ascii=False)
+            os.replace(tmp, ruta)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except OSError as e:
+        logger.warning(f"No se pudo escribir la caché {ruta}: {e}")
+
+
+def disk_cache(clave: str, ttl: float = CACHE_TTL,
+               a_json: Optional[Callable[[Any], Any]] = None,
+               desde_json: Optional[Callable[[Any], Any]] = None) -> Callable:
     """
+    Decorador que memoiza en disco (CACHE_DIR) el resultado de una petición a SAIJ.
+    
+    La clave es `clave` más los argumentos escalares de la llamada (número de
+    norma, UUID), así que la versión síncrona y la asíncrona de una misma
+    petición comparten entradas. Funciona también sobre funciones async.
+    
+    Args:
+        clave: Nombre lógico de la petición (p. ej. 'busqueda', 'documento')
+        ttl: Segundos de validez de una entrada (según su mtime)
+        a_json: Convierte el resultado en algo serializable (None = se guarda tal cual)
+        desde_json: Reconstruye el resultado desde lo guardado (None = se devuelve tal cual)
+    """
+    def guardar(ruta: Path, resultado: Any) -> None:
+        _escribir_cache(ruta, a_json(resultado) if a_json else resultado)
+
+    def cargar(contenido: Any) -> Any:
+        return desde_json(contenido) if desde_json else contenido
+
+    def decorador(func: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def envoltura_async(*args, **kwargs):
+                ruta = _ruta_cache(clave, args, kwargs)
+                contenido = _leer_cache(ruta, ttl)
+                if contenido is not None:
+                    return cargar(contenido)
+                resultado = await func(*args, **kwargs)
+                await asyncio.to_thread(guardar, ruta, resultado)
+                return resultado
+            return envoltura_async
+
+        @functools.wraps(func)
+        def envoltura(*args, **kwargs):
+            ruta = _ruta_cache(clave, args, kwargs)
+            contenido = _leer_cache(ruta, ttl)
+            if contenido is not None:
+                return cargar(contenido)
+            resultado = func(*args, **kwargs)
+            guardar(ruta, resultado)
+            return resultado
+        return envoltura
+
+    return decorador
+
+
+def _documento_a_json(resultado: tuple) -> Dict[str, Any]:
+    """Serializa (datos, response) de una descarga de documento para la caché."""
+    data, response = resultado
+    headers = {k: response.headers[k] for k in _HEADERS_CACHEADOS if k in response.headers}
+    return {'data': data, 'headers': headers}
+
+
+def _documento_desde_json(contenido: Dict[str, Any]) -> tuple:
+    """Reconstruye (datos, respuesta con headers) desde la caché."""
+    return contenido['data'], _RespuestaCacheada(contenido['headers'])
+
+
+_cache_busqueda = disk_cache('busqueda')
+_cache_documento = disk_cache('documento', a_json=_documento_a_json, desde_json=_documento_desde_json)
+
+
+def _url_busqueda(numero_norma: int) -> str:
+    """Construye la URL del buscador de SAIJ para un número de norma."""
     r_param = f'(numero-norma:{numero_norma})'
-    full_url = f"{SEARCH_URL}?r={r_param}&o=0&p=25&f=Total%7CTipo+de+Documento%2FLegislaci%C3%B3n%2FLey%7CFecha%7COrganismo%7CPublicaci%C3%B3n%7CTema%7CEstado+de+Vigencia%2FVigente%2C+de+alcance+general%7CAutor%7CJurisdicci%C3%B3n%2FNacional&s=&v=colapsa"
+    return f"{SEARCH_URL}?r={r_param}&o=0&p=25&f=Total%7CTipo+de+Documento%2FLegislaci%C3%B3n%2FLey%7CFecha%7COrganismo%7CPublicaci%C3%B3n%7CTema%7CEstado+de+Vigencia%2FVigente%2C+de+alcance+general%7CAutor%7CJurisdicci%C3%B3n%2FNacional&s=&v=colapsa"
     # full_url = "https://www.saij.gob.ar/busqueda?r=(numero-norma%3A20744+)&o=0&p=25&f=Total%7CTipo+de+Documento%2FLegislaci%C3%B3n%2FLey%7CFecha%7COrganismo%7CPublicaci%C3%B3n%7CTema%7CEstado+de+Vigencia%2FVigente%2C+de+alcance+general%7CAutor%7CJurisdicci%C3%B3n%2FNacional&s=&v=colapsada"
 
-    logger.info(f"Buscando ley número {numero_norma} en SAIJ...")
-    logger.info(f"URL de búsqueda: {full_url}")
-    print(f"\n=== BÚSQUEDA DE LEY {numero_norma} ===")
-    print(f"URL: {full_url}")
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _extraer_objeto_json_alrededor(texto: str, ancla: str = '"searchResults"') -> Optional[Dict[str, Any]]:
+    """
+    Extrae el objeto JSON que contiene la clave `ancla`, embebido en un texto arbitrario.
     
-    response = requests.get(full_url, timeout=30)
-    response.raise_for_status()
+    Para cada aparición del ancla recorre hacia atrás las llaves `{` candidatas
+    (de la más cercana a la más lejana) y decodifica desde cada una con
+    JSONDecoder.raw_decode, que respeta strings y anidamiento. Se devuelve el
+    primer objeto que termina después del ancla y la tiene como clave propia:
+    el objeto que la encierra, sin depender de regex con backtracking.
+    
+    Args:
+        texto: Texto donde buscar (script, HTML, etc.)
+        ancla: Clave JSON (con comillas) que debe tener el objeto buscado
+        
+    Returns:
+        El objeto decodificado, o None si no hay ninguno válido
+    """
+    clave = ancla.strip('"')
+    pos_ancla = texto.find(ancla)
+    while pos_ancla != -1:
+        inicio = texto.rfind('{', 0, pos_ancla)
+        while inicio != -1:
+            try:
+                obj, fin = _JSON_DECODER.raw_decode(texto, inicio)
+            except ValueError:
+                obj, fin = None, -1
+            if fin > pos_ancla and isinstance(obj, dict) and clave in obj:
+                return obj
+            inicio = texto.rfind('{', 0, inicio)
+        pos_ancla = texto.find(ancla, pos_ancla + len(ancla))
+    return None
+
+
+def _extraer_json_embebido(texto: str) -> Optional[Dict[str, Any]]:
+    """
+    Busca el JSON de resultados embebido en una página HTML.
     
-    print(f"Status Code: {response.status_code}")
-    print(f"Content-Type: {response.headers.get('Content-Type', 'N/A')}")
+    Se localiza la clave con un único str.find (sin recorrer los <script> con
+    regex) y solo si aparece se decodifica el objeto que la encierra.
     
-    # Intentar parsear como JSON directamente
-    json_data = None
-    try:
-        json_data = response.json()
-        print("✓ Respuesta es JSON directo")
-    except (ValueError, json.JSONDecodeError):
-        # Si no es JSON, buscar JSON embebido en scripts
-        print("Respuesta no es JSON directo, buscando JSON embebido...")
-        soup = BeautifulSoup(response.text, 'lxml')
+    Args:
+        texto: Cuerpo HTML de la respuesta del buscador
         
-        # Buscar JSON en scripts que contenga 'searchResults'
-        for script in soup.find_all('script'):
-            if script.string and 'searchResults' in script.string:
-                # Buscar el objeto JSON completo
-                json_match = re.search(r'(\{.*?"searchResults".*?\})', script.string, re.DOTALL)
-                if json_match:
-                    try:
-                        json_data = json.loads(json_match.group(1))
-                        print("✓ JSON encontrado en script embebido")
-                        break
-                    except (ValueError, json.JSONDecodeError):
-                        continue
+    Returns:
+        El objeto con 'searchResults', o None si no se encuentra
+    """
+    logger.debug("Respuesta no es JSON directo, buscando JSON embebido...")
+    if texto.find('"searchResults"') == -1:
+        return None
+    json_data = _extraer_objeto_json_alrededor(texto)
+    if json_data is not None:
+        logger.debug("JSON embebido encontrado en la respuesta")
+    return json_data
+
+
+def _extraer_json_busqueda(texto: str, numero_norma: int, content_type: str = '') -> Dict[str, Any]:
+    """
+    Obtiene el JSON de resultados a partir del cuerpo de la respuesta del buscador.
+    
+    Si el Content-Type es JSON (o el cuerpo empieza como un objeto JSON) se
+    decodifica directamente; el resto va derecho a la búsqueda del JSON
+    embebido, sin pasar antes por un intento de decodificación fallido.
+    
+    Args:
+        texto: Cuerpo de la respuesta (JSON directo o HTML con JSON embebido)
+        numero_norma: Número de la norma buscada (para el mensaje de error)
+        content_type: Header Content-Type de la respuesta ('' si no se conoce)
         
-        # Si aún no se encontró, buscar en todo el texto
-        if json_data is None:
-            json_match = re.search(r'(\{.*?"queryObjectData".*?"searchResults".*?\})', response.text, re.DOTALL)
-            if json_match:
-                try:
-                    json_data = json.loads(json_match.group(1))
-                    print("✓ JSON encontrado en el texto de la respuesta")
-                except (ValueError, json.JSONDecodeError):
-                    pass
+    Returns:
+        Diccionario con el JSON de búsqueda
+        
+    Raises:
+        ValueError: Si no se encuentra un JSON de búsqueda válido
+    """
+    json_data = None
+    if content_type.startswith('application/json') or texto.lstrip()[:1] == '{':
+        try:
+            json_data = _json_loads(texto)
+            logger.debug("Respuesta es JSON directo")
+        except (ValueError, json.JSONDecodeError):
+            json_data = None
+    
+    if json_data is None:
+        json_data = _extraer_json_embebido(texto)
     
     if json_data is None:
         raise ValueError(
             f"No se pudo obtener JSON de búsqueda para la ley {numero_norma}. "
             f"La respuesta puede haber cambiado de formato."
         )
+    return json_data
+
+
+def _extraer_uuids(json_data: Dict[str, Any], numero_norma: int) -> list[str]:
+    """
+    Extrae los UUIDs de searchResults.documentResultList.
     
-    # Extraer UUIDs de los documentos
+    Raises:
+        ValueError: Si no hay documentos o ninguno tiene UUID
+    """
     search_results = json_data.get('searchResults', {})
     document_list = search_results.get('documentResultList', [])
     total_results = search_results.get('totalSearchResults', 0)
     
-    print(f"\nTotal de resultados encontrados: {total_results}")
-    print(f"Documentos en la lista: {len(document_list)}")
+    logger.debug(f"Total de resultados encontrados: {total_results}; documentos en la lista: {len(document_list)}")
     
     if not document_list:
         raise ValueError(f"No se encontraron documentos para la ley {numero_norma}")
@@ -134,7 +367,6 @@ def buscar_ley_json(numero_norma: int) -> list[str]:
         uuid = doc.get('uuid')
         if uuid:
             uuids.append(uuid)
-            print(f"  [{i}] UUID: {uuid}")
         else:
             logger.warning(f"Documento {i} no tiene UUID")
     
@@ -142,20 +374,78 @@ def buscar_ley_json(numero_norma: int) -> list[str]:
         raise ValueError(f"No se encontraron UUIDs válidos en los resultados para la ley {numero_norma}")
     
     logger.info(f"Encontrados {len(uuids)} UUIDs")
+    logger.debug(f"UUIDs: {uuids}")
     return uuids
 
 
+@_cache_busqueda
+def buscar_ley_json(numero_norma: int, session: Optional[requests.Session] = None) -> list[str]:
+    """
+    Busca una ley por número de norma en SAIJ y devuelve los UUIDs de los documentos encontrados.
+    
+    La búsqueda devuelve un JSON con los resultados. De ese JSON se extraen los UUIDs
+    de los documentos en searchResults.documentResultList.
+    
+    Args:
+        numero_norma: Número de la norma a buscar (ej: 20744)
+        session: Sesión HTTP a usar (None = sesión compartida del módulo)
+        
+    Returns:
+        Lista de UUIDs de los documentos encontrados
+        
+    Raises:
+        requests.RequestException: Si hay un error en la petición HTTP
+        ValueError: Si no se encuentran resultados o la respuesta no es válida
+    """
+    full_url = _url_busqueda(numero_norma)
+
+    logger.info(f"Buscando ley número {numero_norma} en SAIJ...")
+    logger.debug(f"URL de búsqueda: {full_url}")
+    
+    response = (session or SESSION).get(full_url, timeout=30)
+    response.raise_for_status()
+    
+    content_type = response.headers.get('Content-Type', '')
+    logger.debug(f"Status Code: {response.status_code}; Content-Type: {content_type or 'N/A'}")
+    
+    json_data = _extraer_json_busqueda(response.text, numero_norma, content_type)
+    return _extraer_uuids(json_data, numero_norma)
+
+
+def _decodificar_documento(contenido: bytes) -> Dict[str, Any]:
+    """
+    Decodifica el cuerpo (bytes) de la respuesta de view-document.
+    
+    El cuerpo se decodifica directamente desde bytes, sin pasar por la
+    detección de codificación de la respuesta. Si el campo 'data' viene como
+    JSON anidado en un string, se decodifica en el mismo paso.
+    
+    Raises:
+        ValueError: Si la respuesta no contiene JSON válido
+    """
+    try:
+        data = _json_loads(contenido)
+        # Si 'data' es un string, necesita ser parseado como JSON
+        if isinstance(data, dict) and isinstance(data.get('data'), (str, bytes)):
+            data['data'] = _json_loads(data['data'])
+    except ValueError as e:
+        raise ValueError(f"La respuesta no es un JSON válido: {e}")
+    return data
 
 
-def obtener_json_documento(uuid: str) -> tuple[Dict[str, Any], requests.Response]:
+@_cache_documento
+def obtener_json_documento(uuid: str, session: Optional[requests.Session] = None) -> tuple[Dict[str, Any], requests.Response]:
     """
     Obtiene el JSON semiestructurado del documento desde el endpoint view-document.
     
     Args:
         uuid: UUID del documento
+        session: Sesión HTTP a usar (None = sesión compartida del módulo)
         
     Returns:
-        Tupla con (diccionario con la información semiestructurada, response object)
+        Tupla con (diccionario con la información semiestructurada, response object).
+        Si el documento sale de la caché en disco, en lugar del response se
+        devuelve un objeto que solo tiene sus headers.
         
     Raises:
         requests.RequestException: Si hay un error en la petición HTTP
@@ -164,18 +454,12 @@ def obtener_json_documento(uuid: str) -> tuple[Dict[str, Any], requests.Response
     params = {'guid': uuid}
     
     logger.info(f"Obteniendo JSON del documento con UUID: {uuid}")
-    response = requests.get(VIEW_DOCUMENT_URL, params=params, timeout=30)
+    response = (session or SESSION).get(VIEW_DOCUMENT_URL, params=params, timeout=30)
     response.raise_for_status()
     
-    try:
-        data = response.json()
-        # Si 'data' es un string, necesita ser parseado como JSON
-        if isinstance(data, dict) and 'data' in data and isinstance(data['data'], str):
-            data['data'] = json.loads(data['data'])
-        logger.info("JSON obtenido exitosamente")
-        return data, response
-    except ValueError as e:
-        raise ValueError(f"La respuesta no es un JSON válido: {e}")
+    data = _decodificar_documento(response.content)
+    logger.info("JSON obtenido exitosamente")
+    return data, response
 
 
 def determinar_nombre_archivo(json_data: Dict[str, Any], response: requests.Response, numero_norma: int) -> str:
@@ -198,10 +482,11 @@ def determinar_nombre_archivo(json_data: Dict[str, Any], response: requests.Resp
     # Intentar obtener desde Content-Disposition header
     content_disposition = response.headers.get('Content-Disposition', '')
     if content_disposition:
-        # Buscar filename en Content-Disposition
-        filename_match = re.search(r'filename[^;=\n]*=(([\'"]).*?\2|[^;\n]*)', content_disposition, re.IGNORECASE)
-        if filename_match:
-            filename = filename_match.group(1).strip('"\'')
+        # Buscar filename en Content-Disposition (el parser de email maneja comillas y filename*=)
+        mensaje = Message()
+        mensaje['Content-Disposition'] = content_disposition
+        filename = (mensaje.get_filename() or '').strip('"\'')
+        if filename:
             # Remover extensión si existe
             if filename.endswith('.json'):
                 filename = filename[:-5]
@@ -271,9 +556,30 @@ def escribir_json(json_data: Dict[str, Any], directorio: Optional[str] = None, n
     else:
         file_path = Path(nombre_archivo)
     
-    # Escribir archivo
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(json_data, f, ensure_ascii=False, indent=2)
+    # Serializar a bytes y escribir de una vez
+    if orjson is not None:
+        contenido = orjson.dumps(json_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        contenido = json.dumps(json_data, ensure_ascii=False, indent=2).encode('utf-8')
+    
+    # Escritura atómica: si el proceso se corta a mitad no queda un JSON truncado.
+    # El temporal es único (mkstemp) para que dos descargas concurrentes con el mismo
+    # nombre de archivo no compartan el mismo .tmp.
+    fd, tmp = tempfile.mkstemp(dir=file_path.parent, prefix=file_path.name + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(contenido)
+        # mkstemp crea el archivo con permisos 0600: conservar los del archivo que se
+        # reemplaza, o 0644 si es nuevo
+        try:
+            modo = stat.S_IMODE(os.stat(file_path).st_mode)
+        except FileNotFoundError:
+            modo = 0o644
+        os.chmod(tmp, modo)
+        os.replace(tmp, file_path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
     
     logger.info(f"JSON guardado en: {file_path}")
     return str(file_path)
@@ -300,7 +606,8 @@ def construir_url_directa(numero_norma: int) -> Optional[str]:
 
 def scraper_completo(numero_norma: int, uuid_directo: Optional[str] = None, 
                      directorio_destino: Optional[str] = None, 
-                     nombre_archivo: Optional[str] = None) -> str:
+                     nombre_archivo: Optional[str] = None,
+                     session: Optional[requests.Session] = None) -> str:
     """
     Ejecuta el flujo completo de scraping para una ley y guarda el JSON en un archivo.
     
@@ -310,6 +617,8 @@ def scraper_completo(numero_norma: int, uuid_directo: Optional[str] = None,
                      en lugar de buscar
         directorio_destino: Directorio donde guardar el archivo (None = directorio actual)
         nombre_archivo: Nombre del archivo sin extensión (None = determinar desde response/JSON)
+        session: Sesión HTTP a usar (None = sesión compartida del módulo). Al
+                 descargar varias leyes, pasar la misma sesión reutiliza las conexiones.
         
     Returns:
         Ruta completa del archivo JSON guardado
@@ -326,7 +635,7 @@ def scraper_completo(numero_norma: int, uuid_directo: Optional[str] = None,
         else:
             # Paso 1: Buscar la ley y obtener UUIDs
             logger.info(f"Iniciando búsqueda automática para la ley {numero_norma}...")
-            uuids = buscar_ley_json(numero_norma)
+            uuids = buscar_ley_json(numero_norma, session=session)
             
             if not uuids:
                 raise ValueError(f"No se encontraron UUIDs para la ley {numero_norma}")
@@ -338,7 +647,7 @@ def scraper_completo(numero_norma: int, uuid_directo: Optional[str] = None,
             logger.info(f"Otros UUIDs disponibles: {uuids[1:]}")
         
         # Paso 3: Obtener JSON del documento
-        json_data, response = obtener_json_documento(uuid)
+        json_data, response = obtener_json_documento(uuid, session=session)
         
         # Paso 4: Escribir JSON a archivo
         file_path = escribir_json(json_data, directorio_destino, nombre_archivo, response, numero_norma)
@@ -353,6 +662,172 @@ def scraper_completo(numero_norma: int, uuid_directo: Optional[str] = None,
         raise
 
 
+# Descargas simultáneas como máximo al procesar varias leyes en modo asíncrono
+CONCURRENCIA_DESCARGAS = 8
+
+
+def _espera_reintento(intento: int, retry_after: Optional[str]) -> float:
+    """
+    Segundos a esperar antes del reintento número intento (desde 1), como urllib3:
+    respeta Retry-After en segundos y si no usa backoff exponencial.
+    """
+    if retry_after is not None and retry_after.strip().isdigit():
+        return float(retry_after)
+    return REINTENTOS_BACKOFF * (2 ** (intento - 1))
+
+
+async def _get_async(session: "aiohttp.ClientSession", url: str,
+                     leer: Callable[["aiohttp.ClientResponse"], Awaitable[Any]], **kwargs: Any) -> tuple[Any, Any]:
+    """
+    GET con aiohttp y los mismos reintentos que crear_sesion (estados 429/5xx y
+    errores de conexión o timeout).
+    
+    Args:
+        session: Sesión de aiohttp
+        url: URL a pedir
+        leer: Lector del cuerpo (ClientResponse.read o ClientResponse.text); se llama
+              antes de liberar la conexión, después el cuerpo ya no está disponible
+        **kwargs: Argumentos extra de session.get (ej: params)
+    
+    Returns:
+        Tupla con (response de aiohttp, cuerpo leído)
+    
+    Raises:
+        aiohttp.ClientError: Si la petición sigue fallando después de los reintentos
+    """
+    for intento in range(1, REINTENTOS + 1):
+        retry_after = None
+        try:
+            async with session.get(url, **kwargs) as response:
+                if response.status not in REINTENTOS_ESTADOS:
+                    response.raise_for_status()
+                    return response, await leer(response)
+                retry_after = response.headers.get('Retry-After')
+                logger.debug(f"HTTP {response.status} en {url}; reintento {intento}/{REINTENTOS}")
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+            logger.debug(f"{type(e).__name__} en {url}; reintento {intento}/{REINTENTOS}")
+        await asyncio.sleep(_espera_reintento(intento, retry_after))
+    # Último intento: cualquier error se propaga
+    async with session.get(url, **kwargs) as response:
+        response.raise_for_status()
+        return response, await leer(response)
+
+
+@_cache_busqueda
+async def buscar_ley_json_async(session: "aiohttp.ClientSession", numero_norma: int) -> list[str]:
+    """
+    Versión asíncrona de buscar_ley_json (usa aiohttp).
+    
+    Args:
+        session: Sesión de aiohttp compartida entre descargas
+        numero_norma: Número de la norma a buscar (ej: 20744)
+        
+    Returns:
+        Lista de UUIDs de los documentos encontrados
+        
+    Raises:
+        aiohttp.ClientError: Si hay un error en la petición HTTP
+        ValueError: Si no se encuentran resultados o la respuesta no es válida
+    """
+    full_url = _url_busqueda(numero_norma)
+    logger.info(f"Buscando ley número {numero_norma} en SAIJ...")
+    response, texto = await _get_async(session, full_url, aiohttp.ClientResponse.text)
+    content_type = response.headers.get('Content-Type', '')
+    json_data = _extraer_json_busqueda(texto, numero_norma, content_type)
+    return _extraer_uuids(json_data, numero_norma)
+
+
+@_cache_documento
+async def obtener_json_documento_async(session: "aiohttp.ClientSession", uuid: str) -> tuple[Dict[str, Any], Any]:
+    """
+    Versión asíncrona de obtener_json_documento (usa aiohttp).
+    
+    Args:
+        session: Sesión de aiohttp compartida entre descargas
+        uuid: UUID del documento
+        
+    Returns:
+        Tupla con (diccionario con la información semiestructurada, response de aiohttp)
+        
+    Raises:
+        aiohttp.ClientError: Si hay un error en la petición HTTP
+        ValueError: Si la respuesta no contiene JSON válido
+    """
+    logger.info(f"Obteniendo JSON del documento con UUID: {uuid}")
+    response, contenido = await _get_async(session, VIEW_DOCUMENT_URL, aiohttp.ClientResponse.read,
+                                           params={'guid': uuid})
+    data = _decodificar_documento(contenido)
+    logger.info("JSON obtenido exitosamente")
+    return data, response
+
+
+async def scraper_completo_async(session: "aiohttp.ClientSession", semaforo: asyncio.Semaphore,
+                                 numero_norma: int, directorio_destino: Optional[str] = None) -> str:
+    """
+    Versión asíncrona de scraper_completo para una ley (usa el primer UUID encontrado).
+    
+    El semáforo limita cuántas leyes se descargan a la vez; la escritura del
+    archivo se hace en un hilo para no bloquear el event loop.
+    
+    Returns:
+        Ruta completa del archivo JSON guardado
+    """
+    async with semaforo:
+        uuids = await buscar_ley_json_async(session, numero_norma)
+        uuid = uuids[0]
+        if len(uuids) > 1:
+            logger.info(f"Se encontraron {len(uuids)} documentos. Usando el primero: {uuid}")
+        json_data, response = await obtener_json_documento_async(session, uuid)
+    return await asyncio.to_thread(escribir_json, json_data, directorio_destino, None, response, numero_norma)
+
+
+async def scraper_lote_async(numeros_norma: Iterable[int], directorio_destino: Optional[str] = None,
+                             concurrencia: int = CONCURRENCIA_DESCARGAS) -> Dict[int, Union[str, Exception]]:
+    """
+    Descarga varias leyes en paralelo con aiohttp.
+    
+    Args:
+        numeros_norma: Números de las normas a descargar
+        directorio_destino: Directorio donde guardar los archivos (None = directorio actual)
+        concurrencia: Cantidad máxima de leyes descargándose a la vez
+        
+    Returns:
+        Diccionario número de norma -> ruta del archivo guardado, o la excepción
+        si esa ley falló (una falla no interrumpe el resto)
+    """
+    numeros = list(numeros_norma)
+    semaforo = asyncio.Semaphore(concurrencia)
+    connector = aiohttp.TCPConnector(limit_per_host=concurrencia, ttl_dns_cache=300)
+    timeout = aiohttp.ClientTimeout(total=30)
+    headers = {'Accept-Encoding': ACCEPT_ENCODING}
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=headers) as session:
+        resultados = await asyncio.gather(
+            *(scraper_completo_async(session, semaforo, numero, directorio_destino) for numero in numeros),
+            return_exceptions=True,
+        )
+    return dict(zip(numeros, resultados))
+
+
+def scraper_lote(numeros_norma: Iterable[int], directorio_destino: Optional[str] = None) -> Dict[int, Union[str, Exception]]:
+    """
+    Descarga varias leyes: en paralelo si aiohttp está instalado, en serie (con una
+    sola sesión keep-alive) si no.
+    
+    Returns:
+        Diccionario número de norma -> ruta del archivo guardado o excepción
+    """
+    if aiohttp is not None:
+        return asyncio.run(scraper_lote_async(numeros_norma, directorio_destino))
+    resultados: Dict[int, Union[str, Exception]] = {}
+    session = crear_sesion()
+    for numero in numeros_norma:
+        try:
+            resultados[numero] = scraper_completo(numero, directorio_destino=directorio_destino, session=session)
+        except (requests.RequestException, ValueError) as e:
+            resultados[numero] = e
+    return resultados
+
+
 if __name__ == "__main__":
     # Ejemplo de uso
     import sys
@@ -365,10 +840,12 @@ if __name__ == "__main__":
         epilog='Ejemplos:\n'
                '  python scraper.py 20744\n'
                '  python scraper.py 26206 --directorio data\n'
-               '  python scraper.py 20744 --archivo ley-20744 --directorio output'
+               '  python scraper.py 20744 --archivo ley-20744 --directorio output\n'
+               '  python scraper.py 20744 26206 24013 --directorio data'
     )
-    parser.add_argument('numero_norma', type=int, 
-                       help='Número de la norma a buscar (ej: 20744, 26206)')
+    parser.add_argument('numero_norma', type=int, nargs='+',
+                       help='Número de la norma a buscar (ej: 20744, 26206). Con varios números '
+                            'las descargas se hacen en paralelo si aiohttp está instalado')
     parser.add_argument('--uuid', type=str, 
                        help='UUID directo del documento (opcional, solo si la búsqueda automática falla)')
     parser.add_argument('--directorio', type=str, 
@@ -376,11 +853,35 @@ if __name__ == "__main__":
     parser.add_argument('--archivo', type=str, 
                        help='Nombre del archivo sin extensión .json (opcional, por defecto: generado desde los datos del documento)')
     
+    parser.add_argument('-v', '--verbose', action='store_true',
+                       help='Mostrar el detalle de cada búsqueda (nivel DEBUG)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help=f'No leer ni escribir la caché de respuestas en {CACHE_DIR}')
+    parser.add_argument('--refresh', action='store_true',
+                       help='Ignorar la caché existente y volver a descargar (actualiza la caché)')
+    
     args = parser.parse_args()
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+    CACHE_CONFIG['habilitada'] = not args.no_cache
+    CACHE_CONFIG['refrescar'] = args.refresh
+    
+    if len(args.numero_norma) > 1:
+        if args.uuid or args.archivo:
+            parser.error('--uuid y --archivo solo se pueden usar con un único número de norma')
+        resultados = scraper_lote(args.numero_norma, directorio_destino=args.directorio)
+        errores = 0
+        for numero, resultado in resultados.items():
+            if isinstance(resultado, Exception):
+                errores += 1
+                logger.error(f"Ley {numero}: {resultado}")
+            else:
+                print(f"Ley {numero}: JSON guardado en {resultado}")
+        sys.exit(1 if errores else 0)
     
     try:
         file_path = scraper_completo(
-            args.numero_norma,
+            args.numero_norma[0],
             uuid_directo=args.uuid,
             directorio_destino=args.directorio,
             nombre_archivo=args.archivo
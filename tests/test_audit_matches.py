@@ -0,0 +1,24 @@
+"""Tests for utils/audit_matches.py."""
+
+import pytest
+
+from utils.audit_matches import _DEROG_RE, _SKIP_RE
+
+# Substrings the audit matched before the precompiled regexes
+DEROG_HEADERS = ("derógase la ley", "derogase la ley", "derógase el decreto ley", "derogase el decreto ley")
+SKIP_HEADERS = ("créase", "crease", "de forma", "comuníquese")
+
+
+@pytest.mark.parametrize("header", [
+    "artículo 1- derógase la ley 25.323.",
+    "artículo 2- derogase la ley 25.345.",
+    "artículo 3- derógase el decreto ley 17.250/67.",
+    "artículo 4- derogase el decreto ley 17.250/67.",
+    "artículo 5- derógase el artículo 2° de la ley 20.744.",
+    "artículo 6- sustitúyese el artículo 1° de la ley 20.744.",
+    "artículo 7- créase el régimen de incentivo.",
+    "artículo 8- comuníquese al poder ejecutivo nacional.",
+])
+def test_regexes_match_the_original_substrings(header):
+    assert bool(_DEROG_RE.search(header)) == any(s in header for s in DEROG_HEADERS)
+    assert bool(_SKIP_RE.search(header)) == any(s in header for s in SKIP_HEADERS)
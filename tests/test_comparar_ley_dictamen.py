@@ -0,0 +1,71 @@
+"""Tests de utils/comparar_ley_dictamen.py."""
+
+import re
+
+import pytest
+
+from utils.comparar_ley_dictamen import parse_article_text
+
+# Patrón original de incisos: _extraer_incisos debe dar el mismo resultado
+_RE_INCISO_ORIGINAL = re.compile(
+    r'([a-z])\)\s+([^a-z\)]+?)(?=\n|$|([a-z])\)|ARTICULO)',
+    re.IGNORECASE | re.MULTILINE | re.DOTALL
+)
+
+
+def _parse_original(texto):
+    matches = list(_RE_INCISO_ORIGINAL.finditer(texto))
+    incisos = [
+        {'letra': m.group(1).lower(), 'texto': m.group(2).strip()}
+        for m in matches if m.group(2).strip()
+    ]
+    for m in reversed(matches):
+        texto = texto[:m.start()] + texto[m.end():]
+    return texto.strip(), incisos
+
+
+def test_referencia_a_inciso_partida_en_lineas_no_es_inciso():
+    # Título XXIV, art. 185: "como inciso\nm) del cuarto párrafo..."
+    texto = (
+        'inmediato siguiente al de la entrada en vigencia de esta ley, como inciso\n'
+        'm) del cuarto párrafo del artículo 28 de la Ley de Impuesto al Valor\n'
+        'Agregado (t.o. en 1997), el siguiente:\n'
+        'm) La provisión de energía eléctrica utilizada en sistemas y/o equipos de\n'
+        'riego con destino al sector agroindustrial.'
+    )
+    resultado = parse_article_text(texto)
+    assert 'incisos' not in resultado
+    assert resultado['texto'] == texto
+
+
+def test_parrafo_final_no_queda_dentro_del_ultimo_inciso():
+    # Título VII, art. 98: párrafos de sanciones después del último inciso
+    texto = (
+        'ARTÍCULO 24.- Servicios esenciales. Se consideran servicios esenciales:\n'
+        'a) Los servicios sanitarios y hospitalarios;\n'
+        'b) La producción y distribución de agua potable;\n'
+        'd) El control del tráfico aéreo.\n'
+        '24.6- La inobservancia por alguna de las partes de los procedimientos\n'
+        'conciliatorios dará lugar a la aplicación de las sanciones\n'
+        'establecidas por las Leyes Nros. 14.786, 23.551 y 25.212.'
+    )
+    resultado = parse_article_text(texto)
+    assert 'incisos' not in resultado
+    assert resultado['texto'].endswith('Leyes Nros. 14.786, 23.551 y 25.212.')
+    assert 'd) El control del tráfico aéreo.' in resultado['texto']
+
+
+@pytest.mark.parametrize('texto', [
+    'a) 1.\nb) 2.',
+    'Texto: a) 10; b) 20\nc) x',
+    'a)  \n  b) 3 ARTICULO 4',
+    'a) ) b)\t\n',
+    'inciso a) - b) 5, c) ;',
+    'a)\n\n',
+    'ab) 12 articulo',
+])
+def test_incisos_igual_que_el_patron_original(texto):
+    texto_esperado, incisos_esperados = _parse_original(texto.strip())
+    resultado = parse_article_text(texto)
+    assert resultado['texto'] == texto_esperado
+    assert resultado.get('incisos', []) == incisos_esperados
@@ -0,0 +1,45 @@
+"""Tests de parsers/dictamen/parser.py."""
+
+import pytest
+
+from parsers.dictamen import parser
+
+
+@pytest.fixture
+def pdfs(tmp_path, monkeypatch):
+    """Tres archivos de contenido distinto y un parse_dictamen_pdf que cuenta llamadas."""
+    llamadas = []
+
+    def parse_falso(pdf_path, fill_objetivo_accion=True, workers=None):
+        llamadas.append(pdf_path)
+        with open(pdf_path, encoding="utf-8") as f:
+            return [f.read()]
+
+    monkeypatch.setattr(parser, "parse_dictamen_pdf", parse_falso)
+    monkeypatch.setattr(parser, "PDF_CACHE_SIZE", 2)
+    monkeypatch.setattr(parser, "_PDF_CACHE", parser.OrderedDict())
+    rutas = []
+    for nombre in ("a", "b", "c"):
+        ruta = tmp_path / f"{nombre}.pdf"
+        ruta.write_text(nombre, encoding="utf-8")
+        rutas.append(str(ruta))
+    return rutas, llamadas
+
+
+def test_mas_archivos_que_la_cache(pdfs):
+    rutas, llamadas = pdfs
+    resultado = parser.parse_dictamen_pdfs(rutas, processes=1)
+    assert resultado == {ruta: [nombre] for ruta, nombre in zip(rutas, "abc")}
+    assert len(parser._PDF_CACHE) == 2
+
+    # "a" fue desalojado: se reparsea junto con los dos que siguen en cache
+    llamadas.clear()
+    resultado = parser.parse_dictamen_pdfs(rutas + rutas[:1], processes=1)
+    assert resultado == {ruta: [nombre] for ruta, nombre in zip(rutas, "abc")}
+    assert llamadas == [rutas[0]]
+
+
+def test_resultado_no_comparte_la_lista_de_la_cache(pdfs):
+    rutas, _ = pdfs
+    parser.parse_dictamen_pdfs(rutas[:1], processes=1)[rutas[0]].append("x")
+    assert parser.parse_dictamen_pdfs(rutas[:1], processes=1) == {rutas[0]: ["a"]}
@@ -0,0 +1,50 @@
+"""Tests de matcher/matcher.py."""
+
+from matcher.matcher import (
+    _index_capitulos,
+    find_articles_in_chapter,
+    get_incorporated_articles,
+    process_dictamen_data,
+)
+
+LEY = {
+    "ley": {
+        "titulos": [
+            {
+                "numero": "I",
+                "articulos": [{"numero": "1"}],
+                "capitulos": [{"numero": "I", "articulos": [{"numero": "2"}, {"numero": "3"}]}],
+            },
+            {
+                "numero": "II",
+                "capitulos": [
+                    {"numero": "I", "articulos": [{"numero": "4"}]},
+                    {"numero": "VIII", "articulos": [{"numero": "S/N"}, {"numero": ""}, {"numero": "5"}]},
+                ],
+            },
+        ]
+    }
+}
+
+
+def test_capitulo_indexado_igual_que_recorrido():
+    indice = _index_capitulos(LEY)
+    for capitulo in ("I", "i", "VIII", "viii", "XX"):
+        assert find_articles_in_chapter(LEY, capitulo, indice) == find_articles_in_chapter(LEY, capitulo)
+
+
+def test_capitulo_repetido_y_articulos_sin_numero():
+    indice = _index_capitulos(LEY)
+    assert find_articles_in_chapter(LEY, "I", indice) == ["2", "3", "4"]
+    assert find_articles_in_chapter(LEY, "viii", indice) == ["CAP_viii_ART_1", "CAP_viii_ART_2", "5"]
+
+
+def test_derogacion_de_capitulo_e_incorporaciones():
+    dictamen = [
+        {"destino_capitulo": "I", "accion": "derógase"},
+        {"destino_articulo": "3", "accion": "incorpórase"},
+        {"destino_articulo": "3 bis", "accion": "incorpórase", "texto_nuevo": "ARTÍCULO 3 bis- Nuevo.\nTexto"},
+    ]
+    resultado = process_dictamen_data(dictamen, LEY)
+    assert resultado.derogated_chapters == {"I": {"2", "3", "4"}}
+    assert [art["numero"] for art in get_incorporated_articles(dictamen, LEY)] == ["3 bis"]
@@ -0,0 +1,17 @@
+"""Tests de parsers/saij/parser.py."""
+
+from parsers.saij.parser import procesar_incisos
+
+
+def test_incisos_tras_marca_de_parrafo_en_mayusculas():
+    assert procesar_incisos('Son deberes: [[P]]a) cumplir [[P]]b) respetar') == [
+        {'letra': 'a', 'texto': 'cumplir'},
+        {'letra': 'b', 'texto': 'respetar'},
+    ]
+
+
+def test_incisos_tras_marca_de_parrafo_en_minusculas():
+    assert procesar_incisos('Son deberes: [[p]]a) cumplir [[p]]b) respetar') == [
+        {'letra': 'a', 'texto': 'cumplir'},
+        {'letra': 'b', 'texto': 'respetar'},
+    ]
@@ -1,35 +1,155 @@
 import json
-import glob
+import mmap
 import os
 import sys
 import re
+from collections import defaultdict
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # orjson is optional: fall back to the standard library json
+    orjson = None
+
+REPORT_JSON = "data/audit_report_mismatches.json"
+REPORT_JSONL = "data/audit_report_mismatches.jsonl"
+# Reports with more issues than this are written as compact JSON instead of indented
+REPORT_PRETTY_MAX = 1000
+
+# Files from this size on are read through mmap instead of a full read()
+MMAP_MIN_BYTES = 1024 * 1024
+
+# Headers of ops without a target law that are not reported: new regimes ("Créase")
+# and closing articles ("De forma", "Comuníquese")
+_SKIP_RE = re.compile(r'cr[eé]ase|de forma|comuníquese')
+# Headers that derogate a whole law or decree-law
+_DEROG_RE = re.compile(r'der[oó]gase (?:la ley|el decreto ley)')
+
+
+def _load_json(path):
+    """Load a JSON file (orjson when installed, json otherwise)."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < MMAP_MIN_BYTES:
+                return orjson.loads(f.read())
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as buf:
+                    return orjson.loads(buf)
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _comparison_file(law_id):
+    """Path of the generated comparison file for a law."""
+    return f"data/comparacion_global_ley_{law_id}.json"
+
+
+def audit_one_law(law_id, ops):
+    """Audit the operations of one law against its comparison file. Returns the mismatches found."""
+    mismatches = []
+    comp_file = _comparison_file(law_id)
+    
+    if not os.path.exists(comp_file):
+        # If file missing, check if it's a STUB (we just created them, maybe matcher hasn't run yet)
+        # But normally matcher SHOULD generate the file even for stubs.
+        for op in ops:
+            mismatches.append({
+                "type": "LAW_FILE_MISSING",
+                "law_id": law_id,
+                "dictamen_articulo": op.get("dictamen_articulo"),
+                "encabezado": op.get("encabezado"),
+                "source_file": op.get("_source_file")
+            })
+        return mismatches
+        
+    comp_data = _load_json(comp_file)
+    
+    # Collect matched dictamen articles from the output structure
+    matched_dictamen_ids = set()
+    
+    # Check metadata for global/chapter derogations
+    derogacion_total = comp_data.get("metadatos", {}).get("derogacion_total", False)
+    capitulos_derogados = {str(c) for c in comp_data.get("metadatos", {}).get("capitulos_derogados", [])}
+    
+    # Iterative walk (explicit stack) over the whole output tree
+    add_matched = matched_dictamen_ids.add
+    stack = [comp_data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            d_art = node.get("dictamen_articulo")
+            if d_art:
+                # Ids are almost always strings already; only convert the rest
+                add_matched(d_art if type(d_art) is str else str(d_art))
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+    
+    # Verify
+    for op in ops:
+        d_id = op.get("dictamen_articulo")
+        if type(d_id) is not str:
+            d_id = str(d_id)
+        header = op['_header_lc']
+        accion = op['_accion_lc']
+        target_cap = op.get("destino_capitulo")
+        
+        # 1. Direct Match in Output Tree
+        if d_id in matched_dictamen_ids:
+            continue
+
+        # 2. Whole Law Derogation Match
+        if derogacion_total and "derógase" in accion:
+            continue
+            
+        # 3. Chapter Derogation Match
+        if target_cap and str(target_cap) in capitulos_derogados:
+            continue
+
+        # 4. Fallback: Header Text Heuristics (for safety)
+        if _DEROG_RE.search(header):
+            continue
+
+        mismatches.append({
+            "type": "ARTICLE_NOT_FOUND_IN_LAW",
+            "law_id": law_id,
+            "target_article": op.get("destino_articulo") or op.get("destino_capitulo"),
+            "dictamen_articulo": d_id,
+            "encabezado": op.get("encabezado"),
+            "source_file": op.get("_source_file")
+        })
+
+    return mismatches
+
 
 def audit():
     print("Starting Audit...")
     
     # 1. Load all Dictamen Operations
     all_operations = []
-    files = glob.glob("data/dictamen_modernizacion_laboral_titulo_*.json")
-    for file_path in files:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            for item in data:
-                item['_source_file'] = os.path.basename(file_path)
-                all_operations.append(item)
+    files = [
+        entry for entry in os.scandir("data")
+        if entry.name.startswith("dictamen_modernizacion_laboral_titulo_")
+        and entry.name.endswith(".json") and entry.is_file()
+    ]
+    for entry in files:
+        data = _load_json(entry.path)
+        for item in data:
+            item['_source_file'] = entry.name
+            # Lowercased once here, read by every later check
+            item['_header_lc'] = (item.get('encabezado') or '').lower()
+            item['_accion_lc'] = (item.get('accion') or '').lower()
+            all_operations.append(item)
                 
     mismatches = []
     
     # Check for UNKNOWN laws
     for op in all_operations:
-        header = op.get("encabezado", "").lower()
+        header = op['_header_lc']
         
-        # SKIP: "Créase" or "Incorpórase" without explicit target often means new regime
+        # SKIP: "Créase" or "Incorpórase" without explicit target often means new regime,
+        # and "De forma" articles (usually the last ones)
         if op.get("ley_numero") == "UNKNOWN" or not op.get("ley_numero"):
-            if "créase" in header or "crease" in header:
-                continue # Ignore New Regimes
-            
-            # Check for "De forma" articles (usually the last ones)
-            if "de forma" in header or "comuníquese" in header:
+            if _SKIP_RE.search(header):
                 continue
 
             mismatches.append({
@@ -40,93 +160,34 @@ def audit():
             })
 
     # Group operations by law
-    ops_by_law = {}
+    ops_by_law = defaultdict(list)
     for op in all_operations:
         ley = op.get("ley_numero")
         if ley and ley != "UNKNOWN":
-            ley = str(ley).replace(".", "").strip()
-            if ley not in ops_by_law:
-                ops_by_law[ley] = []
-            ops_by_law[ley].append(op)
+            ops_by_law[str(ley).replace(".", "").strip()].append(op)
             
-    # Check against generated comparison files
+    # Check against generated comparison files (each law is independent)
     for law_id, ops in ops_by_law.items():
-        comp_file = f"data/comparacion_global_ley_{law_id}.json"
-        
-        if not os.path.exists(comp_file):
-            # If file missing, check if it's a STUB (we just created them, maybe matcher hasn't run yet)
-            # But normally matcher SHOULD generate the file even for stubs.
-            for op in ops:
-                mismatches.append({
-                    "type": "LAW_FILE_MISSING",
-                    "law_id": law_id,
-                    "dictamen_articulo": op.get("dictamen_articulo"),
-                    "encabezado": op.get("encabezado"),
-                    "source_file": op.get("_source_file")
-                })
-            continue
-            
-        with open(comp_file, 'r', encoding='utf-8') as f:
-            comp_data = json.load(f)
-            
-        # Collect matched dictamen articles from the output structure
-        matched_dictamen_ids = set()
-        
-        # Check metadata for global/chapter derogations
-        derogacion_total = comp_data.get("metadatos", {}).get("derogacion_total", False)
-        capitulos_derogados = set(comp_data.get("metadatos", {}).get("capitulos_derogados", []))
-        
-        def traverse(node):
-            if isinstance(node, dict):
-                if "dictamen_articulo" in node and node["dictamen_articulo"]:
-                    matched_dictamen_ids.add(str(node["dictamen_articulo"]))
-                for k, v in node.items():
-                    traverse(v)
-            elif isinstance(node, list):
-                for item in node:
-                    traverse(item)
-                    
-        traverse(comp_data)
-        
-        # Verify
-        for op in ops:
-            d_id = str(op.get("dictamen_articulo"))
-            header = op.get("encabezado", "").lower()
-            accion = op.get("accion", "").lower()
-            target_cap = op.get("destino_capitulo")
-            
-            # 1. Direct Match in Output Tree
-            if d_id in matched_dictamen_ids:
-                continue
-
-            # 2. Whole Law Derogation Match
-            if derogacion_total and "derógase" in accion:
-                continue
-                
-            # 3. Chapter Derogation Match
-            if target_cap and str(target_cap) in capitulos_derogados:
-                continue
-
-            # 4. Fallback: Header Text Heuristics (for safety)
-            if "derógase la ley" in header or "derogase la ley" in header or \
-               "derógase el decreto ley" in header or "derogase el decreto ley" in header:
-                continue
-
-            mismatches.append({
-                "type": "ARTICLE_NOT_FOUND_IN_LAW",
-                "law_id": law_id,
-                "target_article": op.get("destino_articulo") or op.get("destino_capitulo"),
-                "dictamen_articulo": d_id,
-                "encabezado": op.get("encabezado"),
-                "source_file": op.get("_source_file")
-            })
+        mismatches.extend(audit_one_law(law_id, ops))
 
-    # Save Report
-    with open("data/audit_report_mismatches.json", "w", encoding='utf-8') as f:
-        json.dump(mismatches, f, ensure_ascii=False, indent=2)
+    # Save Report: JSON array (pretty-printed unless large) plus one mismatch per line
+    pretty = len(mismatches) <= REPORT_PRETTY_MAX
+    if orjson is not None:
+        with open(REPORT_JSON, "wb") as f:
+            f.write(orjson.dumps(mismatches, option=orjson.OPT_INDENT_2 if pretty else 0))
+        with open(REPORT_JSONL, "wb") as f:
+            for m in mismatches:
+                f.write(orjson.dumps(m, option=orjson.OPT_APPEND_NEWLINE))
+    else:
+        with open(REPORT_JSON, "w", encoding='utf-8') as f:
+            f.write(json.dumps(mismatches, ensure_ascii=False, indent=2 if pretty else None))
+        with open(REPORT_JSONL, "w", encoding='utf-8') as f:
+            for m in mismatches:
+                f.write(json.dumps(m, ensure_ascii=False))
+                f.write("\n")
         
     print(f"Audit Complete. Found {len(mismatches)} issues.")
-    print("Report saved to data/audit_report_mismatches.json")
+    print(f"Report saved to {REPORT_JSON} (one issue per line in {REPORT_JSONL})")
 
 if __name__ == "__main__":
     audit()
\ No newline at end of file
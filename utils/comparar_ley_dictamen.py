@@ -9,14 +9,100 @@ El JSON de salida usa la estructura de la ley como base y agrega metadatos
 sobre sustituciones, incorporaciones y derogaciones.
 """
 
-import json
+import bisect
+import os
 import re
 import sys
-from typing import Dict, Any, List, Optional, Set
+from functools import lru_cache
+from typing import Dict, Any, List, NamedTuple, Optional, Set, Tuple
 from pathlib import Path
 
+# Permite importar utils/ al ejecutar este archivo como script
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-def extract_article_number_from_header(encabezado: str) -> Optional[str]:
+from utils.json_io import load_json, write_json
+
+
+# Gramática de los números de artículo, compartida por todos los patrones:
+# sufijos latinos, número con sufijo opcional y variante con "°" opcional
+_SUFIJOS = r'(?:bis|ter|quater|quinquies|sexies|septies|octies|nonies|decies)'
+_NUM_SUFIJO = rf'\d+(?:\s*{_SUFIJOS})?'
+_NUM_GRADO_SUFIJO = rf'\d+(?:\s*[°º])?(?:\s*{_SUFIJOS})?'
+
+# Patrones compilados una sola vez (se usan en los bucles por artículo)
+_RE_INCORPORA = re.compile(
+    rf'incorp[óo]rase\s+como\s+art[íi]culo\s+({_NUM_GRADO_SUFIJO})',
+    re.IGNORECASE
+)
+_RE_ARTICULO_HEADER = re.compile(
+    rf'art[íi]culo\s+({_NUM_GRADO_SUFIJO})',
+    re.IGNORECASE
+)
+_RE_SUSTITUYE = re.compile(
+    rf'(?:sustit[úu]yese|der[óo]gase|modif[íi]case)\s+(?:el|los)\s+art[íi]culo[s]?\s+({_NUM_GRADO_SUFIJO})',
+    re.IGNORECASE
+)
+_RE_ARTICULO_TEXTO = re.compile(
+    rf'ART[ÍI]CULO\s+({_NUM_GRADO_SUFIJO})\s*[°º]?[\.-]',
+    re.IGNORECASE
+)
+_RE_TITULO_ARTICULO = re.compile(
+    rf'ART[ÍI]CULO\s+{_NUM_SUFIJO}\s*[°º]?-\s*(.+?)(?:\.\s+|\n|$)',
+    re.IGNORECASE
+)
+_RE_ENCABEZADO_ARTICULO = re.compile(
+    rf'ART[ÍI]CULO\s+{_NUM_SUFIJO}\s*[°º]?-\s*',
+    re.IGNORECASE
+)
+# Incisos (ver _extraer_incisos): marca "x) ", caracteres donde termina el
+# contenido y continuaciones válidas tras el contenido
+_RE_INCISO_MARCA = re.compile(r'([a-z])\)\s+', re.IGNORECASE)
+_RE_INCISO_PARADA = re.compile(r'[a-z)\n]', re.IGNORECASE)
+_RE_INCISO_SIGUE = re.compile(r'[a-z]\)|ARTICULO', re.IGNORECASE)
+_RE_PUNTO = re.compile(r'\.\s+')
+_RE_SEPARADOR_Y = re.compile(r'\s+y\s+', re.IGNORECASE)
+_RE_NUM_SUFIJO = re.compile(rf'^(\d+)(?:\s*({_SUFIJOS}))?', re.IGNORECASE)
+
+# Tipo de operación según la acción del dictamen (en minúsculas, con y sin tilde)
+_ACCION_TIPO = {
+    'incorpórase': 'incorporacion', 'incorporase': 'incorporacion',
+    'derógase': 'derogacion', 'derogase': 'derogacion',
+    'sustitúyese': 'sustitucion', 'sustituyese': 'sustitucion',
+    'modifícase': 'sustitucion', 'modificase': 'sustitucion',
+}
+
+# Orden de los sufijos latinos al ordenar artículos con el mismo número base
+_SUFFIX_ORDER = {
+    '': 0, 'bis': 1, 'ter': 2, 'quater': 3, 'quinquies': 4,
+    'sexies': 5, 'septies': 6, 'octies': 7, 'nonies': 8, 'decies': 9
+}
+
+
+# Entrada del índice de artículos: (articulo, titulo, capitulo o None)
+EntradaIndice = Tuple[Dict[str, Any], Dict[str, Any], Optional[Dict[str, Any]]]
+LeyIndex = Dict[str, EntradaIndice]
+
+
+class CambioInfo(NamedTuple):
+    """Cambio del dictamen sobre un artículo existente de la ley."""
+    tipo: str  # 'sustitucion' o 'derogacion'
+    cambio: Dict[str, Any]
+
+
+class TitulosRanges(NamedTuple):
+    """Rangos [min, max] de números base por título (ver _compute_titulo_ranges)."""
+    rangos: List[Dict[str, Any]]
+    # Mínimos en orden si los rangos son crecientes y disjuntos (búsqueda binaria); None si no
+    mins: Optional[List[int]]
+
+
+class Incorporacion(NamedTuple):
+    """Artículo que el dictamen agrega a la ley."""
+    numero: str
+    cambio: Dict[str, Any]
+
+
+def extract_article_number_from_header(encabezado: Optional[str]) -> Optional[str]:
     """
     Extrae el número de artículo desde el encabezado del dictamen.
     
@@ -26,20 +112,12 @@ def extract_article_number_from_header(encabezado: str) -> Optional[str]:
         return None
     
     # Para incorporaciones, buscar "como artículo X" o "artículo X" después de incorpórase
-    incorporacion_match = re.search(
-        r'incorp[óo]rase\s+como\s+art[íi]culo\s+(\d+(?:\s*[°º])?(?:\s*(?:bis|ter|quater|quinquies|sexies|septies|octies|nonies|decies))?)',
-        encabezado,
-        re.IGNORECASE
-    )
+    incorporacion_match = _RE_INCORPORA.search(encabezado)
     if incorporacion_match:
         return incorporacion_match.group(1).strip()
     
     # Fallback: buscar cualquier "artículo X" con sufijos
-    match = re.search(
-        r'art[íi]culo\s+(\d+(?:\s*[°º])?(?:\s*(?:bis|ter|quater|quinquies|sexies|septies|octies|nonies|decies))?)',
-        encabezado,
-        re.IGNORECASE
-    )
+    match = _RE_ARTICULO_HEADER.search(encabezado)
     if match:
         return match.group(1).strip()
     
@@ -69,31 +147,19 @@ def get_destino_articulo(cambio: Dict[str, Any]) -> Optional[str]:
     encabezado = cambio.get('encabezado', '')
     if encabezado:
         # Buscar explícitamente "Sustitúyese el artículo X" o "Incorpórase como artículo X"
-        match_sustituye = re.search(
-            r'(?:sustit[úu]yese|der[óo]gase|modif[íi]case)\s+(?:el|los)\s+art[íi]culo[s]?\s+(\d+(?:\s*[°º])?(?:\s*(?:bis|ter|quater|quinquies|sexies|septies|octies|nonies|decies))?)',
-            encabezado,
-            re.IGNORECASE
-        )
+        match_sustituye = _RE_SUSTITUYE.search(encabezado)
         if match_sustituye:
             numero_desde_encabezado = match_sustituye.group(1).strip()
         else:
             # Para incorporaciones
-            match_incorpora = re.search(
-                r'incorp[óo]rase\s+como\s+art[íi]culo\s+(\d+(?:\s*[°º])?(?:\s*(?:bis|ter|quater|quinquies|sexies|septies|octies|nonies|decies))?)',
-                encabezado,
-                re.IGNORECASE
-            )
+            match_incorpora = _RE_INCORPORA.search(encabezado)
             if match_incorpora:
                 numero_desde_encabezado = match_incorpora.group(1).strip()
     
     # Prioridad 3: extraer desde texto_nuevo (más confiable - es el texto real del artículo)
     if cambio.get('texto_nuevo'):
         # Acepta tanto guion (-) como punto (.) después del número
-        match = re.search(
-            r'ART[ÍI]CULO\s+(\d+(?:\s*[°º])?(?:\s*(?:bis|ter|quater|quinquies|sexies|septies|octies|nonies|decies))?)\s*[°º]?[\.-]',
-            cambio['texto_nuevo'],
-            re.IGNORECASE
-        )
+        match = _RE_ARTICULO_TEXTO.search(cambio['texto_nuevo'])
         if match:
             numero_desde_texto = match.group(1).strip()
     
@@ -101,34 +167,69 @@ def get_destino_articulo(cambio: Dict[str, Any]) -> Optional[str]:
     return numero_desde_encabezado or numero_desde_texto
 
 
+# typed=True: 1, 1.0 y True son claves iguales para la caché pero str() las distingue
+@lru_cache(maxsize=4096, typed=True)
 def normalize_article_number(numero: Any) -> str:
-    """Normaliza el número de artículo a string para comparación."""
+    """Normaliza el número de artículo a string para comparación (memoizada)."""
     if numero is None:
         return ''
     return str(numero).strip()
 
 
+def _index_ley(ley_data: Dict[str, Any]) -> LeyIndex:
+    """
+    Indexa los artículos de la ley por número normalizado en un solo recorrido.
+    
+    Cada entrada es (articulo, titulo, capitulo). Si un número se repite se conserva
+    la primera aparición, en el mismo orden en que busca find_article_in_ley.
+    """
+    indice: LeyIndex = {}
+    for titulo in ley_data.get('ley', {}).get('titulos', []):
+        for articulo in titulo.get('articulos') or []:
+            indice.setdefault(normalize_article_number(articulo.get('numero')), (articulo, titulo, None))
+        for capitulo in titulo.get('capitulos') or []:
+            for articulo in capitulo.get('articulos') or []:
+                indice.setdefault(normalize_article_number(articulo.get('numero')), (articulo, titulo, capitulo))
+    return indice
+
+
 def find_article_in_ley(
     ley_data: Dict[str, Any],
-    numero_articulo: str,
-    titulo_numero: Optional[str] = None,
-    capitulo_numero: Optional[str] = None
+    numero_articulo: Any,
+    titulo_numero: Any = None,
+    capitulo_numero: Any = None,
+    ley_index: Optional[LeyIndex] = None
 ) -> Optional[Dict[str, Any]]:
     """
     Busca un artículo en la estructura de la ley.
     
+    Si se pasa `ley_index` (ver _index_ley) y no hay filtros de título/capítulo,
+    la búsqueda es una consulta directa al índice.
+    
     Retorna el artículo encontrado junto con su contexto (título, capítulo).
     """
     numero_articulo = normalize_article_number(numero_articulo)
     
+    if ley_index is not None and not titulo_numero and not capitulo_numero:
+        encontrado = ley_index.get(numero_articulo)
+        if encontrado is None:
+            return None
+        articulo, titulo, capitulo = encontrado
+        return {
+            'articulo': articulo,
+            'titulo': titulo,
+            'capitulo': capitulo
+        }
+    
     for titulo in ley_data.get('ley', {}).get('titulos', []):
         # Si se especificó un título, filtrar por él
         if titulo_numero and normalize_article_number(titulo.get('numero')) != normalize_article_number(titulo_numero):
             continue
         
         # Buscar en artículos directos del título
-        if titulo.get('articulos'):
-            for articulo in titulo['articulos']:
+        articulos = titulo.get('articulos')
+        if articulos:
+            for articulo in articulos:
                 if normalize_article_number(articulo.get('numero')) == numero_articulo:
                     return {
                         'articulo': articulo,
@@ -137,14 +238,16 @@ def find_article_in_ley(
                     }
         
         # Buscar en capítulos
-        if titulo.get('capitulos'):
-            for capitulo in titulo['capitulos']:
+        capitulos = titulo.get('capitulos')
+        if capitulos:
+            for capitulo in capitulos:
                 # Si se especificó un capítulo, filtrar por él
                 if capitulo_numero and normalize_article_number(capitulo.get('numero')) != normalize_article_number(capitulo_numero):
                     continue
                 
-                if capitulo.get('articulos'):
-                    for articulo in capitulo['articulos']:
+                articulos_cap = capitulo.get('articulos')
+                if articulos_cap:
+                    for articulo in articulos_cap:
                         if normalize_article_number(articulo.get('numero')) == numero_articulo:
                             return {
                                 'articulo': articulo,
@@ -157,7 +260,7 @@ def find_article_in_ley(
 
 def find_articles_in_chapter(
     ley_data: Dict[str, Any],
-    capitulo_numero: str
+    capitulo_numero: Any
 ) -> List[Dict[str, Any]]:
     """
     Encuentra todos los artículos de un capítulo específico.
@@ -168,11 +271,13 @@ def find_articles_in_chapter(
     capitulo_numero = normalize_article_number(capitulo_numero)
     
     for titulo in ley_data.get('ley', {}).get('titulos', []):
-        if titulo.get('capitulos'):
-            for capitulo in titulo['capitulos']:
+        capitulos = titulo.get('capitulos')
+        if capitulos:
+            for capitulo in capitulos:
                 if normalize_article_number(capitulo.get('numero')) == capitulo_numero:
-                    if capitulo.get('articulos'):
-                        for articulo in capitulo['articulos']:
+                    articulos_cap = capitulo.get('articulos')
+                    if articulos_cap:
+                        for articulo in articulos_cap:
                             articles.append({
                                 'articulo': articulo,
                                 'titulo': titulo,
@@ -182,7 +287,7 @@ def find_articles_in_chapter(
     return articles
 
 
-def extract_title_from_text(texto: str) -> str:
+def extract_title_from_text(texto: Optional[str]) -> str:
     """
     Extrae el título del artículo desde el texto nuevo.
     
@@ -192,18 +297,14 @@ def extract_title_from_text(texto: str) -> str:
     if not texto:
         return ''
     
-    match = re.search(
-        r'ART[ÍI]CULO\s+\d+(?:\s*(?:bis|ter|quater|quinquies|sexies|septies|octies|nonies|decies))?\s*[°º]?-\s*(.+?)(?:\.\s+|\n|$)',
-        texto,
-        re.IGNORECASE
-    )
+    match = _RE_TITULO_ARTICULO.search(texto)
     if match and match.group(1):
         titulo = match.group(1).strip()
         # El título termina en el punto, así que agregarlo si no está
         if not titulo.endswith('.'):
             # Buscar si hay un punto en el título original
             titulo_completo = match.group(0)
-            punto_match = re.search(r'\.\s+', titulo_completo)
+            punto_match = _RE_PUNTO.search(titulo_completo)
             if punto_match:
                 # El título es hasta el punto
                 inicio_titulo = match.start(1)
@@ -217,7 +318,111 @@ def extract_title_from_text(texto: str) -> str:
     return ''
 
 
-def parse_article_text(texto: str) -> Dict[str, Any]:
+# Largo máximo de un título de artículo (después del "ARTÍCULO X-")
+_MAX_TITULO = 100
+
+
+def _find_header_end(texto: str, inicio: int) -> int:
+    """
+    Posición donde empieza el cuerpo de un artículo, dado el fin de su "ARTÍCULO X-".
+    
+    El título debe ser corto (< 100 caracteres) y suele terminar en punto:
+    1. Primer punto seguido de espacio/salto de línea: el cuerpo empieza después
+       de ese espacio.
+    2. Si no, primer salto de línea, siempre que la línea parezca un título (no
+       vacía y sin terminar en coma o dos puntos).
+    3. Si no hay un título claro y corto, solo se quita el prefijo (`inicio`).
+    
+    Recorre el texto con str.find en lugar de una cascada de regex.
+    """
+    limite = inicio + _MAX_TITULO
+    n = len(texto)
+    
+    # Buscar el primer punto seguido de espacio o newline
+    punto = texto.find('.', inicio, limite)
+    while punto != -1:
+        fin = punto + 1
+        if fin < n and texto[fin].isspace():
+            while fin < n and texto[fin].isspace():
+                fin += 1
+            return fin
+        punto = texto.find('.', fin, limite)
+    
+    # Buscar el primer newline
+    fin_newline = texto.find('\n', inicio, limite)
+    if fin_newline != -1:
+        # Verificar si parece un título (no termina en coma o dos puntos)
+        linea = texto[inicio:fin_newline].strip()
+        if linea and not linea.endswith(':') and not linea.endswith(','):
+            return fin_newline + 1
+    
+    return inicio
+
+
+def _fin_inciso_valido(texto: str, pos: int) -> bool:
+    """True si en `pos` puede terminar un inciso: fin, salto de línea, otra marca o ARTICULO."""
+    return pos == len(texto) or texto[pos] == '\n' or _RE_INCISO_SIGUE.match(texto, pos) is not None
+
+
+def _extraer_incisos(texto: str) -> Tuple[str, List[Dict[str, Any]]]:
+    """
+    Separa los incisos del texto de un artículo en una sola pasada.
+    
+    Reproduce el patrón original
+    ``([a-z])\\)\\s+([^a-z\\)]+?)(?=\\n|$|([a-z])\\)|ARTICULO)`` (IGNORECASE) sin
+    su retroceso cuadrático. Como el contenido de un inciso no puede tener letras,
+    solo se separan marcas seguidas de cifras o puntuación; el texto con letras
+    queda en el texto principal.
+    
+    Retorna (texto sin los incisos, lista de incisos).
+    """
+    incisos: List[Dict[str, Any]] = []
+    partes: List[str] = []
+    n = len(texto)
+    pos = 0
+    copiado = 0
+    while True:
+        marca = _RE_INCISO_MARCA.search(texto, pos)
+        if marca is None:
+            break
+        inicio = marca.start()
+        fin_espacios = marca.end()
+        fin = -1
+        contenido = ''
+        if fin_espacios < n and _RE_INCISO_PARADA.match(texto, fin_espacios) is None:
+            # El contenido va desde el fin de los espacios hasta la primera letra, ")" o salto
+            parada = _RE_INCISO_PARADA.search(texto, fin_espacios + 1)
+            fin_contenido = parada.start() if parada else n
+            if _fin_inciso_valido(texto, fin_contenido):
+                fin = fin_contenido
+                contenido = texto[fin_espacios:fin]
+        if fin == -1 and fin_espacios - inicio >= 4:
+            # Si no, el contenido es solo espacio en blanco: el último espacio antes de
+            # una continuación válida o el último salto de línea entre los espacios
+            if _fin_inciso_valido(texto, fin_espacios):
+                fin = fin_espacios
+            else:
+                fin = texto.rfind('\n', inicio + 4, fin_espacios)
+        if fin == -1:
+            pos = inicio + 1
+            continue
+        
+        partes.append(texto[copiado:inicio])
+        copiado = pos = fin
+        contenido = contenido.strip()
+        if contenido:
+            incisos.append({
+                'letra': marca.group(1).lower(),
+                'texto': contenido
+            })
+    
+    if not partes:
+        return texto, incisos
+    partes.append(texto[copiado:])
+    return ''.join(partes).strip(), incisos
+
+
+def parse_article_text(texto: Optional[str]) -> Dict[str, Any]:
     """
     Parsea el texto de un artículo para extraer título, texto principal e incisos.
     
@@ -238,68 +443,18 @@ def parse_article_text(texto: str) -> Dict[str, Any]:
     # Queremos remover "ARTÍCULO 2°- Ámbito de aplicación. " pero mantener "La vigencia..."
     
     # Buscar el patrón del encabezado completo
-    patron_encabezado = re.compile(
-        r'ART[ÍI]CULO\s+\d+(?:\s*(?:bis|ter|quater|quinquies|sexies|septies|octies|nonies|decies))?\s*[°º]?-\s*',
-        re.IGNORECASE
-    )
-    
     texto_limpio = texto
-    match_encabezado = patron_encabezado.search(texto_limpio)
+    match_encabezado = _RE_ENCABEZADO_ARTICULO.search(texto_limpio)
     if match_encabezado:
         # Encontrar dónde termina el título (después del guion, hasta el primer punto seguido de espacio)
-        inicio_texto = match_encabezado.end()
-        
-        # Estrategia mejorada: 
-        # 1. El título debe ser corto (< 100 caracteres)
-        # 2. El título suele terminar en punto.
-        
-        potential_end = -1
-        
-        # Buscar el primer punto seguido de espacio o newline
-        fin_titulo_match = re.search(r'\.\s+|\.\n', texto_limpio[inicio_texto:])
-        if fin_titulo_match and fin_titulo_match.start() < 100:
-            potential_end = inicio_texto + fin_titulo_match.end()
-        else:
-            # Buscar el primer newline
-            fin_newline_match = re.search(r'\n', texto_limpio[inicio_texto:])
-            if fin_newline_match and fin_newline_match.start() < 100:
-                # Verificar si parece un título (no termina en coma o dos puntos)
-                linea = texto_limpio[inicio_texto:inicio_texto + fin_newline_match.start()].strip()
-                if linea and not linea.endswith(':') and not linea.endswith(','):
-                    potential_end = inicio_texto + fin_newline_match.end()
-        
-        if potential_end != -1:
-            texto_limpio = texto_limpio[potential_end:]
-        else:
-            # No se encontró un título claro y corto, solo remover el prefijo "ARTÍCULO X-"
-            texto_limpio = texto_limpio[inicio_texto:]
+        texto_limpio = texto_limpio[_find_header_end(texto_limpio, match_encabezado.end()):]
     
     texto_limpio = texto_limpio.strip()
     
     # Extraer incisos
-    incisos = []
-    patron_inciso = re.compile(
-        r'([a-z])\)\s+([^a-z\)]+?)(?=\n|$|([a-z])\)|ARTICULO)',
-        re.IGNORECASE | re.MULTILINE | re.DOTALL
-    )
-    
-    matches = list(patron_inciso.finditer(texto_limpio))
-    if matches:
-        for match in matches:
-            letra = match.group(1).lower()
-            texto_inciso = match.group(2).strip()
-            if texto_inciso:
-                incisos.append({
-                    'letra': letra,
-                    'texto': texto_inciso
-                })
-        
-        # Remover incisos del texto principal
-        for match in reversed(matches):
-            texto_limpio = texto_limpio[:match.start()] + texto_limpio[match.end():]
-        texto_limpio = texto_limpio.strip()
+    texto_limpio, incisos = _extraer_incisos(texto_limpio)
     
-    result = {
+    result: Dict[str, Any] = {
         'titulo': titulo,
         'texto': texto_limpio
     }
@@ -310,13 +465,20 @@ def parse_article_text(texto: str) -> Dict[str, Any]:
     return result
 
 
-def process_dictamen_changes(dictamen_data: List[Dict[str, Any]], ley_data: Dict[str, Any]) -> Dict[str, Any]:
+def process_dictamen_changes(
+    dictamen_data: List[Dict[str, Any]],
+    ley_data: Dict[str, Any],
+    ley_index: Optional[LeyIndex] = None
+) -> Dict[str, Any]:
     """
     Procesa los cambios del dictamen y crea un mapa estructurado.
     
+    `ley_index` es el índice de artículos de la ley (ver _index_ley); si no se
+    pasa se construye aquí.
+    
     Retorna un diccionario con:
-    - cambios_por_articulo: {numero_articulo: cambio}
-    - incorporaciones: [cambios de incorporación]
+    - cambios_por_articulo: {numero_articulo: CambioInfo}
+    - incorporaciones: [Incorporacion]
     - derogaciones_articulos: Set de números de artículos derogados
     - derogaciones_capitulos: {numero_capitulo: Set de artículos}
     - derogacion_total: Bool (True si se deroga toda la ley)
@@ -326,15 +488,17 @@ def process_dictamen_changes(dictamen_data: List[Dict[str, Any]], ley_data: Dict
     derogaciones_articulos: Set[str] = set()
     derogaciones_capitulos: Dict[str, Set[str]] = {}
     derogacion_total = False
+    if ley_index is None:
+        ley_index = _index_ley(ley_data)
     
     for cambio in dictamen_data:
-        accion = cambio.get('accion', '').lower()
+        tipo_accion = _ACCION_TIPO.get(cambio.get('accion', '').casefold())
         destino_capitulo = cambio.get('destino_capitulo')
         
         # Procesar derogaciones de capítulos completos
         if destino_capitulo:
-            capitulo_numero = str(destino_capitulo)
-            derogaciones_capitulos[capitulo_numero] = set()
+            # setdefault: varias operaciones sobre el mismo capítulo no pisan el conjunto ya creado
+            derogaciones_capitulos.setdefault(str(destino_capitulo), set())
             # Los artículos específicos se marcarán cuando se procese la ley
             continue
         
@@ -346,7 +510,7 @@ def process_dictamen_changes(dictamen_data: List[Dict[str, Any]], ley_data: Dict
             targets = []
             if ',' in destino_articulo_raw or ' y ' in destino_articulo_raw.lower():
                 # Reemplazar " y " por coma y luego splitear
-                temp = re.sub(r'\s+y\s+', ', ', destino_articulo_raw, flags=re.IGNORECASE)
+                temp = _RE_SEPARADOR_Y.sub(', ', destino_articulo_raw)
                 targets = [t.strip() for t in temp.split(',') if t.strip()]
             else:
                 targets = [destino_articulo_raw.strip()]
@@ -355,41 +519,26 @@ def process_dictamen_changes(dictamen_data: List[Dict[str, Any]], ley_data: Dict
                 destino_articulo = normalize_article_number(destino_articulo)
                 
                 # Verificar si el artículo existe en la ley para decidir si es incorporación o sustitución
-                existe = find_article_in_ley(ley_data, destino_articulo) is not None
+                existe = destino_articulo in ley_index
                 
-                if accion in ('incorpórase', 'incorporase'):
+                if tipo_accion == 'incorporacion':
                     if existe:
                         # Si ya existe, tratar como sustitución
-                        cambios_por_articulo[destino_articulo] = {
-                            'tipo': 'sustitucion',
-                            'cambio': cambio
-                        }
+                        cambios_por_articulo[destino_articulo] = CambioInfo('sustitucion', cambio)
                     else:
-                        incorporaciones.append({
-                            'cambio': cambio,
-                            'numero': destino_articulo
-                        })
-                elif accion in ('derógase', 'derogase'):
+                        incorporaciones.append(Incorporacion(destino_articulo, cambio))
+                elif tipo_accion == 'derogacion':
                     derogaciones_articulos.add(destino_articulo)
-                    cambios_por_articulo[destino_articulo] = {
-                        'tipo': 'derogacion',
-                        'cambio': cambio
-                    }
-                elif accion in ('sustitúyese', 'sustituyese', 'modifícase', 'modificase'):
+                    cambios_por_articulo[destino_articulo] = CambioInfo('derogacion', cambio)
+                elif tipo_accion == 'sustitucion':
                     if existe:
-                        cambios_por_articulo[destino_articulo] = {
-                            'tipo': 'sustitucion',
-                            'cambio': cambio
-                        }
+                        cambios_por_articulo[destino_articulo] = CambioInfo('sustitucion', cambio)
                     else:
                         # Si no existe, tratar como incorporación
-                        incorporaciones.append({
-                            'cambio': cambio,
-                            'numero': destino_articulo
-                        })
+                        incorporaciones.append(Incorporacion(destino_articulo, cambio))
         else:
             # Si no hay destino_articulo ni destino_capitulo, y es derogación, es TOTAL
-            if accion in ('derógase', 'derogase'):
+            if tipo_accion == 'derogacion':
                 derogacion_total = True
     
     return {
@@ -413,67 +562,73 @@ def apply_changes_to_article(
     numero = normalize_article_number(articulo_original.get('numero'))
     cambio_info = cambios.get('cambios_por_articulo', {}).get(numero)
     
+    # Caso más común: sin cambios (una sola copia con el estado ya puesto)
+    if not cambio_info:
+        return {**articulo_original, 'estado': 'sin_cambios'}
+    
     # Crear copia del artículo original
     articulo_comparado = articulo_original.copy()
     
-    if cambio_info:
-        cambio = cambio_info['cambio']
-        tipo = cambio_info['tipo']
+    cambio = cambio_info.cambio
+    tipo = cambio_info.tipo
+    
+    if tipo == 'sustitucion':
+        # Parsear el texto nuevo
+        texto_nuevo = cambio.get('texto_nuevo', '')
+        parsed = parse_article_text(texto_nuevo)
         
-        if tipo == 'sustitucion':
-            # Parsear el texto nuevo
-            texto_nuevo = cambio.get('texto_nuevo', '')
-            parsed = parse_article_text(texto_nuevo)
-            
-            articulo_comparado['estado'] = 'sustituido'
-            articulo_comparado['texto_original'] = articulo_original.get('texto', '')
-            articulo_comparado['texto_nuevo'] = parsed.get('texto', '')
-            
-            # Actualizar título si está en el texto nuevo
-            if parsed.get('titulo'):
-                articulo_comparado['titulo_nuevo'] = parsed['titulo']
-            
-            # Actualizar incisos si existen
-            if parsed.get('incisos'):
-                articulo_comparado['incisos_nuevos'] = parsed['incisos']
-                articulo_comparado['incisos_originales'] = articulo_original.get('incisos', [])
-            
-            articulo_comparado['accion'] = cambio.get('accion', 'sustitúyese')
-            articulo_comparado['dictamen_articulo'] = cambio.get('dictamen_articulo')
+        articulo_comparado['estado'] = 'sustituido'
+        articulo_comparado['texto_original'] = articulo_original.get('texto', '')
+        articulo_comparado['texto_nuevo'] = parsed.get('texto', '')
+        
+        # Actualizar título si está en el texto nuevo
+        if parsed.get('titulo'):
+            articulo_comparado['titulo_nuevo'] = parsed['titulo']
         
-        elif tipo == 'derogacion':
-            articulo_comparado['estado'] = 'derogado'
-            articulo_comparado['accion'] = cambio.get('accion', 'derógase')
-            articulo_comparado['dictamen_articulo'] = cambio.get('dictamen_articulo')
-    else:
-        articulo_comparado['estado'] = 'sin_cambios'
+        # Actualizar incisos si existen
+        if parsed.get('incisos'):
+            articulo_comparado['incisos_nuevos'] = parsed['incisos']
+            articulo_comparado['incisos_originales'] = articulo_original.get('incisos', [])
+        
+        articulo_comparado['accion'] = cambio.get('accion', 'sustitúyese')
+        articulo_comparado['dictamen_articulo'] = cambio.get('dictamen_articulo')
+    
+    elif tipo == 'derogacion':
+        articulo_comparado['estado'] = 'derogado'
+        articulo_comparado['accion'] = cambio.get('accion', 'derógase')
+        articulo_comparado['dictamen_articulo'] = cambio.get('dictamen_articulo')
     
     return articulo_comparado
 
 
-def find_titulo_for_article(
-    ley_data: Dict[str, Any],
-    numero_articulo: str
-) -> Optional[Dict[str, Any]]:
+@lru_cache(maxsize=4096)
+def _parse_num(num_str: str) -> Optional[Tuple[int, str]]:
     """
-    Encuentra el título donde debería ir un artículo basándose en los números
-    de artículos existentes en cada título.
-    
-    Retorna el título encontrado o None si no se puede determinar.
+    (número base, sufijo latino en minúsculas o '') de un número de artículo
+    normalizado; None si no empieza con dígitos.
     """
-    numero_articulo = normalize_article_number(numero_articulo)
-    
-    # Extraer número base para comparación
-    def extract_base_number(num_str):
-        match = re.match(r'^(\d+)', num_str)
-        return int(match.group(1)) if match else 0
-    
-    try:
-        target_base = extract_base_number(numero_articulo)
-    except:
+    match = _RE_NUM_SUFIJO.match(num_str)
+    if match is None:
         return None
+    sufijo = match.group(2)
+    return (int(match.group(1)), sufijo.lower() if sufijo else '')
+
+
+def _extract_base_number(num_str: str) -> int:
+    """Número base (parte numérica inicial) de un número de artículo; 0 si no tiene."""
+    parsed = _parse_num(num_str)
+    return parsed[0] if parsed else 0
+
+
+def _compute_titulo_ranges(ley_data: Dict[str, Any]) -> TitulosRanges:
+    """
+    Calcula, para cada título con artículos, el rango [min, max] de números base
+    de sus artículos (directos y de capítulos).
     
-    # Recopilar todos los números de artículos por título
+    Se calcula una sola vez por ley y se reutiliza en find_titulo_for_article.
+    Si los rangos quedan en orden creciente y sin solaparse (lo normal) se
+    guardan también sus mínimos para buscar con bisect.
+    """
     titulos_ranges = []
     
     for titulo in ley_data.get('ley', {}).get('titulos', []):
@@ -482,30 +637,25 @@ def find_titulo_for_article(
         has_articles = False
         
         # Buscar en artículos directos del título
-        if titulo.get('articulos'):
-            for articulo in titulo['articulos']:
-                art_num = normalize_article_number(articulo.get('numero', ''))
-                try:
-                    art_base = extract_base_number(art_num)
-                    min_num = min(min_num, art_base)
-                    max_num = max(max_num, art_base)
-                    has_articles = True
-                except:
-                    continue
+        articulos = titulo.get('articulos')
+        if articulos:
+            for articulo in articulos:
+                art_base = _extract_base_number(normalize_article_number(articulo.get('numero', '')))
+                min_num = min(min_num, art_base)
+                max_num = max(max_num, art_base)
+                has_articles = True
         
         # Buscar en capítulos
-        if titulo.get('capitulos'):
-            for capitulo in titulo['capitulos']:
-                if capitulo.get('articulos'):
-                    for articulo in capitulo['articulos']:
-                        art_num = normalize_article_number(articulo.get('numero', ''))
-                        try:
-                            art_base = extract_base_number(art_num)
-                            min_num = min(min_num, art_base)
-                            max_num = max(max_num, art_base)
-                            has_articles = True
-                        except:
-                            continue
+        capitulos = titulo.get('capitulos')
+        if capitulos:
+            for capitulo in capitulos:
+                articulos_cap = capitulo.get('articulos')
+                if articulos_cap:
+                    for articulo in articulos_cap:
+                        art_base = _extract_base_number(normalize_article_number(articulo.get('numero', '')))
+                        min_num = min(min_num, art_base)
+                        max_num = max(max_num, art_base)
+                        has_articles = True
         
         if has_articles:
             titulos_ranges.append({
@@ -514,8 +664,51 @@ def find_titulo_for_article(
                 'max': max_num
             })
     
+    ordenados = all(a['max'] < b['min'] for a, b in zip(titulos_ranges, titulos_ranges[1:]))
+    mins = [tr['min'] for tr in titulos_ranges] if ordenados else None
+    return TitulosRanges(titulos_ranges, mins)
+
+
+@lru_cache(maxsize=4096)
+def _article_sort_key(num: str) -> Tuple[int, int]:
+    """Clave de orden (número base, orden del sufijo) de un número de artículo (memoizada)."""
+    parsed = _parse_num(num)
+    if parsed:
+        return (parsed[0], _SUFFIX_ORDER.get(parsed[1], 0))
+    return (999999, 0)  # Números no parseables al final
+
+
+def find_titulo_for_article(
+    ley_data: Dict[str, Any],
+    numero_articulo: Any,
+    titulos_ranges: Optional[TitulosRanges] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Encuentra el título donde debería ir un artículo basándose en los números
+    de artículos existentes en cada título.
+    
+    `titulos_ranges` son los rangos precalculados con _compute_titulo_ranges;
+    si no se pasan se calculan aquí.
+    
+    Retorna el título encontrado o None si no se puede determinar.
+    """
+    target_base = _extract_base_number(normalize_article_number(numero_articulo))
+    
+    if titulos_ranges is None:
+        titulos_ranges = _compute_titulo_ranges(ley_data)
+    rangos, mins = titulos_ranges
+    
+    # Rangos crecientes y disjuntos: el único candidato es el último rango que
+    # empieza antes del objetivo (lo contiene, o es el de máximo más cercano por
+    # debajo); si no hay ninguno, el último título con artículos
+    if mins is not None:
+        if not rangos:
+            return None
+        idx = bisect.bisect_right(mins, target_base) - 1
+        return rangos[idx]['titulo'] if idx >= 0 else rangos[-1]['titulo']
+    
     # Buscar el título cuyo rango contiene el número objetivo
-    for tr in titulos_ranges:
+    for tr in rangos:
         if tr['min'] <= target_base <= tr['max']:
             return tr['titulo']
     
@@ -524,7 +717,7 @@ def find_titulo_for_article(
     best_titulo = None
     best_max = -1
     
-    for tr in titulos_ranges:
+    for tr in rangos:
         if tr['max'] < target_base and tr['max'] > best_max:
             best_max = tr['max']
             best_titulo = tr['titulo']
@@ -533,29 +726,37 @@ def find_titulo_for_article(
         return best_titulo
     
     # Si no se encontró, usar el último título con artículos
-    if titulos_ranges:
-        return titulos_ranges[-1]['titulo']
+    if rangos:
+        return rangos[-1]['titulo']
     
     return None
 
 
 def process_incorporated_articles(
-    incorporaciones: List[Dict[str, Any]],
-    ley_data: Dict[str, Any]
+    incorporaciones: List[Incorporacion],
+    ley_data: Dict[str, Any],
+    ley_index: Optional[LeyIndex] = None
 ) -> List[Dict[str, Any]]:
     """
     Procesa las incorporaciones y determina dónde deben insertarse.
     
+    `ley_index` es el índice de artículos de la ley (ver _index_ley); si no se
+    pasa se construye aquí. Los rangos de números por título se calculan una
+    sola vez para todas las incorporaciones.
+    
     Retorna lista de artículos incorporados con su contexto (título donde deben ir).
     """
     articulos_incorporados = []
+    if ley_index is None:
+        ley_index = _index_ley(ley_data)
+    titulos_ranges = None
     
     for inc in incorporaciones:
-        cambio = inc['cambio']
-        numero = inc['numero']
+        cambio = inc.cambio
+        numero = inc.numero
         
         # Verificar si el artículo ya existe en la ley
-        existe = find_article_in_ley(ley_data, numero) is not None
+        existe = normalize_article_number(numero) in ley_index
         
         if not existe:
             # Parsear el texto nuevo
@@ -563,7 +764,9 @@ def process_incorporated_articles(
             parsed = parse_article_text(texto_nuevo)
             
             # Encontrar el título donde debería ir este artículo
-            titulo_destino = find_titulo_for_article(ley_data, numero)
+            if titulos_ranges is None:
+                titulos_ranges = _compute_titulo_ranges(ley_data)
+            titulo_destino = find_titulo_for_article(ley_data, numero, titulos_ranges)
             
             articulo_incorporado = {
                 'numero': numero,
@@ -583,6 +786,74 @@ def process_incorporated_articles(
     return articulos_incorporados
 
 
+def _sort_key_articulo(art: Dict[str, Any]) -> Tuple[int, int]:
+    """Clave para ordenar artículos por número (base y sufijo)."""
+    return _article_sort_key(normalize_article_number(art.get('numero', '')))
+
+
+def _insertar_incorporados(titulo: Dict[str, Any], incorporados: List[Dict[str, Any]]) -> None:
+    """
+    Inserta en un título ya comparado sus artículos incorporados y reordena.
+    
+    Se intenta primero un capítulo que tenga un artículo con el mismo número base
+    (p. ej. el "bis" de un artículo existente); si ninguno se insertó en un
+    capítulo, todos van a los artículos directos del título.
+    """
+    # Intentar insertar en capítulos primero
+    inserted_in_chapter = False
+    # Números de artículos incorporados ya insertados en este título
+    inserted_nums: Set[str] = set()
+    capitulos = titulo.get('capitulos')
+    if capitulos:
+        for capitulo in capitulos:
+            if capitulo.get('articulos'):
+                # Números base de los artículos existentes del capítulo
+                bases_capitulo = set()
+                for articulo in capitulo['articulos']:
+                    parsed = _parse_num(normalize_article_number(articulo.get('numero', '')))
+                    if parsed:
+                        bases_capitulo.add(parsed[0])
+                
+                # Verificar si algún artículo incorporado debería ir en este capítulo
+                for art_inc in incorporados:
+                    art_num = normalize_article_number(art_inc.get('numero', ''))
+                    parsed = _parse_num(art_num)
+                    # Si el artículo incorporado tiene el mismo número base que uno existente
+                    # (incluye los "bis" de un artículo existente)
+                    if parsed and parsed[0] in bases_capitulo:
+                        # Insertar en este capítulo
+                        art_inc_clean = {k: v for k, v in art_inc.items() 
+                                       if k != 'titulo_destino_numero'}
+                        capitulo['articulos'].append(art_inc_clean)
+                        inserted_nums.add(art_num)
+                        inserted_in_chapter = True
+                    if inserted_in_chapter:
+                        break
+    
+    # Si no se insertó en un capítulo, agregar a artículos directos del título
+    if not inserted_in_chapter:
+        if 'articulos' not in titulo:
+            titulo['articulos'] = []
+        
+        # Agregar artículos incorporados que no se insertaron en capítulos
+        for art_inc in incorporados:
+            art_num = normalize_article_number(art_inc.get('numero', ''))
+            if art_num not in inserted_nums:
+                art_inc_clean = {k: v for k, v in art_inc.items() 
+                               if k != 'titulo_destino_numero'}
+                titulo['articulos'].append(art_inc_clean)
+    
+    # Ordenar todos los artículos del título por número
+    if titulo.get('articulos'):
+        titulo['articulos'].sort(key=_sort_key_articulo)
+    
+    # También ordenar artículos dentro de capítulos
+    if titulo.get('capitulos'):
+        for capitulo in titulo['capitulos']:
+            if capitulo.get('articulos'):
+                capitulo['articulos'].sort(key=_sort_key_articulo)
+
+
 def comparar_ley_dictamen_objects(
     ley_data: Dict[str, Any],
     dictamen_data: List[Dict[str, Any]],
@@ -601,8 +872,12 @@ def comparar_ley_dictamen_objects(
     Returns:
         Diccionario con la comparación
     """
+    # Índice de artículos de la ley, compartido por todas las búsquedas
+    ley_index = _index_ley(ley_data)
+    
     # Procesar cambios del dictamen
-    cambios = process_dictamen_changes(dictamen_data, ley_data)
+    cambios = process_dictamen_changes(dictamen_data, ley_data, ley_index)
+    derogacion_total = cambios.get('derogacion_total', False)
     
     # Crear estructura de comparación basada en la ley
     comparacion = {
@@ -610,56 +885,71 @@ def comparar_ley_dictamen_objects(
         'metadatos': {
             'ley_origen': ley_source_name,
             'dictamen_origen': dictamen_source_name,
-            'total_sustituciones': len([c for c in cambios['cambios_por_articulo'].values() if c['tipo'] == 'sustitucion']),
+            'total_sustituciones': sum(1 for c in cambios['cambios_por_articulo'].values() if c.tipo == 'sustitucion'),
             'total_incorporaciones': len(cambios['incorporaciones']),
             'total_derogaciones': len(cambios['derogaciones_articulos']),
             'capitulos_derogados': list(cambios['derogaciones_capitulos'].keys()),
-            'derogacion_total': cambios.get('derogacion_total', False)
+            'derogacion_total': derogacion_total
         }
     }
 
     # Marcar ley como derogada si corresponde
-    if cambios.get('derogacion_total', False):
+    if derogacion_total:
         comparacion['ley']['estado'] = 'DEROGADA (POR DICTAMEN)'
     
+    # Procesar artículos incorporados y agruparlos por título destino, para
+    # insertarlos en el mismo recorrido que arma cada título
+    articulos_incorporados = process_incorporated_articles(
+        cambios['incorporaciones'],
+        ley_data,
+        ley_index
+    )
+    incorporados_por_titulo: Dict[Any, List[Dict[str, Any]]] = {}
+    for art_inc in articulos_incorporados:
+        titulo_num = art_inc.get('titulo_destino_numero')
+        if titulo_num:
+            if titulo_num not in incorporados_por_titulo:
+                incorporados_por_titulo[titulo_num] = []
+            incorporados_por_titulo[titulo_num].append(art_inc)
+    
     # Procesar títulos
     comparacion['ley']['titulos'] = []
     
     for titulo in ley_data.get('ley', {}).get('titulos', []):
         titulo_comparado = titulo.copy()
         
-        if cambios.get('derogacion_total', False):
+        if derogacion_total:
             titulo_comparado['estado'] = 'derogado'
             
         titulo_comparado['articulos'] = []
         titulo_comparado['capitulos'] = []
         
         # Procesar artículos directos del título
-        if titulo.get('articulos'):
-            for articulo in titulo['articulos']:
-                if cambios.get('derogacion_total', False):
-                    articulo_comparado = articulo.copy()
-                    articulo_comparado['estado'] = 'derogado'
-                    articulo_comparado['accion'] = 'derógase (ley completa)'
+        articulos = titulo.get('articulos')
+        if articulos:
+            for articulo in articulos:
+                if derogacion_total:
+                    articulo_comparado = {**articulo, 'estado': 'derogado', 'accion': 'derógase (ley completa)'}
                 else:
                     articulo_comparado = apply_changes_to_article(articulo, cambios)
                 titulo_comparado['articulos'].append(articulo_comparado)
         
         # Procesar capítulos
-        if titulo.get('capitulos'):
-            for capitulo in titulo['capitulos']:
+        capitulos = titulo.get('capitulos')
+        if capitulos:
+            for capitulo in capitulos:
                 capitulo_comparado = capitulo.copy()
                 capitulo_numero = normalize_article_number(capitulo.get('numero'))
+                articulos_cap = capitulo.get('articulos')
                 
-                if cambios.get('derogacion_total', False):
+                if derogacion_total:
                     capitulo_comparado['estado'] = 'derogado'
                     capitulo_comparado['articulos'] = []
-                    if capitulo.get('articulos'):
-                        for articulo in capitulo['articulos']:
-                            articulo_derogado = articulo.copy()
-                            articulo_derogado['estado'] = 'derogado'
-                            articulo_derogado['accion'] = 'derógase (ley completa)'
-                            capitulo_comparado['articulos'].append(articulo_derogado)
+                    if articulos_cap:
+                        capitulo_comparado['articulos'] = [
+                            {**articulo, 'estado': 'derogado', 'accion': 'derógase (ley completa)'}
+                            for articulo in articulos_cap
+                        ]
                 
                 # Verificar si el capítulo completo fue derogado
                 elif capitulo_numero in cambios['derogaciones_capitulos']:
@@ -667,125 +957,28 @@ def comparar_ley_dictamen_objects(
                     capitulo_comparado['articulos'] = []
                     
                     # Marcar todos los artículos como derogados
-                    if capitulo.get('articulos'):
-                        for articulo in capitulo['articulos']:
-                            articulo_derogado = articulo.copy()
-                            articulo_derogado['estado'] = 'derogado'
-                            articulo_derogado['accion'] = 'derógase (capítulo completo)'
-                            capitulo_comparado['articulos'].append(articulo_derogado)
+                    if articulos_cap:
+                        capitulo_comparado['articulos'] = [
+                            {**articulo, 'estado': 'derogado', 'accion': 'derógase (capítulo completo)'}
+                            for articulo in articulos_cap
+                        ]
                 else:
                     # Procesar artículos del capítulo
-                    capitulo_comparado['articulos'] = []
-                    if capitulo.get('articulos'):
-                        for articulo in capitulo['articulos']:
-                            articulo_comparado = apply_changes_to_article(articulo, cambios)
-                            capitulo_comparado['articulos'].append(articulo_comparado)
+                    if articulos_cap:
+                        capitulo_comparado['articulos'] = [
+                            apply_changes_to_article(articulo, cambios) for articulo in articulos_cap
+                        ]
+                    else:
+                        capitulo_comparado['articulos'] = []
                 
                 titulo_comparado['capitulos'].append(capitulo_comparado)
         
-        comparacion['ley']['titulos'].append(titulo_comparado)
-    
-    # Procesar artículos incorporados y agregarlos en sus títulos correspondientes
-    articulos_incorporados = process_incorporated_articles(
-        cambios['incorporaciones'],
-        ley_data
-    )
-    
-    if articulos_incorporados:
-        # Función para ordenar artículos por número
-        def sort_key(art):
-            num = normalize_article_number(art.get('numero', ''))
-            # Extraer número base y sufijo para ordenar correctamente
-            match = re.match(r'^(\d+)(?:\s*(bis|ter|quater|quinquies|sexies|septies|octies|nonies|decies))?', num, re.IGNORECASE)
-            if match:
-                base_num = int(match.group(1))
-                suffix = match.group(2).lower() if match.group(2) else ''
-                suffix_order = {
-                    '': 0, 'bis': 1, 'ter': 2, 'quater': 3, 'quinquies': 4,
-                    'sexies': 5, 'septies': 6, 'octies': 7, 'nonies': 8, 'decies': 9
-                }
-                return (base_num, suffix_order.get(suffix, 0))
-            try:
-                base_num = int(re.match(r'(\d+)', num).group(1))
-                return (base_num, 0)
-            except:
-                return (999999, 0)  # Números no parseables al final
-        
-        # Agrupar artículos incorporados por título destino
-        incorporados_por_titulo = {}
-        for art_inc in articulos_incorporados:
-            titulo_num = art_inc.get('titulo_destino_numero')
-            if titulo_num:
-                if titulo_num not in incorporados_por_titulo:
-                    incorporados_por_titulo[titulo_num] = []
-                incorporados_por_titulo[titulo_num].append(art_inc)
+        # Insertar los artículos incorporados que van en este título
+        incorporados = incorporados_por_titulo.get(str(titulo_comparado.get('numero')))
+        if incorporados:
+            _insertar_incorporados(titulo_comparado, incorporados)
         
-        # Insertar artículos incorporados en sus títulos correspondientes
-        for titulo in comparacion['ley']['titulos']:
-            titulo_num = str(titulo.get('numero'))
-            if titulo_num in incorporados_por_titulo:
-                # Intentar insertar en capítulos primero
-                inserted_in_chapter = False
-                if titulo.get('capitulos'):
-                    for capitulo in titulo['capitulos']:
-                        if capitulo.get('articulos'):
-                            # Verificar si algún artículo incorporado debería ir en este capítulo
-                            for art_inc in incorporados_por_titulo[titulo_num]:
-                                art_num = normalize_article_number(art_inc.get('numero', ''))
-                                # Buscar el artículo base (sin sufijo) en este capítulo
-                                for articulo in capitulo['articulos']:
-                                    art_existing = normalize_article_number(articulo.get('numero', ''))
-                                    # Si encontramos un artículo con número base igual o cercano
-                                    try:
-                                        base_inc = int(re.match(r'^(\d+)', art_num).group(1))
-                                        base_existing = int(re.match(r'^(\d+)', art_existing).group(1))
-                                        # Si el artículo incorporado tiene el mismo número base o es "bis" de un artículo existente
-                                        if base_inc == base_existing or (art_num.endswith('bis') and base_inc == base_existing):
-                                            # Insertar en este capítulo
-                                            art_inc_clean = {k: v for k, v in art_inc.items() 
-                                                           if k != 'titulo_destino_numero'}
-                                            capitulo['articulos'].append(art_inc_clean)
-                                            inserted_in_chapter = True
-                                            break
-                                    except:
-                                        continue
-                                if inserted_in_chapter:
-                                    break
-                
-                # Si no se insertó en un capítulo, agregar a artículos directos del título
-                if not inserted_in_chapter:
-                    if 'articulos' not in titulo:
-                        titulo['articulos'] = []
-                    
-                    # Agregar artículos incorporados que no se insertaron en capítulos
-                    for art_inc in incorporados_por_titulo[titulo_num]:
-                        # Verificar si ya fue insertado en un capítulo
-                        art_num = normalize_article_number(art_inc.get('numero', ''))
-                        already_inserted = False
-                        if titulo.get('capitulos'):
-                            for capitulo in titulo['capitulos']:
-                                if capitulo.get('articulos'):
-                                    for art in capitulo['articulos']:
-                                        if normalize_article_number(art.get('numero', '')) == art_num:
-                                            already_inserted = True
-                                            break
-                                    if already_inserted:
-                                        break
-                        
-                        if not already_inserted:
-                            art_inc_clean = {k: v for k, v in art_inc.items() 
-                                           if k != 'titulo_destino_numero'}
-                            titulo['articulos'].append(art_inc_clean)
-                
-                # Ordenar todos los artículos del título por número
-                if titulo.get('articulos'):
-                    titulo['articulos'].sort(key=sort_key)
-                
-                # También ordenar artículos dentro de capítulos
-                if titulo.get('capitulos'):
-                    for capitulo in titulo['capitulos']:
-                        if capitulo.get('articulos'):
-                            capitulo['articulos'].sort(key=sort_key)
+        comparacion['ley']['titulos'].append(titulo_comparado)
     
     return comparacion
 
@@ -793,17 +986,17 @@ def comparar_ley_dictamen_objects(
 def comparar_ley_dictamen(
     ley_path: str,
     dictamen_path: str,
-    output_path: str
+    output_path: str,
+    compacto: bool = False
 ) -> None:
     """
     Función principal que compara una ley con un dictamen y genera un JSON de comparación.
+
+    Con `compacto=True` el JSON se escribe sin indentación.
     """
     # Cargar datos
-    with open(ley_path, 'r', encoding='utf-8') as f:
-        ley_data = json.load(f)
-    
-    with open(dictamen_path, 'r', encoding='utf-8') as f:
-        dictamen_data = json.load(f)
+    ley_data = load_json(ley_path)
+    dictamen_data = load_json(dictamen_path)
         
     comparacion = comparar_ley_dictamen_objects(
         ley_data, 
@@ -813,32 +1006,34 @@ def comparar_ley_dictamen(
     )
     
     # Extract stats from result for printing
-    cambios = process_dictamen_changes(dictamen_data, ley_data)
-    articulos_incorporados = process_incorporated_articles(cambios['incorporaciones'], ley_data)
+    ley_index = _index_ley(ley_data)
+    cambios = process_dictamen_changes(dictamen_data, ley_data, ley_index)
+    articulos_incorporados = process_incorporated_articles(cambios['incorporaciones'], ley_data, ley_index)
 
     # Guardar resultado
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(comparacion, f, ensure_ascii=False, indent=2)
+    write_json(output_path, comparacion, pretty=not compacto)
     
     print(f"Comparación generada exitosamente: {output_path}")
-    print(f"  - Sustituciones: {len([c for c in cambios['cambios_por_articulo'].values() if c['tipo'] == 'sustitucion'])}")
+    print(f"  - Sustituciones: {sum(1 for c in cambios['cambios_por_articulo'].values() if c.tipo == 'sustitucion')}")
     print(f"  - Incorporaciones: {len(articulos_incorporados)}")
     print(f"  - Derogaciones: {len(cambios['derogaciones_articulos'])}")
 
 
 def main():
     """Función principal del script."""
-    if len(sys.argv) < 4:
-        print("Uso: python comparar_ley_dictamen.py <ley.json> <dictamen.json> <output.json>")
+    compacto = '--compacto' in sys.argv
+    args = [a for a in sys.argv[1:] if a != '--compacto']
+    if len(args) < 3:
+        print("Uso: python comparar_ley_dictamen.py <ley.json> <dictamen.json> <output.json> [--compacto]")
         print("\nEjemplo:")
         print("  python comparar_ley_dictamen.py data/ley_contrato_trabajo_oficial_completa.json \\")
         print("                                    data/dictamen_modernizacion_laboral_titulo_I.json \\")
         print("                                    data/comparacion_titulo_I.json")
         sys.exit(1)
     
-    ley_path = sys.argv[1]
-    dictamen_path = sys.argv[2]
-    output_path = sys.argv[3]
+    ley_path = args[0]
+    dictamen_path = args[1]
+    output_path = args[2]
     
     # Validar que los archivos existan
     if not Path(ley_path).exists():
@@ -850,7 +1045,7 @@ def main():
         sys.exit(1)
     
     try:
-        comparar_ley_dictamen(ley_path, dictamen_path, output_path)
+        comparar_ley_dictamen(ley_path, dictamen_path, output_path, compacto=compacto)
     except Exception as e:
         print(f"Error al procesar la comparación: {e}", file=sys.stderr)
         import traceback
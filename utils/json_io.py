@@ -0,0 +1,47 @@
+"""
+Lectura y escritura de JSON compartida por los parsers y las utilidades.
+
+Usa orjson si está instalado (extra `fast`, serialización en C, mucho más rápida
+para el texto en castellano de leyes y dictámenes) y json de la biblioteca
+estándar si no.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # orjson es opcional
+    orjson = None  # type: ignore[assignment]
+
+
+def loads_json(data: Union[str, bytes]) -> Any:
+    """Decodifica un documento JSON desde str o bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_json(path: str) -> Any:
+    """Carga un archivo JSON completo."""
+    with open(path, 'rb') as f:
+        return loads_json(f.read())
+
+
+def write_json(path: str, payload: Any, pretty: bool = False) -> None:
+    """
+    Escribe payload como JSON UTF-8 (sin escapar caracteres no ASCII), serializado
+    en memoria y volcado con una sola escritura.
+
+    Con pretty=True se indenta con 2 espacios; si no, se omite todo el espacio en
+    blanco entre elementos. Las claves que no son string se convierten a string.
+    """
+    if orjson is not None:
+        opciones = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        contenido = orjson.dumps(payload, option=opciones)
+    elif pretty:
+        contenido = json.dumps(payload, ensure_ascii=False, indent=2).encode('utf-8')
+    else:
+        contenido = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(contenido)